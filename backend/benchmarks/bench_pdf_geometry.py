@@ -0,0 +1,113 @@
+"""Бенчмарк статистики форматирования PDF: циклы по словарям символов против NumPy.
+
+Запуск из каталога backend:
+    PYTHONPATH=src python benchmarks/bench_pdf_geometry.py path/to/thesis.pdf [repeats]
+
+Символы всех страниц извлекаются pdfplumber один раз заранее, замеряется только
+расчёт статистики (шрифт, кегль, поля, межстрочный интервал, абзацный отступ):
+  loop   — прежняя реализация: списки координат, sorted(set(...)) и Counter по символам;
+  numpy  — PageLayout + extract_page_features с массивами координат символов.
+"""
+import re
+import sys
+import time
+from collections import Counter
+
+import pdfplumber
+
+from project.gost_checker.features import FeatureSet
+from project.gost_checker.layout import PageLayout
+from project.gost_checker.pdf_parser import PdfAggregates, extract_page_features
+from project.gost_checker.parser import new_document_data
+
+FORMATTING = FeatureSet(structure=False, introduction=False, text=False)
+
+
+def loop_stats(pages):
+    """Статистика форматирования в исходном виде — по спискам значений из словарей символов"""
+    fonts, sizes, line_y_diffs, indent_x = [], [], [], []
+    all_x0, all_x1, all_y0, all_y1 = [], [], [], []
+    for chars, _, _ in pages:
+        char_sizes = [char.get('size', 0) for char in chars]
+        avg_size = sum(char_sizes) / len(char_sizes) if char_sizes else 12
+        for char in chars:
+            if 'fontname' in char:
+                font_name = re.sub(r'^[A-Z]{6}\+', '', char['fontname'])
+                font_name = re.sub(r'-(Regular|Bold|Italic|BoldItalic)$', '', font_name)
+                fonts.append(font_name)
+            if 'size' in char:
+                sizes.append(char['size'])
+            if 'x0' in char and char['text'].strip():
+                all_x0.append(char['x0'])
+            if 'x1' in char and char['text'].strip():
+                all_x1.append(char['x1'])
+            if 'y0' in char:
+                all_y0.append(char['y0'])
+            if 'y1' in char:
+                all_y1.append(char['y1'])
+
+        y_positions = sorted(set(char['y0'] for char in chars if 'y0' in char), reverse=True)
+        for i in range(len(y_positions) - 1):
+            diff = y_positions[i] - y_positions[i + 1]
+            if avg_size * 0.5 < diff < avg_size * 3:
+                line_y_diffs.append(diff)
+
+        first_chars_x = []
+        prev_y = None
+        for char in sorted(chars, key=lambda c: (-c.get('y1', 0), c.get('x0', 0))):
+            if 'y1' in char and (prev_y is None or abs(char['y1'] - prev_y) > avg_size * 0.5):
+                if char.get('size', 0) <= avg_size + 1:
+                    first_chars_x.append(char['x0'])
+                prev_y = char['y1']
+        if first_chars_x:
+            indent_x.append(sum(first_chars_x) / len(first_chars_x) / 28.346)
+
+    return (Counter(fonts).most_common(1), Counter(sizes).most_common(1),
+            sum(line_y_diffs) / len(line_y_diffs) if line_y_diffs else None,
+            sum(indent_x) / len(indent_x) if indent_x else None,
+            (min(all_x0), max(all_x1), min(all_y0), max(all_y1)) if all_x0 else None)
+
+
+def numpy_stats(pages):
+    aggregates = PdfAggregates()
+    for page_num, (chars, width, height) in enumerate(pages, 1):
+        layout = PageLayout.from_chars(chars, width, height, collect_text=False)
+        aggregates.add(extract_page_features(layout, page_num, FORMATTING))
+    data = new_document_data()
+    aggregates.fill(data, FORMATTING)
+    return data
+
+
+def measure(func, pages, repeats):
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func(pages)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    file_path = sys.argv[1]
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    started = time.perf_counter()
+    with pdfplumber.open(file_path) as pdf:
+        pages = [(page.chars, page.width, page.height) for page in pdf.pages]
+    char_count = sum(len(chars) for chars, _, _ in pages)
+    print(f"pages={len(pages)} chars={char_count} extraction={time.perf_counter() - started:.2f}s")
+
+    loop_time, _ = measure(loop_stats, pages, repeats)
+    numpy_time, data = measure(numpy_stats, pages, repeats)
+    print(f"loop   time={loop_time:7.3f}s")
+    print(f"numpy  time={numpy_time:7.3f}s speedup={loop_time / numpy_time:5.2f}x")
+    print(f"font_settings={data['font_settings']} page_margins={data['page_margins']} "
+          f"paragraph_indent={data['paragraph_indent']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Бенчмарк разбора PDF диапазонами страниц в нескольких процессах.
+
+Запуск из каталога backend:
+    PYTHONPATH=src python benchmarks/bench_pdf_shards.py path/to/thesis.pdf [1 2 4 8]
+
+Для каждого числа воркеров печатает время разбора и ускорение относительно
+последовательного разбора, а также проверяет, что результат совпадает с ним.
+"""
+import sys
+import time
+
+from project.gost_checker.parser import parse_document
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    file_path = sys.argv[1]
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or [1, 2, 4, 8]
+
+    baseline_data = None
+    baseline_time = None
+    for workers in worker_counts:
+        started = time.perf_counter()
+        data = parse_document(file_path, workers=workers)
+        elapsed = time.perf_counter() - started
+
+        if baseline_data is None:
+            baseline_data, baseline_time = data, elapsed
+        identical = data == baseline_data
+        print(f"workers={workers:<2} pages={data['page_count']:<4} time={elapsed:7.2f}s "
+              f"speedup={baseline_time / elapsed:5.2f}x identical={identical}")
+        if not identical:
+            sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
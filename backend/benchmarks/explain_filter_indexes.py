@@ -0,0 +1,139 @@
+"""Планы горячих запросов без индексов миграций a8e6b7c9d0f1 и b9f7c8d0e1a2 и с ними.
+
+Запуск из каталога backend (нужен Postgres из .env; рабочая схема не затрагивается):
+    PYTHONPATH=src python benchmarks/explain_filter_indexes.py [documents]
+
+Во временной схеме explain_seed создаются таблицы моделей и заполняются синтетическими
+данными: documents документов (по умолчанию 200 000) у 2 000 пользователей, по проверке
+и отчёту на документ, по 5 ошибок на документ. Для каждого запроса печатается
+EXPLAIN (ANALYZE, BUFFERS) до создания индексов и после. Схема удаляется в конце.
+"""
+import asyncio
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from project.core.config import settings
+from project.infrastructure.postgres.database import metadata
+from project.infrastructure.postgres.models import Check, Documents, Mistake, Reports, Status
+from project.infrastructure.postgres.repository.document_repository import DOCUMENTS_KEYSET
+
+SEED_SCHEMA = "explain_seed"
+USERS = 2000
+
+# Индексы миграций a8e6b7c9d0f1 и b9f7c8d0e1a2 (определения берутся из моделей)
+NEW_INDEXES = [
+    "ix_documents_upload_datetime_document_id",
+    "ix_documents_user_id_upload_datetime_document_id",
+    "ix_documents_status_id_upload_datetime_document_id",
+    "ix_my_app_schema_check_document_id",
+    "ix_my_app_schema_check_standart_id",
+    "ix_mistakes_document_id_mistake_id",
+    "ix_mistakes_mistake_type_id_mistake_id",
+    "ix_my_app_schema_reports_check_id",
+    "ix_my_app_schema_statuses_status_name",
+]
+
+SEED = [
+    """INSERT INTO {schema}.users (first_name, surname_name, patronomic_name, email, username, password,
+                                   role, is_admin, is_tg_subscribed, theme, is_push_enabled)
+       SELECT 'Имя', 'Фамилия', 'Отчество', 'user' || g || '@example.com', 'user' || g, 'x',
+              'student', false, false, 'light', false
+       FROM generate_series(1, {users}) AS g""",
+    """INSERT INTO {schema}.statuses (status_name)
+       VALUES ('Загружен'), ('Анализируется'), ('Проверен'), ('Идеален'), ('Отправлен на доработку')""",
+    """INSERT INTO {schema}.standart (name, version, created_at, is_custom)
+       VALUES ('ГОСТ для курсовых работ', '1.0', now(), false)""",
+    """INSERT INTO {schema}.mistake_types (mistake_type_name) VALUES ('Ошибка ГОСТ'), ('Предупреждение ГОСТ')""",
+    """INSERT INTO {schema}.documents (user_id, filename, filepath, upload_datetime, doc_type, is_example, size,
+                                       status_id, report_pdf_path, score, analysis_time)
+       SELECT g % {users} + 1, 'doc' || g || '.pdf', 'uploads/doc' || g || '.pdf',
+              now() - g * interval '1 minute', 'document', false, 1000, g % 5 + 1, '', 0, 0
+       FROM generate_series(1, {documents}) AS g""",
+    """INSERT INTO {schema}."check" (document_id, standart_id, checked_at, result, score)
+       SELECT g, 1, now(), '{{}}', 0 FROM generate_series(1, {documents}) AS g""",
+    """INSERT INTO {schema}.reports (check_id, report_json, created_at)
+       SELECT g, '{{}}', now() FROM generate_series(1, {documents}) AS g""",
+    """INSERT INTO {schema}.mistakes (mistake_type_id, description, critical_status, document_id)
+       SELECT g % 2 + 1, 'Замечание', 'low', g % {documents} + 1 FROM generate_series(1, {documents} * 5) AS g""",
+]
+
+# Страница после курсора: с индексом читается limit + 1 строк независимо от размера таблицы
+_SECOND_PAGE = DOCUMENTS_KEYSET.after(
+    DOCUMENTS_KEYSET.encode(SimpleNamespace(upload_datetime=datetime(2026, 1, 1), document_id=10**9))
+)
+
+QUERIES = {
+    "страница всех документов (DocumentRepository.get_all_documents)":
+        select(Documents).where(_SECOND_PAGE).order_by(*DOCUMENTS_KEYSET.order_by).limit(51),
+    "страница документов пользователя (DocumentRepository.get_documents_by_user)":
+        select(Documents).where(Documents.user_id == 42, _SECOND_PAGE).order_by(*DOCUMENTS_KEYSET.order_by).limit(51),
+    "страница документов по статусу (get_documents_by_status)":
+        select(Documents).where(Documents.status_id == 4, _SECOND_PAGE).order_by(*DOCUMENTS_KEYSET.order_by).limit(51),
+    "страница ошибок типа (MistakeRepository.get_mistakes_by_mistake_type_id)":
+        select(Mistake).where(Mistake.mistake_type_id == 1, Mistake.mistake_id > 1000)
+        .order_by(Mistake.mistake_id).limit(51),
+    "проверки пользователя (CheckRepository.get_checks_by_user_id)":
+        select(Check).join(Check.document).where(Documents.user_id == 42),
+    "отчёты пользователя (ReportRepository.get_reports_by_user)":
+        select(Reports).join(Check, Check.check_id == Reports.check_id)
+        .join(Documents, Documents.document_id == Check.document_id).where(Documents.user_id == 42),
+    "ошибки документа":
+        select(Mistake).where(Mistake.document_id == 4242),
+    "статус по имени (GostCheckService._update_document_status)":
+        select(Status).where(Status.status_name == "Идеален"),
+}
+
+
+def _sql(query) -> str:
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    return str(compiled).replace(f"{settings.POSTGRES_SCHEMA}.", f"{SEED_SCHEMA}.")
+
+
+async def _analyze(conn) -> None:
+    tables = ", ".join(f'{SEED_SCHEMA}."{table.name}"' for table in metadata.sorted_tables)
+    await conn.execute(text(f"ANALYZE {tables}"))
+
+
+async def _explain(conn, title: str) -> None:
+    print(f"\n===== {title} =====")
+    for name, query in QUERIES.items():
+        result = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {_sql(query)}"))
+        print(f"\n--- {name}")
+        print("\n".join(row[0] for row in result))
+
+
+async def main() -> None:
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    engine = create_async_engine(settings.postgres_url)
+    indexes = {index.name: index for table in metadata.sorted_tables for index in table.indexes}
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SEED_SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SEED_SCHEMA}"))
+            # DDL моделей — в схему explain_seed вместо рабочей
+            await conn.execution_options(schema_translate_map={settings.POSTGRES_SCHEMA: SEED_SCHEMA})
+            await conn.run_sync(metadata.create_all)
+            for name in NEW_INDEXES:
+                await conn.execute(text(f"DROP INDEX {SEED_SCHEMA}.{name}"))
+            for statement in SEED:
+                await conn.execute(text(statement.format(schema=SEED_SCHEMA, users=USERS, documents=documents)))
+            await _analyze(conn)
+            await _explain(conn, f"без индексов, документов: {documents}")
+
+            for name in NEW_INDEXES:
+                await conn.run_sync(indexes[name].create)
+            await _analyze(conn)
+            await _explain(conn, "с индексами миграций a8e6b7c9d0f1 и b9f7c8d0e1a2")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SEED_SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""Add foreign-key and filter indexes
+
+Revision ID: a8e6b7c9d0f1
+Revises: f7d5a6b8c9e0
+Create Date: 2026-10-17 17:00:00.000000
+
+Индексы строятся CREATE INDEX CONCURRENTLY вне транзакции миграции, чтобы не блокировать
+запись в таблицы. Если построение прервалось, Postgres оставляет индекс в состоянии INVALID:
+его нужно удалить (DROP INDEX CONCURRENTLY ...) и повторить upgrade.
+Планы запросов до и после: benchmarks/explain_filter_indexes.py.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision = 'a8e6b7c9d0f1'
+down_revision = 'f7d5a6b8c9e0'
+branch_labels = None
+depends_on = None
+
+# (имя, таблица, столбцы)
+INDEXES = [
+    ('ix_documents_user_id_upload_datetime', 'documents', ['user_id', sa.text('upload_datetime DESC')]),
+    ('ix_my_app_schema_documents_status_id', 'documents', ['status_id']),
+    ('ix_my_app_schema_check_document_id', 'check', ['document_id']),
+    ('ix_my_app_schema_check_standart_id', 'check', ['standart_id']),
+    ('ix_my_app_schema_mistakes_document_id', 'mistakes', ['document_id']),
+    ('ix_my_app_schema_mistakes_mistake_type_id', 'mistakes', ['mistake_type_id']),
+    ('ix_my_app_schema_reports_check_id', 'reports', ['check_id']),
+    ('ix_my_app_schema_statuses_status_name', 'statuses', ['status_name']),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, schema='my_app_schema',
+                            postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, schema='my_app_schema', postgresql_concurrently=True)
@@ -0,0 +1,47 @@
+"""Add check_jobs queue
+
+Revision ID: b3f1c2d4e5a6
+Revises: 7eae78c62426
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f1c2d4e5a6'
+down_revision = '7eae78c62426'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('check_jobs',
+    sa.Column('job_id', sa.Integer(), nullable=False, comment='Идентификатор'),
+    sa.Column('check_id', sa.Integer(), nullable=False),
+    sa.Column('document_id', sa.Integer(), nullable=False),
+    sa.Column('state', sa.String(length=20), nullable=False, comment='queued, running, done, failed'),
+    sa.Column('attempts', sa.Integer(), nullable=False, comment='Сколько раз задание брали в работу'),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('worker_id', sa.String(length=100), nullable=True, comment='Воркер, взявший задание'),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False, comment='Не брать в работу раньше (отложенный повтор)'),
+    sa.Column('locked_at', sa.DateTime(), nullable=True, comment='Когда взято в работу'),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['check_id'], ['my_app_schema.check.check_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['document_id'], ['my_app_schema.documents.document_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id'),
+    sa.UniqueConstraint('check_id'),
+    schema='my_app_schema',
+    comment='Очередь проверок ГОСТ'
+    )
+    op.create_index('ix_check_jobs_state_run_after', 'check_jobs', ['state', 'run_after'], unique=False, schema='my_app_schema')
+
+
+def downgrade():
+    op.drop_index('ix_check_jobs_state_run_after', table_name='check_jobs', schema='my_app_schema')
+    op.drop_table('check_jobs', schema='my_app_schema')
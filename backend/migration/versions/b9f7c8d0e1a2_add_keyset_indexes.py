@@ -0,0 +1,65 @@
+"""Add keyset pagination indexes
+
+Revision ID: b9f7c8d0e1a2
+Revises: a8e6b7c9d0f1
+Create Date: 2026-10-17 19:00:00.000000
+
+Составные индексы под ключи страниц списков (project/infrastructure/postgres/pagination.py):
+документы — (upload_datetime DESC, document_id DESC) с префиксом user_id или status_id,
+ошибки — (document_id | mistake_type_id, mistake_id). Индексы миграции a8e6b7c9d0f1 по тем же
+префиксам становятся лишними и удаляются после построения новых.
+Как и там, всё строится CONCURRENTLY вне транзакции миграции.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision = 'b9f7c8d0e1a2'
+down_revision = 'a8e6b7c9d0f1'
+branch_labels = None
+depends_on = None
+
+# (имя, таблица, столбцы)
+NEW_INDEXES = [
+    ('ix_documents_upload_datetime_document_id', 'documents',
+     [sa.text('upload_datetime DESC'), sa.text('document_id DESC')]),
+    ('ix_documents_user_id_upload_datetime_document_id', 'documents',
+     ['user_id', sa.text('upload_datetime DESC'), sa.text('document_id DESC')]),
+    ('ix_documents_status_id_upload_datetime_document_id', 'documents',
+     ['status_id', sa.text('upload_datetime DESC'), sa.text('document_id DESC')]),
+    ('ix_mistakes_document_id_mistake_id', 'mistakes', ['document_id', 'mistake_id']),
+    ('ix_mistakes_mistake_type_id_mistake_id', 'mistakes', ['mistake_type_id', 'mistake_id']),
+]
+
+# Заменённые индексы a8e6b7c9d0f1
+OLD_INDEXES = [
+    ('ix_documents_user_id_upload_datetime', 'documents', ['user_id', sa.text('upload_datetime DESC')]),
+    ('ix_my_app_schema_documents_status_id', 'documents', ['status_id']),
+    ('ix_my_app_schema_mistakes_document_id', 'mistakes', ['document_id']),
+    ('ix_my_app_schema_mistakes_mistake_type_id', 'mistakes', ['mistake_type_id']),
+]
+
+
+def _create(indexes):
+    for name, table, columns in indexes:
+        op.create_index(name, table, columns, unique=False, schema='my_app_schema',
+                        postgresql_concurrently=True)
+
+
+def _drop(indexes):
+    for name, table, _ in indexes:
+        op.drop_index(name, table_name=table, schema='my_app_schema', postgresql_concurrently=True)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        _create(NEW_INDEXES)
+        _drop(OLD_INDEXES)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        _create(OLD_INDEXES)
+        _drop(reversed(NEW_INDEXES))
@@ -0,0 +1,71 @@
+"""Store check.result as JSONB with GIN index
+
+Revision ID: c0a8d9e1f2b3
+Revises: b9f7c8d0e1a2
+Create Date: 2026-10-17 20:00:00.000000
+
+Смена типа переписывает таблицу check под ACCESS EXCLUSIVE: на время upgrade API и воркер
+проверок лучше остановить. Пустые строки становятся NULL, JSON-объекты переносятся как есть.
+Прочие старые значения (текст из /add_check и /update_check вроде "success", JSON-скаляры и
+массивы) сохраняются как {"legacy_result": "<исходная строка>"}; downgrade возвращает их
+обратно. GIN-индекс (jsonb_path_ops) строится CONCURRENTLY после смены типа.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'c0a8d9e1f2b3'
+down_revision = 'b9f7c8d0e1a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Приведение с перехватом ошибки разбора: одна текстовая строка не должна срывать миграцию
+    op.execute("""
+        CREATE FUNCTION my_app_schema._check_result_to_jsonb(value text) RETURNS jsonb AS $$
+        DECLARE
+            parsed jsonb;
+        BEGIN
+            IF value IS NULL OR btrim(value) = '' THEN
+                RETURN NULL;
+            END IF;
+            BEGIN
+                parsed := value::jsonb;
+            EXCEPTION WHEN invalid_text_representation OR untranslatable_character THEN
+                RETURN jsonb_build_object('legacy_result', value);
+            END;
+            IF jsonb_typeof(parsed) = 'object' THEN
+                RETURN parsed;
+            END IF;
+            RETURN jsonb_build_object('legacy_result', value);
+        END
+        $$ LANGUAGE plpgsql IMMUTABLE
+    """)
+    op.alter_column('check', 'result',
+                    existing_type=sa.String(),
+                    type_=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    postgresql_using="my_app_schema._check_result_to_jsonb(result)",
+                    schema='my_app_schema')
+    op.execute("DROP FUNCTION my_app_schema._check_result_to_jsonb(text)")
+    with op.get_context().autocommit_block():
+        op.create_index('ix_check_result', 'check', ['result'], unique=False, schema='my_app_schema',
+                        postgresql_using='gin', postgresql_ops={'result': 'jsonb_path_ops'},
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_check_result', table_name='check', schema='my_app_schema',
+                      postgresql_concurrently=True)
+    op.alter_column('check', 'result',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    type_=sa.String(),
+                    existing_nullable=True,
+                    postgresql_using="CASE WHEN result ? 'legacy_result' AND result - 'legacy_result' = '{}'::jsonb "
+                                     "THEN result ->> 'legacy_result' ELSE result::text END",
+                    schema='my_app_schema')
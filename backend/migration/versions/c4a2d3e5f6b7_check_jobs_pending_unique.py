@@ -0,0 +1,31 @@
+"""Deduplicate pending check jobs per document and ruleset version
+
+Revision ID: c4a2d3e5f6b7
+Revises: b3f1c2d4e5a6
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a2d3e5f6b7'
+down_revision = 'b3f1c2d4e5a6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('check_jobs', sa.Column('ruleset_version', sa.String(length=64), nullable=True,
+                                          comment='Версия правил на момент постановки'), schema='my_app_schema')
+    op.create_index('uq_check_jobs_pending_document', 'check_jobs', ['document_id', 'ruleset_version'],
+                    unique=True, schema='my_app_schema',
+                    postgresql_where=sa.text("state IN ('queued', 'running')"))
+
+
+def downgrade():
+    op.drop_index('uq_check_jobs_pending_document', table_name='check_jobs', schema='my_app_schema')
+    op.drop_column('check_jobs', 'ruleset_version', schema='my_app_schema')
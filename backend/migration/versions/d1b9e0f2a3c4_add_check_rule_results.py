@@ -0,0 +1,63 @@
+"""Add check_rule_results
+
+Revision ID: d1b9e0f2a3c4
+Revises: c0a8d9e1f2b3
+Create Date: 2026-10-17 21:00:00.000000
+
+Таблица заполняется из report.results уже сохранённых проверок (check.result).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'd1b9e0f2a3c4'
+down_revision = 'c0a8d9e1f2b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('check_rule_results',
+    sa.Column('check_id', sa.Integer(), nullable=False),
+    sa.Column('rule_id', sa.String(length=100), nullable=False),
+    sa.Column('document_id', sa.Integer(), nullable=False),
+    sa.Column('section', sa.String(length=20), nullable=True, comment='Пункт ГОСТ'),
+    sa.Column('severity', sa.String(length=20), nullable=False),
+    sa.Column('is_passed', sa.Boolean(), nullable=False),
+    sa.Column('expected_value', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('actual_value', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('checked_at', sa.DateTime(), nullable=False, comment='Время проверки (копия check.checked_at)'),
+    sa.ForeignKeyConstraint(['check_id'], ['my_app_schema.check.check_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['document_id'], ['my_app_schema.documents.document_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('check_id', 'rule_id'),
+    schema='my_app_schema',
+    comment='Результаты правил проверок (копия report.results для аналитики)'
+    )
+    op.create_index('ix_check_rule_results_rule_id_is_passed_check_id', 'check_rule_results',
+                    ['rule_id', 'is_passed', 'check_id'], unique=False, schema='my_app_schema')
+    op.create_index('ix_check_rule_results_checked_at', 'check_rule_results', ['checked_at'],
+                    unique=False, schema='my_app_schema')
+
+    op.execute("""
+        INSERT INTO my_app_schema.check_rule_results
+            (check_id, rule_id, document_id, section, severity, is_passed, expected_value, actual_value, checked_at)
+        SELECT c.check_id, r->>'rule_id', c.document_id, r->>'section', COALESCE(r->>'severity', 'info'),
+               COALESCE((r->>'is_passed')::boolean, false), r->'expected_value', r->'actual_value', c.checked_at
+        FROM my_app_schema."check" AS c
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(c.result #> '{report,results}') = 'array'
+                 THEN c.result #> '{report,results}' ELSE '[]'::jsonb END
+        ) AS r
+        WHERE r ? 'rule_id'
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_check_rule_results_checked_at', table_name='check_rule_results', schema='my_app_schema')
+    op.drop_index('ix_check_rule_results_rule_id_is_passed_check_id', table_name='check_rule_results',
+                  schema='my_app_schema')
+    op.drop_table('check_rule_results', schema='my_app_schema')
@@ -0,0 +1,30 @@
+"""Add documents.content_sha256
+
+Revision ID: d5b3e4f6a7c8
+Revises: c4a2d3e5f6b7
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b3e4f6a7c8'
+down_revision = 'c4a2d3e5f6b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('documents', sa.Column('content_sha256', sa.String(length=64), nullable=True,
+                                         comment='SHA-256 содержимого файла'), schema='my_app_schema')
+    op.create_index(op.f('ix_my_app_schema_documents_content_sha256'), 'documents', ['content_sha256'],
+                    unique=False, schema='my_app_schema')
+
+
+def downgrade():
+    op.drop_index(op.f('ix_my_app_schema_documents_content_sha256'), table_name='documents', schema='my_app_schema')
+    op.drop_column('documents', 'content_sha256', schema='my_app_schema')
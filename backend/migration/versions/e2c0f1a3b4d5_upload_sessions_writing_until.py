@@ -0,0 +1,30 @@
+"""Add upload_sessions.writing_until
+
+Revision ID: e2c0f1a3b4d5
+Revises: d1b9e0f2a3c4
+Create Date: 2026-10-18 10:00:00.000000
+
+Часть загрузки пишется без открытой транзакции: вместо блокировки строки на всё время
+передачи запрос «арендует» загрузку до writing_until.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision = 'e2c0f1a3b4d5'
+down_revision = 'd1b9e0f2a3c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('upload_sessions',
+                  sa.Column('writing_until', sa.DateTime(), nullable=True,
+                            comment='До какого времени часть передаётся (NULL — никто не пишет)'),
+                  schema='my_app_schema')
+
+
+def downgrade():
+    op.drop_column('upload_sessions', 'writing_until', schema='my_app_schema')
@@ -0,0 +1,36 @@
+"""Add document_features store
+
+Revision ID: e6c4f5a7b8d9
+Revises: d5b3e4f6a7c8
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'e6c4f5a7b8d9'
+down_revision = 'd5b3e4f6a7c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('document_features',
+    sa.Column('document_id', sa.Integer(), nullable=False),
+    sa.Column('parser_version', sa.String(length=20), nullable=False, comment='PARSER_VERSION при извлечении'),
+    sa.Column('fields', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Извлечённые поля document_data'),
+    sa.Column('features', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='document_data (только поля fields)'),
+    sa.Column('extracted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['document_id'], ['my_app_schema.documents.document_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('document_id'),
+    schema='my_app_schema',
+    comment='Извлечённые признаки документов'
+    )
+
+
+def downgrade():
+    op.drop_table('document_features', schema='my_app_schema')
@@ -0,0 +1,28 @@
+"""Add check_jobs.kind for queued rescoring
+
+Revision ID: f3d1a2b4c5e6
+Revises: e2c0f1a3b4d5
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision = 'f3d1a2b4c5e6'
+down_revision = 'e2c0f1a3b4d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('check_jobs',
+                  sa.Column('kind', sa.String(length=20), server_default='check', nullable=False,
+                            comment='check — разбор файла, rescore — переоценка по сохранённым признакам'),
+                  schema='my_app_schema')
+
+
+def downgrade():
+    op.drop_column('check_jobs', 'kind', schema='my_app_schema')
@@ -0,0 +1,41 @@
+"""Add upload_sessions for resumable uploads
+
+Revision ID: f7d5a6b8c9e0
+Revises: e6c4f5a7b8d9
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from project.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision = 'f7d5a6b8c9e0'
+down_revision = 'e6c4f5a7b8d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('upload_sessions',
+    sa.Column('upload_id', sa.String(length=32), nullable=False, comment='Идентификатор'),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('filename', sa.String(), nullable=False, comment='Исходное имя файла'),
+    sa.Column('doc_type', sa.String(), nullable=False),
+    sa.Column('is_example', sa.Boolean(), nullable=False),
+    sa.Column('total_size', sa.BigInteger(), nullable=False, comment='Объявленный размер файла, байт'),
+    sa.Column('chunk_size', sa.Integer(), nullable=False, comment='Размер части, байт'),
+    sa.Column('received_size', sa.BigInteger(), nullable=False, comment='Сколько байт от начала файла уже записано'),
+    sa.Column('temp_path', sa.String(length=500), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['my_app_schema.users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('upload_id'),
+    schema='my_app_schema',
+    comment='Незавершённые загрузки файлов по частям'
+    )
+
+
+def downgrade():
+    op.drop_table('upload_sessions', schema='my_app_schema')
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+
 import uvicorn
 
 from fastapi import FastAPI
@@ -17,10 +19,38 @@ from project.api.status_routes import status_routes
 from project.api.mistake_type_routes import mistake_type_routes
 from project.api.mistake_routes import mistake_routes
 from project.api.gost_check_routes import router as gost_check_router
+from project.api.health_routes import health_routes
+from project.api.analytics_routes import analytics_routes
+from project.core.check_worker import CheckWorker
+from project.core.uploads import run_upload_cleanup
+from project.gost_checker.engine import shutdown_parsing_engine
+from project.infrastructure.postgres.database import get_engine
 
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Очередь проверок ГОСТ обрабатывается в фоне; задание, прерванное остановкой,
+    # вернётся в очередь по истечении CHECK_JOB_LOCK_TIMEOUT_SEC
+    worker, worker_task = None, None
+    if settings.CHECK_WORKER_IN_API:
+        worker = CheckWorker(slots=settings.CHECK_WORKER_SLOTS)
+        worker_task = asyncio.create_task(worker.run())
+    # Брошенные возобновляемые загрузки лежат на диске API — чистит их процесс API
+    cleanup_task = asyncio.create_task(run_upload_cleanup())
+    yield
+    cleanup_task.cancel()
+    await asyncio.gather(cleanup_task, return_exceptions=True)
+    if worker is not None:
+        worker.stop()
+        worker_task.cancel()
+        await asyncio.gather(worker_task, return_exceptions=True)
+    # Останавливаем пул процессов разбора документов
+    shutdown_parsing_engine()
+    await get_engine().dispose()
+
+
 def create_app() -> FastAPI:
     app_options = {}
     if settings.ENV.lower() == "prod":
@@ -31,7 +61,7 @@ def create_app() -> FastAPI:
     if settings.LOG_LEVEL in ["DEBUG", "INFO"]:
         app_options["debug"] = True
 
-    app = FastAPI(root_path=settings.ROOT_PATH, **app_options)
+    app = FastAPI(root_path=settings.ROOT_PATH, lifespan=lifespan, **app_options)
 
     # ✅ CORS настроен ДО подключения роутеров
     app.add_middleware(
@@ -53,6 +83,8 @@ def create_app() -> FastAPI:
     app.include_router(mistake_type_routes, tags=["Mistake Type"])
     app.include_router(mistake_routes, tags=["Mistake"])
     app.include_router(gost_check_router, tags=["Gost"])
+    app.include_router(health_routes, tags=["Health"])
+    app.include_router(analytics_routes, tags=["Analytics"])
 
     return app
 
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import status
+
+from project.api.depends import database, rule_result_repo, check_for_admin_access
+from project.core.exceptions import InvalidCursor
+from project.schemas.pagination import Page, PageQuery
+from project.schemas.rule_results import RuleFailureSchema, RuleStatsSchema
+
+analytics_routes = APIRouter(prefix="/analytics", dependencies=[Depends(check_for_admin_access)])
+
+
+@analytics_routes.get(
+    "/rules",
+    response_model=list[RuleStatsSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_rule_stats(
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    severity: str | None = None,
+    limit: int = Query(20, ge=1, le=200),
+) -> list[RuleStatsSchema]:
+    """Правила, которые чаще всего не проходят за период (по check_rule_results)"""
+    async with database.session() as session:
+        return await rule_result_repo.get_rule_stats(
+            session, date_from=date_from, date_to=date_to, severity=severity, limit=limit,
+        )
+
+
+@analytics_routes.get(
+    "/rules/{rule_id}/failures",
+    response_model=Page[RuleFailureSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_rule_failures(
+    rule_id: str,
+    latest_only: bool = True,
+    page: PageQuery = Depends(),
+) -> Page[RuleFailureSchema]:
+    """Документы, не прошедшие правило; latest_only — только по последней проверке документа"""
+    try:
+        async with database.session() as session:
+            return await rule_result_repo.get_rule_failures(session, rule_id, page, latest_only=latest_only)
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
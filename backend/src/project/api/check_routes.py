@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends
 from fastapi import HTTPException
 from fastapi import status
 
-from project.core.exceptions import CheckNotFound, CheckAlreadyExists
-from project.schemas.check import CheckCreate, CheckSchema
+from project.core.exceptions import CheckNotFound, CheckAlreadyExists, InvalidCursor
+from project.schemas.check import CheckCreate, CheckFilters, CheckSchema
+from project.schemas.pagination import Page, PageQuery
 
 from project.api.depends import database, check_repo, get_current_user, check_for_admin_access
 from project.schemas.user import UserSchema
@@ -12,19 +13,25 @@ check_routes = APIRouter()
 
 @check_routes.get(
     "/all_checks",
-    response_model=list[CheckSchema],
+    response_model=Page[CheckSchema],
     status_code=status.HTTP_200_OK,
 )
-async def get_all_checks(current_user: UserSchema = Depends(get_current_user)) -> list[CheckSchema]:
-    async with database.session() as session:
-        try:
+async def get_all_checks(
+    page: PageQuery = Depends(),
+    filters: CheckFilters = Depends(),
+    current_user: UserSchema = Depends(get_current_user),
+) -> Page[CheckSchema]:
+    try:
+        async with database.session() as session:
             if current_user.is_admin:
-                all_checks = await check_repo.get_all_checks(session=session)
+                all_checks = await check_repo.get_all_checks(session=session, page=page, filters=filters)
             else:
-                all_checks = await check_repo.get_checks_by_user_id(session=session, user_id=current_user.user_id)
-        except CheckNotFound as error:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error.message)
-        return all_checks
+                all_checks = await check_repo.get_checks_by_user_id(
+                    session=session, user_id=current_user.user_id, page=page, filters=filters,
+                )
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
+    return all_checks
 
 @check_routes.get(
     "/check/{check_id}",
@@ -59,6 +66,26 @@ async def get_checks_by_standart_id(standart_id: int) -> list[CheckSchema]:
         checks = await check_repo.get_checks_by_standart_id(session=session, standart_id=standart_id)
         return [CheckSchema.model_validate(obj=check) for check in checks]
 
+@check_routes.get(
+    "/checks/rule/{rule_id}",
+    response_model=Page[CheckSchema],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_for_admin_access)],
+)
+async def get_checks_by_rule(
+    rule_id: str,
+    severity: str | None = None,
+    failed: bool = True,
+    page: PageQuery = Depends(),
+) -> Page[CheckSchema]:
+    try:
+        async with database.session() as session:
+            return await check_repo.get_checks_by_rule(
+                session=session, rule_id=rule_id, page=page, severity=severity, failed=failed,
+            )
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
+
 @check_routes.post(
     "/add_check",
     response_model=CheckSchema,
@@ -9,7 +9,8 @@ from project.core.exceptions import CredentialsException
 from project.resource.auth import oauth2_scheme
 
 
-from project.infrastructure.postgres.database import PostgresDatabase
+from project.infrastructure.postgres.database import database
+from project.infrastructure.postgres.reference_cache import reference_cache
 from project.schemas.user import UserSchema
 
 from project.infrastructure.postgres.repository.user_repo import UserRepository
@@ -21,9 +22,10 @@ from project.infrastructure.postgres.repository.review_repo import ReviewReposit
 from project.infrastructure.postgres.repository.status_repo import StatusRepository
 from project.infrastructure.postgres.repository.mistake_type_repo import MistakeTypeRepository
 from project.infrastructure.postgres.repository.mistake_repo import MistakeRepository
+from project.infrastructure.postgres.repository.upload_session_repo import UploadSessionRepository
+from project.infrastructure.postgres.repository.check_rule_result_repo import CheckRuleResultRepository
 from project.services.telegram import is_user_subscribed
 
-database = PostgresDatabase()
 user_repo = UserRepository()
 document_repo = DocumentRepository()
 standard_repo = StandardRepository()
@@ -33,6 +35,8 @@ review_repo = ReviewRepository()
 status_repo = StatusRepository()
 mistake_type_repo = MistakeTypeRepository()
 mistake_repo = MistakeRepository()
+upload_session_repo = UploadSessionRepository()
+rule_result_repo = CheckRuleResultRepository()
 
 
 AUTH_EXCEPTION_MESSAGE = "Невозможно проверить данные для авторизации"
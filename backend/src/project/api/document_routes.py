@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Request
 from fastapi.responses import FileResponse
+from contextlib import suppress
 import shutil
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional
 from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from project.api.depends import (
@@ -12,17 +14,25 @@ from project.api.depends import (
     get_current_user,
     document_repo,
     check_for_admin_access,
+    upload_session_repo,
     # require_tg_subscription,  # ← ОТКЛЮЧАЕМ ПРОВЕРКУ ПОДПИСКИ
 )
 from project.schemas.documents import (
     DocumentCreate,
+    DocumentFilters,
     DocumentSchema,
     DocumentUpdate,
     FileUploadResponse,
-    FileInfo
+    FileInfo,
+    UploadSessionCreate,
+    UploadSessionSchema,
 )
-from project.core.exceptions import DocumentNotFound
+from project.schemas.pagination import Page, PageQuery
+from project.core.exceptions import DatabaseError, DocumentNotFound, InvalidCursor, UploadTooLarge
 from project.core.config import settings
+from project.core.gost_service import GostCheckService
+from project.core.uploads import file_sha256, save_upload, staging_dir, write_chunk
+from project.infrastructure.storage import get_storage, storage_for
 
 # УБИРАЕМ require_tg_subscription из зависимостей роутера
 # Было: dependencies=[Depends(require_tg_subscription)]
@@ -31,44 +41,62 @@ document_routes = APIRouter()  # ← теперь без проверки под
 
 @document_routes.get(
     "/all_documents",
-    response_model=list[DocumentSchema],
+    response_model=Page[DocumentSchema],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(check_for_admin_access)]
 )
-async def get_all_documents() -> list[DocumentSchema]:
-    async with database.session() as session:
-        documents = await document_repo.get_all_documents(session)
+async def get_all_documents(
+        status_id: Optional[int] = None,
+        page: PageQuery = Depends(),
+        filters: DocumentFilters = Depends(),
+) -> Page[DocumentSchema]:
+    try:
+        async with database.session() as session:
+            documents = await document_repo.get_all_documents(session, page, filters, status_id)
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
     return documents
 
 
 @document_routes.get(
     "/documents_by_user/{user_id}",
-    response_model=list[DocumentSchema],
+    response_model=Page[DocumentSchema],
     status_code=status.HTTP_200_OK,
 )
 async def get_documents_by_user(
         user_id: int,
+        status_id: Optional[int] = None,
+        page: PageQuery = Depends(),
+        filters: DocumentFilters = Depends(),
         current_user=Depends(get_current_user),
-) -> list[DocumentSchema]:
+) -> Page[DocumentSchema]:
     if not current_user.is_admin and current_user.user_id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Нет доступа")
 
-    async with database.session() as session:
-        documents = await document_repo.get_documents_by_user(session, user_id)
+    try:
+        async with database.session() as session:
+            documents = await document_repo.get_documents_by_user(session, user_id, page, filters, status_id)
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
     return documents
 
 
 @document_routes.get(
     "/status/{status_id}",
-    response_model=list[DocumentSchema],
+    response_model=Page[DocumentSchema],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(check_for_admin_access)]
 )
 async def get_documents_by_status(
         status_id: int,
-) -> list[DocumentSchema]:
-    async with database.session() as session:
-        documents = await document_repo.get_documents_by_status(session, status_id)
+        page: PageQuery = Depends(),
+        filters: DocumentFilters = Depends(),
+) -> Page[DocumentSchema]:
+    try:
+        async with database.session() as session:
+            documents = await document_repo.get_documents_by_status(session, status_id, page, filters)
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
     return documents
 
 
@@ -144,7 +172,7 @@ async def update_document(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Документ не найден")
 
         if not current_user.is_admin and document.user_id != current_user.user_id:
-            raise HTTPException(status_code=status.HTTP_403_FORБIDDEN, detail="Нет доступа")
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Нет доступа")
 
         try:
             updated_document = await document_repo.update_document(session, document_id, document_dto)
@@ -175,6 +203,68 @@ async def delete_document(
         except DocumentNotFound as error:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error.message)
 
+    # Файл удаляется после commit: документ без файла хуже, чем файл без документа
+    await storage_for(document.filepath).delete(document.filepath)
+
+
+ALLOWED_UPLOAD_TYPES = [".pdf", ".doc", ".docx", ".txt"]
+
+
+def _check_file_type(filename: str) -> None:
+    if Path(filename).suffix.lower() not in ALLOWED_UPLOAD_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Недопустимый тип файла. Разрешены: {', '.join(ALLOWED_UPLOAD_TYPES)}"
+        )
+
+
+def _unique_filename(filename: str) -> str:
+    import uuid
+    import time
+    return f"{int(time.time())}_{uuid.uuid4().hex[:8]}_{Path(filename).name}"
+
+
+async def _create_uploaded_document(user_id: int, unique_filename: str, staged: Path, file_size: int,
+                                    content_sha256: str, doc_type: str, is_example: bool,
+                                    finish: Optional[Callable[[AsyncSession], Awaitable[None]]] = None
+                                    ) -> DocumentSchema:
+    """Перенос файла в хранилище и запись в БД (общие для обычной и возобновляемой загрузки).
+
+    Файл переносится до открытия транзакции: передача в S3 не держит соединение пула.
+    Если запись в БД не удалась, файл удаляется из хранилища. finish(session) выполняется
+    в той же транзакции, что и вставка документа.
+    """
+    storage = get_storage()
+    location = await storage.save(staged, unique_filename, content_sha256)
+    document_data = DocumentCreate(
+        user_id=user_id,
+        filename=unique_filename,
+        filepath=location,
+        upload_datetime=datetime.utcnow(),
+        doc_type=doc_type,
+        is_example=is_example,
+        size=Decimal(file_size),
+        status_id=1,
+        report_pdf_path="",
+        score=Decimal('0.0'),
+        analysis_time=Decimal('0.0'),
+        content_sha256=content_sha256
+    )
+
+    try:
+        async with database.session() as session:
+            new_document = await document_repo.create_document(session, document_data)
+            if finish is not None:
+                await finish(session)
+    except BaseException:
+        try:
+            await storage.delete(location)
+        except Exception as e:
+            print(f"Не удалось удалить файл {location} после ошибки записи документа: {e}")
+        raise
+    print(f"Документ создан в БД: {new_document.document_id}, файл: {new_document.filepath}")
+    return new_document
+
 
 @document_routes.post(
     "/upload",
@@ -196,59 +286,24 @@ async def upload_document_file(
         print(f"Пользователь: {current_user.user_id}")
 
         # Проверяем тип файла
-        file_extension = Path(file.filename).suffix.lower()
-        allowed_types = [".pdf", ".doc", ".docx", ".txt"]
-
-        if file_extension not in allowed_types:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Недопустимый тип файла. Разрешены: {', '.join(allowed_types)}"
-            )
-
-        # Создаем директорию если нет
-        upload_dir = Path("uploads")
-        upload_dir.mkdir(exist_ok=True)
+        _check_file_type(file.filename)
 
         # Генерируем уникальное имя файла
-        import uuid
-        import time
-        unique_filename = f"{int(time.time())}_{uuid.uuid4().hex[:8]}_{file.filename}"
-        file_path = upload_dir / unique_filename
-
-        # Сохраняем файл
-        content = await file.read()
-        file_size = len(content)
-
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
-
-        print(f"Файл сохранен: {file_path}")
-
-        # Создаем запись в БД
-        document_data = DocumentCreate(
-            user_id=current_user.user_id,
-            filename=unique_filename,
-            filepath=str(file_path),
-            upload_datetime=datetime.utcnow(),
-            doc_type=doc_type,
-            is_example=is_example,
-            size=Decimal(file_size),
-            status_id=1,
-            report_pdf_path="",
-            score=Decimal('0.0'),
-            analysis_time=Decimal('0.0')
-        )
+        unique_filename = _unique_filename(file.filename)
+        staged = staging_dir() / unique_filename
 
-        async with database.session() as session:
-            new_document = await document_repo.create_document(session, document_data)
+        # Сохраняем файл блоками, попутно считая размер и SHA-256 содержимого
+        stored = await save_upload(file, staged)
 
-        print(f"Документ создан в БД: {new_document.document_id}")
+        new_document = await _create_uploaded_document(
+            current_user.user_id, unique_filename, staged, stored.size, stored.sha256, doc_type, is_example
+        )
 
         return FileUploadResponse(
             filename=file.filename,
             saved_filename=unique_filename,
-            file_path=str(file_path),
-            file_size=file_size,
+            file_path=new_document.filepath,
+            file_size=stored.size,
             content_type=file.content_type,
             document_id=new_document.document_id,
             message="Документ успешно загружен"
@@ -256,10 +311,12 @@ async def upload_document_file(
 
     except HTTPException:
         raise
-    except Exception as e:
+    except UploadTooLarge as error:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=error.message)
+    except (Exception, DatabaseError) as e:
         print(f"Ошибка при загрузке: {str(e)}")
-        if 'file_path' in locals() and file_path.exists():
-            file_path.unlink()
+        if 'staged' in locals():
+            staged.unlink(missing_ok=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Ошибка при загрузке файла: {str(e)}"
@@ -267,9 +324,195 @@ async def upload_document_file(
     finally:
         await file.close()
 
+
+# Возобновляемая загрузка: создать сессию, передать части (PUT, каждая с offset = index * chunk_size),
+# при обрыве узнать received_size и продолжить с next_chunk, затем завершить — появится документ
+UPLOAD_NOT_FOUND = "Загрузка не найдена"
+UPLOAD_BUSY = "Часть этой загрузки уже передаётся, повторите позже"
+
+
+def _upload_schema(upload) -> UploadSessionSchema:
+    return UploadSessionSchema(
+        upload_id=upload.upload_id,
+        filename=upload.filename,
+        total_size=upload.total_size,
+        chunk_size=upload.chunk_size,
+        received_size=upload.received_size,
+        next_chunk=upload.received_size // upload.chunk_size,
+    )
+
+
+@document_routes.post(
+    "/uploads",
+    response_model=UploadSessionSchema,
+    status_code=status.HTTP_201_CREATED
+)
+async def create_upload_session(
+        upload_data: UploadSessionCreate,
+        current_user=Depends(get_current_user)
+) -> UploadSessionSchema:
+    """Начать возобновляемую загрузку файла по частям"""
+    _check_file_type(upload_data.filename)
+    if upload_data.size <= 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Пустой файл")
+    if upload_data.size > settings.UPLOAD_MAX_SIZE_MB * 1024 * 1024:
+        error = UploadTooLarge(upload_data.filename, settings.UPLOAD_MAX_SIZE_MB)
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=error.message)
+
+    async with database.session() as session:
+        upload = await upload_session_repo.create(
+            session, current_user.user_id, Path(upload_data.filename).name, upload_data.doc_type,
+            upload_data.is_example, upload_data.size, settings.UPLOAD_RESUMABLE_CHUNK_SIZE_MB * 1024 * 1024,
+            str(staging_dir()),
+        )
+        return _upload_schema(upload)
+
+
+@document_routes.get("/uploads/{upload_id}", response_model=UploadSessionSchema)
+async def get_upload_session(
+        upload_id: str,
+        current_user=Depends(get_current_user)
+) -> UploadSessionSchema:
+    """Сколько байт уже принято: продолжать с next_chunk"""
+    async with database.session() as session:
+        upload = await upload_session_repo.get(session, upload_id, current_user.user_id)
+        if not upload:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=UPLOAD_NOT_FOUND)
+        return _upload_schema(upload)
+
+
+@document_routes.put("/uploads/{upload_id}/chunks/{index}", response_model=UploadSessionSchema)
+async def upload_chunk(
+        upload_id: str,
+        index: int,
+        request: Request,
+        offset: Optional[int] = None,
+        current_user=Depends(get_current_user)
+) -> UploadSessionSchema:
+    """Принять часть файла (тело запроса — байты части); повтор уже принятой части перезаписывает её.
+
+    Транзакции короткие: проверить и занять загрузку, затем (без сессии БД) принять тело,
+    затем записать received_size. Медленный клиент не держит соединение пула и блокировку строки.
+    """
+    async with database.session() as session:
+        # Блокировка строки только на время проверки: части одной загрузки пишутся строго по одной
+        upload = await upload_session_repo.get(session, upload_id, current_user.user_id, for_update=True)
+        if not upload:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=UPLOAD_NOT_FOUND)
+
+        expected_offset = index * upload.chunk_size
+        if index < 0 or (offset is not None and offset != expected_offset) or expected_offset >= upload.total_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Часть {index} должна начинаться с offset {expected_offset}"
+            )
+        if expected_offset > upload.received_size:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Принято {upload.received_size} байт, ожидается часть {upload.received_size // upload.chunk_size}"
+            )
+        if upload.writing_until is not None and upload.writing_until > datetime.now():
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=UPLOAD_BUSY)
+
+        expected_size = min(upload.chunk_size, upload.total_size - expected_offset)
+        temp_path = Path(upload.temp_path)
+        writing_until = await upload_session_repo.start_writing(session, upload, settings.UPLOAD_CHUNK_LEASE_SEC)
+
+    try:
+        written = await write_chunk(request.stream(), temp_path, expected_offset, expected_size)
+    except Exception as error:
+        # Часть не принята: снимаем аренду, чтобы клиент мог сразу повторить
+        async with database.session() as session:
+            await upload_session_repo.release(session, upload_id, writing_until)
+        if isinstance(error, ValueError):
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(error))
+        raise
+
+    async with database.session() as session:
+        upload = await upload_session_repo.finish_writing(
+            session, upload_id, writing_until, expected_offset + written
+        )
+        if not upload:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Загрузка отменена или часть передавалась слишком долго: запросите состояние загрузки"
+            )
+        return _upload_schema(upload)
+
+
+@document_routes.post(
+    "/uploads/{upload_id}/complete",
+    response_model=FileUploadResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def complete_upload(
+        upload_id: str,
+        current_user=Depends(get_current_user)
+) -> FileUploadResponse:
+    """Завершить загрузку: файл переносится в хранилище и создаётся документ"""
+    async with database.session() as session:
+        # Аренда, как при передаче части: пока файл переносится, части и повторное завершение не принимаются
+        upload = await upload_session_repo.get(session, upload_id, current_user.user_id, for_update=True)
+        if not upload:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=UPLOAD_NOT_FOUND)
+        if upload.received_size != upload.total_size:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Принято {upload.received_size} из {upload.total_size} байт"
+            )
+        if upload.writing_until is not None and upload.writing_until > datetime.now():
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=UPLOAD_BUSY)
+        filename, file_size, temp_path = upload.filename, upload.total_size, Path(upload.temp_path)
+        doc_type, is_example = upload.doc_type, upload.is_example
+        writing_until = await upload_session_repo.start_writing(session, upload, settings.UPLOAD_CHUNK_LEASE_SEC)
+
+    async def finish(session: AsyncSession) -> None:
+        if not await upload_session_repo.delete(session, upload_id, writing_until):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Загрузка отменена")
+
+    unique_filename = _unique_filename(filename)
+    try:
+        content_sha256 = await file_sha256(temp_path)
+        new_document = await _create_uploaded_document(
+            current_user.user_id, unique_filename, temp_path, file_size, content_sha256, doc_type, is_example,
+            finish=finish,
+        )
+    except BaseException:
+        # Снимаем аренду; если файл уже унесён в хранилище и удалён там, части нужно передать заново
+        with suppress(DatabaseError):
+            async with database.session() as session:
+                await upload_session_repo.release(
+                    session, upload_id, writing_until, received_size=None if temp_path.exists() else 0
+                )
+        raise
+
+    return FileUploadResponse(
+        filename=filename,
+        saved_filename=unique_filename,
+        file_path=new_document.filepath,
+        file_size=file_size,
+        document_id=new_document.document_id,
+        message="Документ успешно загружен"
+    )
+
+
+@document_routes.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload(
+        upload_id: str,
+        current_user=Depends(get_current_user)
+) -> None:
+    """Отменить загрузку и удалить принятые части"""
+    async with database.session() as session:
+        upload = await upload_session_repo.get(session, upload_id, current_user.user_id, for_update=True)
+        if not upload:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=UPLOAD_NOT_FOUND)
+        Path(upload.temp_path).unlink(missing_ok=True)
+        await upload_session_repo.delete(session, upload_id)
+
 @document_routes.post("/{document_id}/check-gost")
 async def check_document_gost(
     document_id: int,
+    force: bool = False,
     current_user=Depends(get_current_user),
 ):
     """Запустить проверку ГОСТ для документа"""
@@ -284,9 +527,13 @@ async def check_document_gost(
         if not current_user.is_admin and document.user_id != current_user.user_id:
             raise HTTPException(403, "Нет доступа к документу")
         
+        # force (заново разобрать файл, даже если такое содержимое уже проверено) — только администратору
+        if force and not current_user.is_admin:
+            raise HTTPException(403, "Принудительная проверка доступна только администратору")
+
         # Создаем сервис и запускаем проверку
         # Предполагается, что GostCheckService принимает сессию в конструкторе
         service = GostCheckService(session)
-        check_id = await service.start_gost_check(document_id)
+        check_id = await service.start_gost_check(document_id, force=force)
         
         return {"message": "Проверка ГОСТ запущена", "check_id": check_id}
\ No newline at end of file
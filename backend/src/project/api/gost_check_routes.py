@@ -8,8 +8,9 @@ from decimal import Decimal
 from project.infrastructure.postgres.database import database  # Импортируем database
 from project.infrastructure.postgres.models import Users, Documents, Status
 from project.schemas.gost_check import GostCheckRequest, GostCheckResponse, GostCheckResult, GostCheckStatus
+from project.core.config import settings
 from project.core.gost_service import GostCheckService
-from project.api.depends import get_current_user
+from project.api.depends import check_for_admin_access, get_current_user
 
 router = APIRouter(prefix="/gost-check", tags=["GOST Check"])
 
@@ -38,7 +39,12 @@ async def start_gost_check(
         
         # Запускаем проверку
         service = GostCheckService(session)  # Передаем асинхронную сессию
-        check_id = await service.start_gost_check(request.document_id)
+        if request.force and not current_user.is_admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Принудительная проверка доступна только администратору"
+            )
+        check_id = await service.start_gost_check(request.document_id, force=request.force)
         
         return GostCheckResponse(
             check_id=check_id,
@@ -112,16 +118,8 @@ async def get_gost_check_result(
                 detail="Результат проверки не найден"
             )
         
-        # Проверяем права доступа
-        from sqlalchemy import select
-        stmt = select(Documents).where(
-            Documents.document_id == result['document_id'],
-            Documents.user_id == current_user.user_id
-        )
-        result_doc = await session.execute(stmt)
-        document = result_doc.scalar_one_or_none()
-        
-        if not document:
+        # Проверяем права доступа (владелец документа — из того же запроса)
+        if result['user_id'] != current_user.user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Нет доступа к результатам проверки"
@@ -130,12 +128,48 @@ async def get_gost_check_result(
         return GostCheckResult(
             check_id=result['check_id'],
             document_id=result['document_id'],
-            is_compliant=result['status'] == 'perfect',
-            score=document.score,
+            is_compliant=result['is_compliant'],
+            score=result['score'],
             status=result['status'],
             filename=result.get('filename', 'unknown'),
             errors=result['errors'],
             warnings=result['warnings'],
             details={},
             checked_at=result['checked_at']
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/rescore")
+async def rescore_all_documents(
+    current_user: Users = Depends(check_for_admin_access),
+):
+    """Поставить в очередь переоценку всех документов по текущим правилам.
+
+    Воркер переоценивает по сохранённым признакам, без них — с разбором файла.
+    Ответ — сколько документов просмотрено, поставлено в очередь и пропущено (проверка уже ждёт).
+    """
+    async with database.session() as session:
+        return await GostCheckService(session).enqueue_rescore_all(settings.RESCORE_BATCH_SIZE)
+
+
+@router.post("/rescore/{document_id}")
+async def rescore_document(
+    document_id: int,
+    current_user: Users = Depends(check_for_admin_access),
+):
+    """Переоценить документ по текущим правилам; без пригодных признаков — поставить в очередь на полную проверку"""
+    async with database.session() as session:
+        from sqlalchemy import select
+        document = await session.scalar(select(Documents).where(Documents.document_id == document_id))
+        if not document:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Документ не найден"
+            )
+
+        service = GostCheckService(session)
+        check_id = await service.rescore_document(document_id)
+        if check_id is not None:
+            return {"document_id": document_id, "check_id": check_id, "rescored": True}
+        check_id = await service.start_gost_check(document_id)
+        return {"document_id": document_id, "check_id": check_id, "rescored": False}
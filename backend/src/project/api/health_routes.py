@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+from fastapi import status
+
+from project.api.depends import database, check_for_admin_access
+
+health_routes = APIRouter()
+
+
+@health_routes.get(
+    "/health/db-pool",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_for_admin_access)],
+)
+async def get_db_pool_status() -> dict:
+    """Пул соединений процесса: занятые/свободные соединения и ожидание выдачи соединения"""
+    return database.pool_status()
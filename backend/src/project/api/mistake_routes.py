@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends
 from fastapi import HTTPException
 from fastapi import status
 
-from project.core.exceptions import MistakeNotFound, MistakeAlreadyExists, DocumentNotFound
+from project.core.exceptions import MistakeNotFound, MistakeAlreadyExists, DocumentNotFound, InvalidCursor
 from project.schemas.mistake import MistakeCreate, MistakeSchema
+from project.schemas.pagination import Page, PageQuery
 
 from project.api.depends import database, mistake_repo, get_current_user, check_for_admin_access
 from project.api.depends import document_repo
@@ -14,13 +15,16 @@ mistake_routes = APIRouter()
 
 @mistake_routes.get(
     "/all_mistakes",
-    response_model=list[MistakeSchema],
+    response_model=Page[MistakeSchema],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(check_for_admin_access)],
 )
-async def get_all_mistakes() -> list[MistakeSchema]:
-    async with database.session() as session:
-        all_mistakes = await mistake_repo.get_all_mistakes(session=session)
+async def get_all_mistakes(page: PageQuery = Depends()) -> Page[MistakeSchema]:
+    try:
+        async with database.session() as session:
+            all_mistakes = await mistake_repo.get_all_mistakes(session=session, page=page)
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
     return all_mistakes
 
 @mistake_routes.get(
@@ -53,57 +57,50 @@ async def get_mistake_by_id(
 
 @mistake_routes.get(
     "/mistakes/document/{document_id}",
-    response_model=list[MistakeSchema],
+    response_model=Page[MistakeSchema],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(get_current_user)],
 )
 async def get_mistakes_by_document_id(
     document_id: int,
+    page: PageQuery = Depends(),
     current_user: UserSchema = Depends(get_current_user),
-) -> list[MistakeSchema]:
+) -> Page[MistakeSchema]:
     try:
         async with database.session() as session:
             document = await document_repo.get_document_by_id(session=session, document_id=document_id)
+            if not current_user.is_admin and document.user_id != current_user.user_id:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Нет доступа")
+            mistakes = await mistake_repo.get_mistakes_by_document_id(
+                session=session, document_id=document_id, page=page,
+            )
     except DocumentNotFound as error:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error.message)
-
-    if not current_user.is_admin and document.user_id != current_user.user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Нет доступа")
-
-    async with database.session() as session:
-        mistakes = await mistake_repo.get_mistakes_by_document_id(session=session, document_id=document_id)
-        return mistakes
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
+    return mistakes
 
 @mistake_routes.get(
     "/mistakes/type/{mistake_type_id}",
-    response_model=list[MistakeSchema],
+    response_model=Page[MistakeSchema],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(get_current_user)],
 )
 async def get_mistakes_by_mistake_type_id(
     mistake_type_id: int,
+    page: PageQuery = Depends(),
     current_user: UserSchema = Depends(get_current_user),
-) -> list[MistakeSchema]:
-    async with database.session() as session:
-        mistakes = await mistake_repo.get_mistakes_by_mistake_type_id(session=session, mistake_type_id=mistake_type_id)
-
-    # Админ получает всё
-    if current_user.is_admin:
-        return mistakes
-
-    # Для пользователя — фильтруем по владельцу документа
-    filtered: list[MistakeSchema] = []
-    async with database.session() as session:
-        for m in mistakes:
-            try:
-                doc = await document_repo.get_document_by_id(session=session, document_id=m.document_id)
-            except DocumentNotFound:
-                # если документ не найден — пропускаем такую запись
-                continue
-            if doc.user_id == current_user.user_id:
-                filtered.append(m)
-
-    return filtered
+) -> Page[MistakeSchema]:
+    # Админ получает всё, пользователь — только ошибки своих документов (фильтр в запросе)
+    owner_id = None if current_user.is_admin else current_user.user_id
+    try:
+        async with database.session() as session:
+            mistakes = await mistake_repo.get_mistakes_by_mistake_type_id(
+                session=session, mistake_type_id=mistake_type_id, page=page, user_id=owner_id,
+            )
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
+    return mistakes
 
 @mistake_routes.post(
     "/add_mistake",
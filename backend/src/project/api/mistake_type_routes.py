@@ -5,7 +5,8 @@ from fastapi import status
 from project.core.exceptions import MistakeTypeNotFound, MistakeTypeAlreadyExists
 from project.schemas.mistake_type import MistakeTypeCreate, MistakeTypeSchema
 
-from project.api.depends import database, mistake_type_repo, get_current_user, check_for_admin_access
+from project.api.depends import database, mistake_type_repo, get_current_user, check_for_admin_access, reference_cache
+from project.infrastructure.postgres.models import MistakeType
 
 mistake_type_routes = APIRouter()
 
@@ -50,6 +51,7 @@ async def add_mistake_type(
     except MistakeTypeAlreadyExists as error:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=error.message)
 
+    reference_cache.invalidate(MistakeType)
     return new_mistake_type
 
 @mistake_type_routes.put(
@@ -74,6 +76,7 @@ async def update_mistake_type(
     except MistakeTypeAlreadyExists as error:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=error.message)
 
+    reference_cache.invalidate(MistakeType)
     return updated_mistake_type
 
 @mistake_type_routes.delete(
@@ -88,4 +91,5 @@ async def delete_mistake_type(
         async with database.session() as session:
             await mistake_type_repo.delete_mistake_type(session=session, mistake_type_id=mistake_type_id)
     except MistakeTypeNotFound as error:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error.message)
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error.message)
+    reference_cache.invalidate(MistakeType)
\ No newline at end of file
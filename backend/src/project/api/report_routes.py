@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends
 from fastapi import HTTPException
 from fastapi import status
 
-from project.core.exceptions import ReportNotFound, ReportAlreadyExists
-from project.schemas.reports import ReportCreate, ReportSchema
+from project.core.exceptions import InvalidCursor, ReportNotFound, ReportAlreadyExists
+from project.schemas.pagination import Page, PageQuery
+from project.schemas.reports import ReportCreate, ReportFilters, ReportSchema
 
 from project.api.depends import database, report_repo, get_current_user, check_for_admin_access
 from project.schemas.user import UserSchema
@@ -12,19 +13,26 @@ report_routes = APIRouter()
 
 @report_routes.get(
     "/all_reports",
-    response_model=list[ReportSchema],
+    response_model=Page[ReportSchema],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(get_current_user)],
 )
-async def get_all_reports(current_user: UserSchema = Depends(get_current_user)) -> list[ReportSchema]:
-    async with database.session() as session:
-        if current_user.is_admin:
-            all_reports = await report_repo.get_all_reports(session=session)
-            return all_reports
+async def get_all_reports(
+    page: PageQuery = Depends(),
+    filters: ReportFilters = Depends(),
+    current_user: UserSchema = Depends(get_current_user),
+) -> Page[ReportSchema]:
+    try:
+        async with database.session() as session:
+            if current_user.is_admin:
+                return await report_repo.get_all_reports(session=session, page=page, filters=filters)
 
-        # для пользователя — возвращаем только отчёты его документов
-        reports = await report_repo.get_reports_by_user(session=session, user_id=current_user.user_id)
-        return reports
+            # для пользователя — возвращаем только отчёты его документов
+            return await report_repo.get_reports_by_user(
+                session=session, user_id=current_user.user_id, page=page, filters=filters,
+            )
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
 
 @report_routes.get(
     "/report/{report_id}",
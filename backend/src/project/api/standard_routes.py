@@ -5,7 +5,9 @@ from project.api.depends import (
     get_current_user,
     standard_repo,
     check_for_admin_access,
+    reference_cache,
 )
+from project.infrastructure.postgres.models import Standart
 from project.schemas.standart import StandardCreate, StandardSchema
 from project.core.exceptions import StandardNotFound, StandardAlreadyExists
 
@@ -89,6 +91,7 @@ async def add_standard(
             detail=error.message
         )
 
+    reference_cache.invalidate(Standart)
     return new_standard
 
 
@@ -121,6 +124,7 @@ async def update_standard(
             detail=error.message
         )
 
+    reference_cache.invalidate(Standart)
     return updated_standard
 
 
@@ -143,3 +147,4 @@ async def delete_standard(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=error.message
         )
+    reference_cache.invalidate(Standart)
@@ -5,7 +5,8 @@ from fastapi import status
 from project.core.exceptions import StatusNotFound, StatusAlreadyExists
 from project.schemas.status import StatusCreate, StatusSchema
 
-from project.api.depends import database, status_repo, get_current_user, check_for_admin_access
+from project.api.depends import database, status_repo, get_current_user, check_for_admin_access, reference_cache
+from project.infrastructure.postgres.models import Status
 from project.schemas.user import UserSchema
 
 status_routes = APIRouter()
@@ -50,6 +51,7 @@ async def add_status(
     except StatusAlreadyExists as error:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=error.message)
 
+    reference_cache.invalidate(Status)
     return new_status
 
 @status_routes.put(
@@ -74,6 +76,7 @@ async def update_status(
     except StatusAlreadyExists as error:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=error.message)
 
+    reference_cache.invalidate(Status)
     return updated_status
 
 @status_routes.delete(
@@ -88,4 +91,5 @@ async def delete_status(
         async with database.session() as session:
             await status_repo.delete_status(session=session, status_id=status_id)
     except StatusNotFound as error:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error.message)
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error.message)
+    reference_cache.invalidate(Status)
\ No newline at end of file
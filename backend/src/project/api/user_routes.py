@@ -5,8 +5,11 @@ from fastapi import APIRouter, Depends
 from fastapi import HTTPException
 from fastapi import status
 
-from project.core.exceptions import UserAlreadyExists, UserNameAlreadyExists, UserNotFound, UserTelegramAlreadyExists
+from project.core.exceptions import (
+    InvalidCursor, UserAlreadyExists, UserNameAlreadyExists, UserNotFound, UserTelegramAlreadyExists,
+)
 from project.resource.auth import get_password_hash
+from project.schemas.pagination import Page, PageQuery
 from project.schemas.user import UserCreate, UserSchema
 
 from project.api.depends import database, user_repo, get_current_user, check_for_admin_access
@@ -17,13 +20,16 @@ user_routes = APIRouter()
 
 @user_routes.get(
     "/all_users",
-    response_model=list[UserSchema],
+    response_model=Page[UserSchema],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(check_for_admin_access)],
 )
-async def get_all_users() -> list[UserSchema]:
-    async with database.session() as session:
-        all_users = await user_repo.get_all_users(session=session)
+async def get_all_users(page: PageQuery = Depends()) -> Page[UserSchema]:
+    try:
+        async with database.session() as session:
+            all_users = await user_repo.get_all_users(session=session, page=page)
+    except InvalidCursor as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error.message)
 
     return all_users
 
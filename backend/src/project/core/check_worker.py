@@ -0,0 +1,97 @@
+import asyncio
+import os
+import socket
+from typing import Optional
+
+from project.core.config import settings
+from project.core.exceptions import DatabaseError
+from project.core.gost_service import GostCheckService
+from project.infrastructure.postgres.database import database
+from project.infrastructure.postgres.repository.check_job_repo import JOB_FAILED, KIND_RESCORE, CheckJobRepository
+
+
+class CheckWorker:
+    """Цикл обработки очереди check_jobs.
+
+    Каждый шаг (взять задание, выполнить проверку, отметить итог) идёт в своей сессии БД,
+    не связанной с HTTP-запросом. Неудачная попытка возвращает задание в очередь с задержкой;
+    когда попытки исчерпаны, в проверку записывается ошибка, как раньше.
+    slots — сколько заданий выполняется одновременно (сам разбор идёт в пуле ParsingEngine).
+    """
+
+    def __init__(self, worker_id: Optional[str] = None, jobs: Optional[CheckJobRepository] = None,
+                 slots: int = 1):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.jobs = jobs or CheckJobRepository()
+        self.slots = max(slots, 1)
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Обрабатывает задания в slots циклах, пока не вызван stop()"""
+        print(f"Воркер проверок {self.worker_id} запущен, слотов: {self.slots}")
+        await asyncio.gather(*(self._run_slot(f"{self.worker_id}/{slot}") for slot in range(self.slots)))
+        print(f"Воркер проверок {self.worker_id} остановлен")
+
+    async def _run_slot(self, slot_id: str) -> None:
+        """Цикл одного слота; без заданий ждёт CHECK_WORKER_POLL_INTERVAL_SEC"""
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once(slot_id)
+            except DatabaseError as e:
+                print(f"Воркер проверок {slot_id}: {e.message}")
+                processed = False
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), settings.CHECK_WORKER_POLL_INTERVAL_SEC)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self, slot_id: Optional[str] = None) -> bool:
+        """Берёт и выполняет одно задание; False — очередь пуста"""
+        worker_id = slot_id or self.worker_id
+        async with database.session() as session:
+            job = await self.jobs.claim(session, worker_id, settings.CHECK_JOB_LOCK_TIMEOUT_SEC)
+            job_id, check_id, document_id = (job.job_id, job.check_id, job.document_id) if job else (None,) * 3
+            attempt = job.attempts if job else None
+            rescore = job is not None and job.kind == KIND_RESCORE
+            exhausted = job is not None and job.attempts > job.max_attempts
+        if job_id is None:
+            return False
+
+        if exhausted:
+            # Задание бросали воркеры, упавшие на нём, max_attempts раз — больше не пробуем
+            error = "превышено число попыток обработки"
+        else:
+            error = await self._process(document_id, check_id, rescore)
+
+        async with database.session() as session:
+            if error is None:
+                if not await self.jobs.complete(session, job_id, worker_id, attempt):
+                    print(f"Воркер проверок {worker_id}: задание {job_id} уже перевыдано, итог не записан")
+                return True
+            state = await self.jobs.fail(session, job_id, worker_id, attempt, error,
+                                         settings.CHECK_JOB_RETRY_DELAY_SEC)
+        if state is None:
+            print(f"Воркер проверок {worker_id}: задание {job_id} уже перевыдано, ошибка не записана")
+        elif state == JOB_FAILED:
+            async with database.session() as session:
+                await GostCheckService(session).record_check_failure(document_id, check_id, error)
+        return True
+
+    @staticmethod
+    async def _process(document_id: int, check_id: int, rescore: bool = False) -> Optional[str]:
+        """Выполняет проверку; возвращает текст ошибки или None"""
+        error = None
+        try:
+            async with database.session() as session:
+                try:
+                    await GostCheckService(session).process_gost_check(document_id, check_id, rescore=rescore)
+                except Exception as e:
+                    await session.rollback()
+                    error = str(e)
+        except DatabaseError as e:
+            error = e.message
+        return error
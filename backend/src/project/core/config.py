@@ -15,10 +15,56 @@ class Settings(BaseSettings):
     POSTGRES_USER: SecretStr = 'postgres'
     POSTGRES_PASSWORD: SecretStr = 'postgres'
     POSTGRES_RECONNECT_INTERVAL_SEC: int = 1
+    # Пул соединений процесса (один на процесс: API или воркер)
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT_SEC: float = 30  # сколько ждать свободного соединения
+    POSTGRES_POOL_RECYCLE_SEC: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = True
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100  # кэш подготовленных запросов; 0 — за PgBouncer (transaction)
+    POSTGRES_COMMAND_TIMEOUT_SEC: float = 60
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     SECRET_AUTH_KEY: SecretStr = ''
     AUTH_ALGORITHM: str = ''
 
+    PARSER_POOL_SIZE: int = 2
+    PARSER_MAX_TASKS_PER_CHILD: int = 50
+    PARSER_TIMEOUT_SEC: int = 300
+    PARSER_PDF_SHARD_PAGES: int = 0
+    PARSER_DOCX_BACKEND: str = 'python-docx'  # 'python-docx' или 'xml' (потоковый разбор document.xml)
+
+    UPLOAD_DIR: str = 'uploads'
+    UPLOAD_MAX_SIZE_MB: float = 50
+    UPLOAD_CHUNK_SIZE_KB: int = 1024  # память на одну загрузку ограничена размером блока
+    UPLOAD_RESUMABLE_CHUNK_SIZE_MB: int = 5  # размер части возобновляемой загрузки
+    UPLOAD_CHUNK_LEASE_SEC: float = 600  # сколько часть может передаваться, прежде чем её можно начать заново
+    UPLOAD_SESSION_TTL_HOURS: float = 24  # загрузка без новых частей дольше этого удаляется вместе с файлом
+    UPLOAD_CLEANUP_INTERVAL_SEC: float = 3600
+
+    STORAGE_BACKEND: str = 'local'  # 'local' (UPLOAD_DIR) или 's3' (S3-совместимое, например MinIO)
+    STORAGE_SPOOL_DIR: str = ''  # куда скачивать файлы из S3 для разбора; пусто — системный temp
+    S3_ENDPOINT_URL: str = ''  # например http://minio:9000
+    S3_BUCKET: str = ''
+    S3_ACCESS_KEY: SecretStr = ''
+    S3_SECRET_KEY: SecretStr = ''
+    S3_REGION: str = 'us-east-1'
+    S3_PREFIX: str = 'documents/'
+
+    PAGE_SIZE_DEFAULT: int = 50  # строк на страницу списков (limit по умолчанию)
+    PAGE_SIZE_MAX: int = 200
+    REFERENCE_CACHE_TTL_SEC: float = 300  # как долго процесс доверяет ID справочников без запроса в БД
+
+    GOST_RULES_FILE: str = ''  # пусто — manual_rules.json из пакета gost_checker
+    GOST_RULES_RELOAD_INTERVAL_SEC: float = 5  # как часто проверять, изменился ли файл правил
+
+    CHECK_WORKER_IN_API: bool = True  # обрабатывать очередь проверок в процессе API (без python -m project.worker)
+    CHECK_WORKER_SLOTS: int = 2  # одновременных проверок на процесс воркера
+    CHECK_WORKER_POLL_INTERVAL_SEC: float = 1
+    CHECK_JOB_MAX_ATTEMPTS: int = 3
+    CHECK_JOB_RETRY_DELAY_SEC: float = 30  # задержка повтора растёт с номером попытки
+    CHECK_JOB_LOCK_TIMEOUT_SEC: float = 900  # после этого задание «зависшего» воркера выдаётся снова
+    RESCORE_BATCH_SIZE: int = 500  # документов на транзакцию при постановке переоценки в очередь
+
     @property
     def postgres_url(self) -> str:
         creds = f"{self.POSTGRES_USER.get_secret_value()}:{self.POSTGRES_PASSWORD.get_secret_value()}"
@@ -182,4 +182,40 @@ class MistakeAlreadyExists(BaseException):
 
     def __init__(self, document_id: int, mistake_type_id: int | None) -> None:
         self.message = self._ERROR_MESSAGE_TEMPLATE.format(document_id=document_id, mistake_type_id=mistake_type_id if mistake_type_id is not None else "—")
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+
+class DocumentParsingTimeout(TimeoutError):
+    _ERROR_MESSAGE_TEMPLATE: Final[str] = "Разбор документа '{file_path}' не завершился за {timeout} с"
+
+    def __init__(self, file_path: str, timeout: float) -> None:
+        self.message = self._ERROR_MESSAGE_TEMPLATE.format(file_path=file_path, timeout=timeout)
+        super().__init__(self.message)
+
+class RulesValidationError(ValueError):
+    _ERROR_MESSAGE_TEMPLATE: Final[str] = "Некорректный файл правил '{rules_file}': {message}"
+
+    def __init__(self, rules_file: str, message: str) -> None:
+        self.message = self._ERROR_MESSAGE_TEMPLATE.format(rules_file=rules_file, message=message)
+        super().__init__(self.message)
+
+class UploadTooLarge(ValueError):
+    _ERROR_MESSAGE_TEMPLATE: Final[str] = "Файл '{filename}' больше допустимых {max_size_mb:g} МБ"
+
+    def __init__(self, filename: str, max_size_mb: float) -> None:
+        self.message = self._ERROR_MESSAGE_TEMPLATE.format(filename=filename, max_size_mb=max_size_mb)
+        super().__init__(self.message)
+
+class StorageError(OSError):
+    _ERROR_MESSAGE_TEMPLATE: Final[str] = "Ошибка хранилища файлов для '{location}': {message}"
+
+    def __init__(self, location: str, message: str) -> None:
+        self.message = self._ERROR_MESSAGE_TEMPLATE.format(location=location, message=message)
+        super().__init__(self.message)
+
+class InvalidCursor(BaseException):
+    _ERROR_MESSAGE_TEMPLATE: Final[str] = "Некорректный курсор страницы '{cursor}'"
+
+    def __init__(self, cursor: str) -> None:
+        self.message = self._ERROR_MESSAGE_TEMPLATE.format(cursor=cursor)
+        super().__init__(self.message)
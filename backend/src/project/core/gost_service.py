@@ -1,162 +1,303 @@
 import asyncio
-import json
-from typing import Dict, Any
+import copy
+from typing import Dict, Any, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from project.gost_checker import RuleSeverity
+from project.gost_checker import DocumentCheckReport, RuleSeverity
+from project.core.config import settings
 from project.gost_checker.checker import GOSTDocumentChecker
+from project.gost_checker.parser import PARSER_VERSION
+from project.infrastructure.postgres.repository.check_job_repo import KIND_RESCORE, CheckJobRepository
+from project.infrastructure.postgres.repository.check_rule_result_repo import CheckRuleResultRepository
+from project.infrastructure.postgres.repository.document_features_repo import DocumentFeaturesRepository
 from project.infrastructure.postgres.repository.gost_check_repo import AsyncGostCheckRepository
-from project.infrastructure.postgres.models import Documents, Status
+from project.infrastructure.postgres.models import Check, Documents
+from project.infrastructure.postgres.reference_cache import reference_cache
+from project.infrastructure.storage import storage_for
+
+# Постановки проверок в очередь, идущие в этом процессе: (document_id, версия правил) → check_id
+_starting_checks: Dict[Tuple[int, str], "asyncio.Future[int]"] = {}
 
 
 class GostCheckService:
     def __init__(self, db: AsyncSession):
         self.db: AsyncSession = db
-        self.checker = GOSTDocumentChecker(
-            rules_file="/app/src/project/gost_checker/manual_rules.json"
-        )
+        # Правила берутся из общего реестра (settings.GOST_RULES_FILE), без чтения файла на запрос
+        self.checker = GOSTDocumentChecker()
         self.repository = AsyncGostCheckRepository(db)
+        self.jobs = CheckJobRepository()
+        self.features = DocumentFeaturesRepository()
+        self.rule_results = CheckRuleResultRepository()
+
+    async def start_gost_check(self, document_id: int, force: bool = False) -> int:
+        """Запустить проверку ГОСТ для документа: проверка ставится в очередь check_jobs.
+
+        Если проверка документа по той же версии правил уже ждёт или выполняется,
+        возвращается её check_id — повторный клик не запускает второй разбор.
+        Если файл с тем же содержимым уже проверен по этой версии правил, проверка
+        завершается сразу копией готового отчёта; force — всё равно разобрать файл заново.
+        """
+        key = (document_id, self.checker.rule_checker.version)
+        starting = _starting_checks.get(key)
+        if starting is not None:
+            # Тот же документ уже ставится в очередь в этом процессе — ждём его check_id
+            return await asyncio.shield(starting)
+
+        starting = asyncio.get_running_loop().create_future()
+        _starting_checks[key] = starting
+        try:
+            check_id = await self._start_or_attach(*key, force=force)
+        except BaseException as e:
+            starting.set_exception(e)
+            starting.exception()  # ошибку получает вызывающий, ожидающие — через future
+            raise
+        else:
+            starting.set_result(check_id)
+            return check_id
+        finally:
+            del _starting_checks[key]
+
+    async def _start_or_attach(self, document_id: int, ruleset_version: str, force: bool = False) -> int:
+        # Между процессами: advisory lock на документ до конца транзакции + уникальный индекс
+        # незавершённых заданий как последняя защита
+        standart_id = await self.repository.get_gost_standard_id()
+        await self.jobs.lock_document(self.db, document_id)
+        pending = await self.jobs.find_pending(self.db, document_id, ruleset_version)
+        if pending is not None:
+            await self.db.commit()
+            return pending.check_id
+
+        check = await self.repository.create_gost_check(document_id, standart_id)
+        reusable = None if force else await self._find_reusable_check(document_id, ruleset_version)
+        if reusable is not None:
+            # Копия отчёта и отметка о завершении — в одной транзакции: завершённая проверка
+            # без отчёта не может стать источником для следующей загрузки того же файла
+            await self._reuse_report(document_id, check.check_id, reusable)
+            await self.jobs.add_completed(self.db, check.check_id, document_id, ruleset_version)
+            await self.db.commit()
+            return check.check_id
+
+        try:
+            await self.jobs.enqueue(
+                self.db, check.check_id, document_id,
+                max_attempts=settings.CHECK_JOB_MAX_ATTEMPTS, ruleset_version=ruleset_version
+            )
+            await self._update_document_status(document_id, "Анализируется")
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            pending = await self.jobs.find_pending(self.db, document_id, ruleset_version)
+            if pending is None:
+                raise
+            return pending.check_id
+        return check.check_id
+
+    async def _find_reusable_check(self, document_id: int, ruleset_version: str) -> Optional[Check]:
+        result = await self.db.execute(
+            select(Documents.content_sha256).where(Documents.document_id == document_id)
+        )
+        content_sha256 = result.scalar()
+        if not content_sha256:
+            return None
+        return await self.repository.find_reusable_check(content_sha256, ruleset_version)
+
+    async def _reuse_report(self, document_id: int, check_id: int, source: Check):
+        """Записать в проверку копию отчёта и замечаний проверки source (то же содержимое файла; без commit)"""
+        result = await self.db.execute(select(Documents.filename).where(Documents.document_id == document_id))
+        filename = result.scalar()
+        result_data = copy.deepcopy(source.result or {})
+        report = result_data.setdefault('report', {})
+        report['document_id'] = str(document_id)
+        report['filename'] = filename
+        result_data['reused_from_check_id'] = source.check_id
+        await self.rule_results.save(self.db, check_id, document_id, report.get('results', []))
+        await self.repository.update_check_result(check_id, result_data)
+
+        # Замечания — из результатов отчёта, как при обычной проверке
+        failed = [r for r in report.get('results', []) if not r.get('is_passed')]
+        errors = [r['message'] for r in failed if r.get('severity') == RuleSeverity.CRITICAL.value]
+        warnings = [r['message'] for r in failed if r.get('severity') == RuleSeverity.WARNING.value]
+        await self.repository.create_mistakes(document_id, errors, warnings, replace=True)
+
+        new_status = "Идеален" if result_data.get('is_compliant') else "Отправлен на доработку"
+        await self._update_document_status(document_id, new_status)
+
+    async def process_gost_check(self, document_id: int, check_id: int, rescore: bool = False):
+        """Выполнить проверку ГОСТ (вызывается воркером очереди); ошибки пробрасываются наружу.
+
+        rescore — взять сохранённые признаки, если они подходят текущим правилам, и не разбирать файл.
+        """
+        result = await self.db.execute(
+            select(Documents).where(Documents.document_id == document_id)
+        )
+        document = result.scalars().first()
+        if not document:
+            raise ValueError("Документ не найден")
+
+        ruleset = self.checker.rule_checker.ruleset
+        document_data = await self._stored_features(document_id) if rescore else None
+        if document_data is None:
+            # Признаки сохраняются: после изменения правил документ переоценивается без разбора файла
+            # Разбор идёт по локальному файлу: для S3 — по временной копии
+            async with storage_for(document.filepath).local_copy(document.filepath) as file_path:
+                document_data = await self.checker.extract_features(str(file_path), ruleset)
+            await self.features.save(self.db, document_id, PARSER_VERSION, document_data, ruleset.required_fields)
 
-    async def start_gost_check(self, document_id: int) -> int:
-        """Запустить проверку ГОСТ для документа"""
+        report = self.checker.check_features(document_data, ruleset, str(document_id), document.filename)
+        await self._save_report(document_id, document.filename, check_id, report)
+        await self.db.commit()
+
+    async def _stored_features(self, document_id: int) -> Optional[Dict[str, Any]]:
+        """Сохранённые признаки документа; None — их нет, они извлечены другой версией парсера
+        или в них нет полей, нужных текущим правилам
+        """
+        ruleset = self.checker.rule_checker.ruleset
+        stored = await self.features.get(self.db, document_id)
+        if (stored is None or stored.parser_version != PARSER_VERSION
+                or not ruleset.required_fields <= set(stored.fields)):
+            return None
+        return stored.features
+
+    async def rescore_document(self, document_id: int) -> Optional[int]:
+        """Новая проверка документа по текущим правилам на сохранённых признаках, без разбора файла.
+
+        None — пригодных признаков нет (см. _stored_features): документ нужно проверить заново.
+        """
+        ruleset = self.checker.rule_checker.ruleset
+        features = await self._stored_features(document_id)
+        if features is None:
+            return None
+        result = await self.db.execute(select(Documents.filename).where(Documents.document_id == document_id))
+        filename = result.scalar()
+
+        report = self.checker.check_features(features, ruleset, str(document_id), filename)
+        # Проверка, отчёт и отметка о завершении фиксируются вместе: завершённой проверки без отчёта не бывает
         check = await self.repository.create_gost_check(document_id)
-        await self._update_document_status(document_id, "Анализируется")
-        asyncio.create_task(self._process_gost_check(document_id, check.check_id))
+        await self._save_report(document_id, filename, check.check_id, report)
+        await self.jobs.add_completed(self.db, check.check_id, document_id, ruleset.version)
+        await self.db.commit()
         return check.check_id
 
-    async def _process_gost_check(self, document_id: int, check_id: int):
-        """Асинхронная обработка проверки ГОСТ"""
-        document = None
-        try:
-            result = await self.db.execute(
-                select(Documents).where(Documents.document_id == document_id)
+    async def enqueue_rescore_all(self, batch_size: int) -> Dict[str, int]:
+        """Ставит в очередь переоценку всех документов по текущим правилам.
+
+        Документы идут пачками по batch_size, каждая — одна транзакция из нескольких запросов.
+        Саму переоценку выполняет воркер (задания rescore): по сохранённым признакам, а без них —
+        с разбором файла. Документы, чья проверка по этой версии правил уже ждёт, пропускаются,
+        поэтому повторный вызов после сбоя доставит в очередь только оставшиеся.
+        """
+        ruleset_version = self.checker.rule_checker.version
+        standart_id = await self.repository.get_gost_standard_id()
+        counts = {'documents': 0, 'queued': 0, 'already_pending': 0}
+        after_document_id = 0
+        while True:
+            document_ids = await self.jobs.lock_next_documents(self.db, after_document_id, batch_size)
+            if not document_ids:
+                break
+            after_document_id = document_ids[-1]
+            pending = await self.jobs.find_pending_documents(self.db, document_ids, ruleset_version)
+            checks = await self.repository.create_gost_checks(
+                [document_id for document_id in document_ids if document_id not in pending], standart_id
             )
-            document = result.scalars().first()
-            if not document:
-                raise ValueError("Документ не найден")
-
-            report = await self.checker.check_document(
-                file_path=document.filepath,
-                document_id=str(document_id),
-                original_filename=document.filename
+            counts['queued'] += await self.jobs.enqueue_many(
+                self.db, checks, KIND_RESCORE,
+                max_attempts=settings.CHECK_JOB_MAX_ATTEMPTS, ruleset_version=ruleset_version
             )
+            await self.db.commit()
+            counts['documents'] += len(document_ids)
+            counts['already_pending'] += len(pending)
+        return counts
 
-            # Получаем отчёт и приводим все числовые поля к float/int
-            report_dict = report.to_dict()
-            report_dict['filename'] = document.filename
-            report_dict['passed_checks'] = float(report_dict.get('passed_checks', 0))
-            report_dict['total_checks'] = float(report_dict.get('total_checks', 0))
+    async def _save_report(self, document_id: int, filename: str, check_id: int, report: DocumentCheckReport):
+        """Сохраняет итог проверки (без commit: отчёт, замечания и статус фиксируются вместе).
 
-            passed = report_dict['passed_checks']
-            total = report_dict['total_checks'] if report_dict['total_checks'] != 0 else 1.0
-            raw_score = (passed / total) * 100
-            score = int(round(raw_score))
+        Повтор для той же проверки ничего не дублирует: воркер может выполнить задание ещё раз,
+        если упал до отметки о завершении.
+        """
+        # Получаем отчёт и приводим все числовые поля к float/int
+        report_dict = report.to_dict()
+        report_dict['filename'] = filename
+        report_dict['passed_checks'] = float(report_dict.get('passed_checks', 0))
+        report_dict['total_checks'] = float(report_dict.get('total_checks', 0))
 
-            is_compliant = passed == total
+        passed = report_dict['passed_checks']
+        total = report_dict['total_checks'] if report_dict['total_checks'] != 0 else 1.0
+        raw_score = (passed / total) * 100
+        score = int(round(raw_score))
 
-            result_data = {
-                'is_compliant': is_compliant,
-                'score': score,
-                'report': report_dict
-            }
+        is_compliant = passed == total
 
-            # Сохраняем JSON отчёт и обновляем score в документе
-            await self.repository.update_check_result(check_id, result_data)
-
-            # Сохраняем ошибки и предупреждения
-            errors = [
-                r.message for r in report.get_failed_results()
-                if r.severity == RuleSeverity.CRITICAL
-            ]
-            warnings = [r.message for r in report.get_warning_issues()]
-            await self.repository.create_mistakes(document_id, errors, warnings)
-
-            new_status = "Идеален" if is_compliant else "Отправлен на доработку"
-            await self._update_document_status(document_id, new_status)
-
-        except Exception as e:
-            print(f"Ошибка при проверке ГОСТ документа {document_id}: {str(e)}")
-            # Дефолтный результат при ошибке
-            result_data = {
-                'is_compliant': False,
-                'score': 0,
-                'report': {
-                    'results': [{'message': f'Системная ошибка: {str(e)}', 'severity': 'critical'}],
-                    'total_checks': 1,
-                    'passed_checks': 0,
-                    'filename': document.filename if document else "unknown"
-                }
-            }
-            await self.repository.update_check_result(check_id, result_data)
-            await self.repository.create_mistakes(document_id, [str(e)], [])
-            await self._update_document_status(document_id, "Ошибка")
+        result_data = {
+            'is_compliant': is_compliant,
+            'score': score,
+            'report': report_dict
+        }
 
-    async def _update_document_status(self, document_id: int, status_name: str):
-        result = await self.db.execute(select(Status).where(Status.status_name == status_name))
-        status_obj = result.scalars().first()
-        if not status_obj:
-            status_obj = Status(status_name=status_name)
-            self.db.add(status_obj)
-            await self.db.commit()
-            await self.db.refresh(status_obj)
+        # Сохраняем JSON отчёт, построчные результаты правил и обновляем score в документе
+        await self.rule_results.save(self.db, check_id, document_id, report_dict['results'])
+        await self.repository.update_check_result(check_id, result_data)
 
+        # Сохраняем ошибки и предупреждения (вместо замечаний прошлой проверки документа)
+        errors = [
+            r.message for r in report.get_failed_results()
+            if r.severity == RuleSeverity.CRITICAL
+        ]
+        warnings = [r.message for r in report.get_warning_issues()]
+        await self.repository.create_mistakes(document_id, errors, warnings, replace=True)
+
+        new_status = "Идеален" if is_compliant else "Отправлен на доработку"
+        await self._update_document_status(document_id, new_status)
+
+    async def record_check_failure(self, document_id: int, check_id: int, error: str):
+        """Сохранить результат проверки, которая не удалась (попытки исчерпаны)"""
+        print(f"Ошибка при проверке ГОСТ документа {document_id}: {error}")
         result = await self.db.execute(select(Documents).where(Documents.document_id == document_id))
         document = result.scalars().first()
-        if document:
-            document.status_id = status_obj.status_id
-            await self.db.commit()
+        # Дефолтный результат при ошибке
+        result_data = {
+            'is_compliant': False,
+            'score': 0,
+            'report': {
+                'results': [{'message': f'Системная ошибка: {error}', 'severity': 'critical'}],
+                'total_checks': 1,
+                'passed_checks': 0,
+                'filename': document.filename if document else "unknown"
+            }
+        }
+        await self.repository.update_check_result(check_id, result_data)
+        await self.repository.create_mistakes(document_id, [error], [], replace=True)
+        await self._update_document_status(document_id, "Ошибка")
+        await self.db.commit()
+
+    async def _update_document_status(self, document_id: int, status_name: str):
+        status_id = await reference_cache.status_id(self.db, status_name)
+        await self.db.execute(
+            update(Documents).where(Documents.document_id == document_id).values(status_id=status_id)
+        )
 
     async def get_check_result(self, check_id: int) -> Dict[str, Any]:
-        check = await self.repository.get_check_by_id(check_id)
-        if not check:
+        summary = await self.repository.get_check_summary(check_id)
+        if not summary:
             return {}
 
-        result = await self.db.execute(select(Documents).where(Documents.document_id == check.document_id))
-        document = result.scalars().first()
-        filename = document.filename if document else "unknown"
-
-        result_data = {}
-        report = {}
-        errors = []
-        warnings = []
-
-        try:
-            if check.result:
-                result_data = json.loads(check.result)
-            report = result_data.get('report', {})
-            # Приводим все числовые поля к float/int
-            report['passed_checks'] = float(report.get('passed_checks', 0))
-            report['total_checks'] = float(report.get('total_checks', 0))
-            errors = [
-                r.get('message', 'Неизвестная ошибка')
-                for r in report.get('results', [])
-                if r.get('severity') == 'critical'
-            ]
-            warnings = [
-                r.get('message', 'Неизвестное замечание')
-                for r in report.get('results', [])
-                if r.get('severity') == 'warning'
-            ]
-        except json.JSONDecodeError as e:
-            print(f"Ошибка парсинга результата проверки {check_id}: {str(e)}")
-            errors = ["Ошибка чтения отчёта из БД"]
-
-        score = result_data.get('score', 0)
-        if document and document.score is not None:
-            score = float(document.score)
+        score = summary['score'] or 0
+        if summary['document_score'] is not None:
+            score = float(summary['document_score'])
 
         return {
-            'check_id': int(check.check_id),
-            'document_id': int(check.document_id),
-            'filename': filename,
-            'status': "Идеален" if result_data.get('is_compliant') else "Требует доработки",
+            'check_id': int(summary['check_id']),
+            'document_id': int(summary['document_id']),
+            'user_id': summary['user_id'],
+            'filename': summary['filename'] or "unknown",
+            'status': "Идеален" if summary['is_compliant'] else "Требует доработки",
             'score': score,
-            'checked_at': check.checked_at.isoformat() if check.checked_at else None,
-            'errors': errors,
-            'warnings': warnings,
-            'is_compliant': result_data.get('is_compliant', False),
-            'total_checks': report.get('total_checks', 0),
-            'passed_checks': report.get('passed_checks', 0)
+            'checked_at': summary['checked_at'].isoformat() if summary['checked_at'] else None,
+            'errors': summary['errors'] or [],
+            'warnings': summary['warnings'] or [],
+            'is_compliant': summary['is_compliant'] or False,
+            'total_checks': float(summary['total_checks'] or 0),
+            'passed_checks': float(summary['passed_checks'] or 0)
         }
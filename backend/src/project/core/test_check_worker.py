@@ -0,0 +1,52 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from project.core import check_worker
+from project.core.check_worker import CheckWorker
+
+
+class _Jobs:
+    """Задание выдано воркеру, но пока он работал, его перевыдали другому"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def claim(self, session, worker_id, lock_timeout):
+        return SimpleNamespace(job_id=7, check_id=70, document_id=700, attempts=1, max_attempts=1, kind="check")
+
+    async def complete(self, session, job_id, worker_id, attempt):
+        self.calls.append(("complete", job_id, worker_id, attempt))
+        return False
+
+    async def fail(self, session, job_id, worker_id, attempt, error, retry_delay):
+        self.calls.append(("fail", job_id, worker_id, attempt))
+        return None
+
+
+def test_stale_worker_does_not_record_result_of_reclaimed_job(monkeypatch):
+    @asynccontextmanager
+    async def session():
+        yield None
+
+    failures = []
+
+    class _Service:
+        def __init__(self, session):
+            pass
+
+        async def record_check_failure(self, *args):
+            failures.append(args)
+
+    monkeypatch.setattr(check_worker.database, "session", session)
+    monkeypatch.setattr(check_worker, "GostCheckService", _Service)
+    jobs = _Jobs()
+    worker = CheckWorker(worker_id="host:1", jobs=jobs)
+
+    async def process(document_id, check_id, rescore=False):
+        return "ошибка разбора"
+
+    monkeypatch.setattr(worker, "_process", process)
+    assert asyncio.run(worker.run_once("host:1/0")) is True
+    assert jobs.calls == [("fail", 7, "host:1/0", 1)]
+    assert failures == []
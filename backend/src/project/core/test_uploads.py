@@ -0,0 +1,56 @@
+import asyncio
+import hashlib
+import io
+import os
+import time
+
+import pytest
+from fastapi import UploadFile
+
+from project.core.exceptions import UploadTooLarge
+from project.core.uploads import file_sha256, remove_stale_files, save_upload, write_chunk
+
+
+def test_upload_is_streamed_and_hashed(tmp_path):
+    content = b"%PDF" * 100_000
+    stored = asyncio.run(save_upload(UploadFile(io.BytesIO(content), filename="a.pdf"), tmp_path / "a.pdf",
+                                     chunk_size=4096))
+    assert stored.size == len(content) and stored.sha256 == hashlib.sha256(content).hexdigest()
+    assert (tmp_path / "a.pdf").read_bytes() == content
+
+
+def test_oversized_upload_leaves_no_files(tmp_path):
+    upload = UploadFile(io.BytesIO(b"x" * 10_000), filename="big.pdf")
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(save_upload(upload, tmp_path / "big.pdf", max_size=5_000, chunk_size=1024))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_resumable_chunks_are_appended_and_retried(tmp_path):
+    async def stream(*parts):
+        for part in parts:
+            yield part
+
+    async def upload():
+        path = tmp_path / ".partial" / "u.part"
+        assert await write_chunk(stream(b"abc", b"d"), path, 0, 4) == 4
+        assert await write_chunk(stream(b"ef"), path, 4, 4) == 2  # обрыв посреди части
+        assert await write_chunk(stream(b"efgh"), path, 4, 4) == 4  # повтор с того же offset
+        with pytest.raises(ValueError):
+            await write_chunk(stream(b"ijklm"), path, 8, 4)
+        assert path.read_bytes() == b"abcdefgh"
+        assert await file_sha256(path, chunk_size=3) == hashlib.sha256(b"abcdefgh").hexdigest()
+
+    asyncio.run(upload())
+
+
+def test_stale_partial_files_are_removed(tmp_path):
+    stale, fresh = tmp_path / "old.part", tmp_path / "new.part"
+    stale.write_bytes(b"a")
+    fresh.write_bytes(b"b")
+    day_ago = time.time() - 24 * 3600
+    os.utime(stale, (day_ago, day_ago))
+
+    assert remove_stale_files(tmp_path, 3600) == 1
+    assert not stale.exists() and fresh.exists()
+    assert remove_stale_files(tmp_path / "missing", 3600) == 0
@@ -0,0 +1,142 @@
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+import anyio
+from fastapi import UploadFile
+
+from project.core.config import settings
+from project.core.exceptions import DatabaseError, UploadTooLarge
+from project.infrastructure.postgres.database import database
+from project.infrastructure.postgres.repository.upload_session_repo import UploadSessionRepository
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    path: Path
+    size: int
+    sha256: str
+
+
+async def save_upload(upload: UploadFile, destination: Path, max_size: Optional[int] = None,
+                      chunk_size: Optional[int] = None) -> StoredUpload:
+    """Сохраняет загруженный файл блоками, попутно считая размер и SHA-256.
+
+    Пишется во временный файл рядом с destination и переименовывается только после полной записи,
+    поэтому по пути destination никогда не лежит недописанный файл. Превышение max_size (байт)
+    прерывает загрузку сразу, временный файл удаляется.
+    """
+    max_size = max_size if max_size is not None else int(settings.UPLOAD_MAX_SIZE_MB * 1024 * 1024)
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE_KB * 1024
+    # Размер из заголовков multipart известен заранее — отказываем, не читая тело
+    if upload.size is not None and upload.size > max_size:
+        raise UploadTooLarge(upload.filename, max_size / 1024 / 1024)
+
+    await anyio.Path(destination.parent).mkdir(parents=True, exist_ok=True)
+    temp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex[:8]}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with await anyio.open_file(temp_path, "wb") as buffer:
+            while chunk := await upload.read(chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLarge(upload.filename, max_size / 1024 / 1024)
+                digest.update(chunk)
+                await buffer.write(chunk)
+        await anyio.to_thread.run_sync(os.replace, temp_path, destination)
+    except BaseException:
+        await anyio.Path(temp_path).unlink(missing_ok=True)
+        raise
+    return StoredUpload(path=destination, size=size, sha256=digest.hexdigest())
+
+
+async def write_chunk(chunks: AsyncIterator[bytes], path: Path, offset: int, max_bytes: int) -> int:
+    """Записывает часть возобновляемой загрузки с позиции offset, не собирая её в памяти.
+
+    Всё, что лежало в файле после offset (недописанная прошлая попытка), отбрасывается.
+    Возвращает число записанных байт; больше max_bytes — ValueError.
+    """
+    await anyio.Path(path.parent).mkdir(parents=True, exist_ok=True)
+    mode = "r+b" if await anyio.Path(path).exists() else "wb"
+    written = 0
+    async with await anyio.open_file(path, mode) as buffer:
+        await buffer.seek(offset)
+        await buffer.truncate()
+        async for chunk in chunks:
+            written += len(chunk)
+            if written > max_bytes:
+                await buffer.truncate(offset)
+                raise ValueError(f"Часть больше ожидаемых {max_bytes} байт")
+            await buffer.write(chunk)
+    return written
+
+
+async def file_sha256(path: Path, chunk_size: Optional[int] = None) -> str:
+    """SHA-256 файла, читаемого блоками"""
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE_KB * 1024
+    digest = hashlib.sha256()
+    async with await anyio.open_file(path, "rb") as buffer:
+        while chunk := await buffer.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def move_into_place(source: Path, destination: Path) -> None:
+    """Атомарно переносит собранный файл (source и destination — в одной файловой системе)"""
+    await anyio.Path(destination.parent).mkdir(parents=True, exist_ok=True)
+    await anyio.to_thread.run_sync(os.replace, source, destination)
+
+
+def staging_dir() -> Path:
+    """Недокачанные файлы лежат в UPLOAD_DIR/.partial: из той же файловой системы перенос атомарен"""
+    return Path(settings.UPLOAD_DIR) / ".partial"
+
+
+def remove_stale_files(directory: Path, older_than_sec: float) -> int:
+    """Удаляет файлы directory, не менявшиеся дольше older_than_sec; возвращает их число"""
+    cutoff = time.time() - older_than_sec
+    removed = 0
+    if not directory.is_dir():
+        return removed
+    for path in directory.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+async def remove_expired_uploads(uploads: Optional[UploadSessionRepository] = None) -> int:
+    """Удаляет брошенные возобновляемые загрузки и их .part-файлы.
+
+    Загрузка брошена, если новых частей не было UPLOAD_SESSION_TTL_HOURS. Заодно удаляются
+    файлы staging_dir() того же возраста без сессии (обычная загрузка, прерванная падением процесса).
+    """
+    uploads = uploads or UploadSessionRepository()
+    ttl_sec = settings.UPLOAD_SESSION_TTL_HOURS * 3600
+    async with database.session() as session:
+        temp_paths = await uploads.delete_expired(session, datetime.now() - timedelta(seconds=ttl_sec))
+    for temp_path in temp_paths:
+        await anyio.Path(temp_path).unlink(missing_ok=True)
+    return len(temp_paths) + await anyio.to_thread.run_sync(remove_stale_files, staging_dir(), ttl_sec)
+
+
+async def run_upload_cleanup() -> None:
+    """Раз в UPLOAD_CLEANUP_INTERVAL_SEC удаляет брошенные загрузки (до отмены задачи)"""
+    while True:
+        try:
+            removed = await remove_expired_uploads()
+            if removed:
+                print(f"Удалено брошенных загрузок: {removed}")
+        except (DatabaseError, OSError) as e:
+            print(f"Очистка загрузок: {getattr(e, 'message', e)}")
+        await asyncio.sleep(settings.UPLOAD_CLEANUP_INTERVAL_SEC)
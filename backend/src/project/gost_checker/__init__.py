@@ -11,12 +11,16 @@
 - PDFReportGenerator: Генератор PDF отчетов
 - GOSTRule: Модель правила ГОСТ
 - GOSTRuleChecker: Проверщик по правилам
+- ParsingEngine: Пул процессов для разбора документов
+- RuleRegistry: Общий для процесса реестр скомпилированных правил
 """
 
 # Импортируем основные классы
 from .checker import GOSTDocumentChecker
 from .models import CheckResult, DocumentCheckReport, RuleSeverity, RuleType, GOSTRule
 from .rule_checker import GOSTRuleChecker, ValidationResult
+from .engine import ParsingEngine, get_parsing_engine
+from .registry import RuleRegistry, RuleSet, get_rule_registry
 
 # Для обратной совместимости создаем алиасы
 DocumentChecker = GOSTDocumentChecker
@@ -29,6 +33,11 @@ __all__ = [
     "GOSTDocumentChecker",
     "GOSTRuleChecker",
     "ValidationResult",
+    "ParsingEngine",
+    "get_parsing_engine",
+    "RuleRegistry",
+    "RuleSet",
+    "get_rule_registry",
     
     # Модели данных
     "CheckResult",
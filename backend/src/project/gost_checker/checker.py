@@ -2,45 +2,42 @@ from typing import Dict, List, Any, Optional
 import json
 from datetime import datetime
 from .models import DocumentCheckReport, CheckResult, RuleSeverity
-from .parser import extract_document_data
+from .engine import ParsingEngine, get_parsing_engine
+from .registry import RuleSet
 from .rule_checker import GOSTRuleChecker, ValidationResult
 
 class GOSTDocumentChecker:
-    def __init__(self, rules_file: str = None):
+    def __init__(self, rules_file: str = None, parsing_engine: Optional[ParsingEngine] = None):
         """Инициализирует проверщик документов"""
-        try:
-            self.rule_checker = GOSTRuleChecker(rules_file)
-            print(f"✅ Проверщик ГОСТ инициализирован. Загружено правил: {len(self.rule_checker.get_all_rules())}")
-        except Exception as e:
-            print(f"❌ Ошибка инициализации проверщика: {e}")
-            raise
+        self.parsing_engine = parsing_engine or get_parsing_engine()
+        # Правила общие для процесса (реестр), создание проверщика их не перечитывает
+        self.rule_checker = GOSTRuleChecker(rules_file)
     
     async def check_document(self, file_path: str, document_id: str = None, original_filename: str = None) -> DocumentCheckReport:
         """Основной метод проверки документа"""
         print(f"🔍 Начинаю проверку документа {document_id or 'без ID'} ({original_filename or 'без имени'})...")
-        document_data = await extract_document_data(file_path)
+        # Один снимок правил на всю проверку: по нему выбираются признаки и выполняются проверки
+        ruleset = self.rule_checker.ruleset
+        document_data = await self.extract_features(file_path, ruleset)
+        return self.check_features(document_data, ruleset, document_id, original_filename)
+
+    async def extract_features(self, file_path: str, ruleset: Optional[RuleSet] = None) -> Dict[str, Any]:
+        """Разбирает файл; извлекаются только признаки, нужные активным правилам"""
+        ruleset = ruleset or self.rule_checker.ruleset
+        return await self.parsing_engine.parse(file_path, fields=set(ruleset.required_fields))
 
+    def check_features(self, document_data: Dict[str, Any], ruleset: Optional[RuleSet] = None,
+                       document_id: str = None, original_filename: str = None) -> DocumentCheckReport:
+        """Проверяет уже извлечённые признаки (без разбора файла) и собирает отчёт"""
+        ruleset = ruleset or self.rule_checker.ruleset
         all_results = []
         
         try:
             # Проверяем все правила
-            validation_results = self.rule_checker.check_all_rules(document_data)
+            validation_results = self.rule_checker.check_all_rules(document_data, ruleset)
             
             # Конвертируем ValidationResult в CheckResult
-            for result in validation_results:
-                check_result = CheckResult(
-                    rule_id=result.rule_id,
-                    section=result.rule_title.split('-')[0] if '-' in result.rule_title else result.rule_title,
-                    title=result.rule_title,
-                    severity=RuleSeverity(result.severity.value),
-                    is_passed=result.is_passed,
-                    message=result.message,
-                    expected_value=result.expected,
-                    actual_value=result.actual,
-                    details={"suggestion": result.suggestion} if result.suggestion else None,
-                    suggestion=result.suggestion
-                )
-                all_results.append(check_result)
+            all_results.extend(self._to_check_result(result) for result in validation_results)
             
         except Exception as e:
             print(f"❌ Ошибка при проверке документа: {e}")
@@ -81,7 +78,8 @@ class GOSTDocumentChecker:
             critical_issues=critical_issues,
             warning_issues=warning_issues,
             results=all_results,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            ruleset_version=ruleset.version
         )
         
         return report
@@ -110,43 +108,31 @@ class GOSTDocumentChecker:
     
     def check_specific_section(self, document_data: Dict, section: str) -> List[CheckResult]:
         """Проверяет конкретный раздел документа"""
-        all_rules = self.rule_checker.get_all_rules()
-        section_rules = [rule for rule in all_rules.values() if rule['section'] == section]
-        
-        results = []
-        for rule in section_rules:
-            # Применяем правило к данным документа
-            result = self._apply_single_rule(rule, document_data)
-            if result:
-                results.append(result)
-        
-        return results
+        ruleset = self.rule_checker.ruleset
+        return [
+            self._to_check_result(compiled.evaluate(document_data))
+            for compiled in ruleset.compiled if compiled.rule['section'] == section
+        ]
     
     def _apply_single_rule(self, rule: Dict, document_data: Dict) -> Optional[CheckResult]:
         """Применяет одно правило к данным документа"""
-        field = rule.get('field')
-        if not field:
+        if not rule.get('field'):
             return None
-        
-        # Получаем значение из документа
-        actual_value = document_data.get(field)
-        expected_value = rule.get('expected_value')
-        check_type = rule.get('check_type')
-        
-        # Здесь должна быть логика проверки в зависимости от check_type
-        # Для простоты возвращаем заглушку
-        is_passed = False
-        message = f"Проверка поля '{field}' не реализована для типа '{check_type}'"
-        
+        return self._to_check_result(self.rule_checker.check_rule(rule, document_data))
+    
+    @staticmethod
+    def _to_check_result(result: ValidationResult) -> CheckResult:
         return CheckResult(
-            rule_id=rule['id'],
-            section=rule['section'],
-            title=rule['title'],
-            severity=RuleSeverity(rule['severity']),
-            is_passed=is_passed,
-            message=message,
-            expected_value=expected_value,
-            actual_value=actual_value
+            rule_id=result.rule_id,
+            section=result.rule_title.split('-')[0] if '-' in result.rule_title else result.rule_title,
+            title=result.rule_title,
+            severity=RuleSeverity(result.severity.value),
+            is_passed=result.is_passed,
+            message=result.message,
+            expected_value=result.expected,
+            actual_value=result.actual,
+            details={"suggestion": result.suggestion} if result.suggestion else None,
+            suggestion=result.suggestion
         )
     
     def get_rules_summary(self) -> Dict:
@@ -188,5 +174,7 @@ class GOSTDocumentChecker:
             critical_issues=data['critical_issues'],
             warning_issues=data['warning_issues'],
             results=results,
-            timestamp=data['timestamp']
+            timestamp=data['timestamp'],
+            filename=data.get('filename'),
+            ruleset_version=data.get('ruleset_version')
         )
\ No newline at end of file
@@ -0,0 +1,20 @@
+import pytest
+
+
+def _chars(text, x0, y0, size=14, fontname="ABCDEF+TimesNewRoman-Bold"):
+    chars = []
+    x = x0
+    for ch in text:
+        width = size * 0.5
+        chars.append({
+            "text": ch, "x0": x, "x1": x + width, "y0": y0, "y1": y0 + size,
+            "size": size, "fontname": fontname,
+        })
+        x += width
+    return chars
+
+
+@pytest.fixture
+def make_chars():
+    """Символы строки в формате pdfplumber, моноширинные шириной в полкегля"""
+    return _chars
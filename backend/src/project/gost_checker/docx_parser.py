@@ -0,0 +1,170 @@
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from docx import Document as DocxDocument
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.shared import Length
+from lxml import etree
+
+from .docx_styles import StyleResolver, effective_run_formats, line_spacing
+from .features import FeatureSet
+
+TITLE_PAGE_KEYWORDS = ["курсовая работа", "дипломная работа", "студент", "преподаватель",
+                       "университет", "факультет", "москва", "год"]
+MARGIN_SIDES = ("left", "right", "top", "bottom")
+
+
+@dataclass
+class DocxParagraph:
+    """Непустой абзац DOCX: только атрибуты, которые нужны правилам.
+
+    Форматирование — эффективное, с учётом стилей (StyleResolver); значения в единицах
+    python-docx (Length для интервала «точно»/«не менее» и отступа).
+    """
+    text: str
+    style_name: str = ""
+    bold: bool = False  # хотя бы один run абзаца жирный
+    fonts: List[str] = field(default_factory=list)  # по одному значению на run
+    sizes: List[float] = field(default_factory=list)  # pt
+    line_spacing: Optional[float] = None
+    first_line_indent: Optional[Length] = None
+
+
+class DocxAggregates:
+    """Накопительные агрегаты по абзацам DOCX, общие для разбора через python-docx и через XML"""
+
+    def __init__(self, features: FeatureSet = FeatureSet()) -> None:
+        self.features = features
+        self.fonts: List[str] = []
+        self.sizes: List[float] = []
+        self.line_spacings: List[float] = []
+        self.indents: List[float] = []
+        self.texts: List[str] = []
+        self.word_count = 0
+        self.required: Dict[str, None] = {}  # упорядоченное множество структурных элементов
+        self.has_chapters = False
+        self.intro_started = False
+        self.intro_text: List[str] = []
+        self.para_num = 0
+
+    @property
+    def detect_headings(self) -> bool:
+        return self.features.structure or self.features.introduction
+
+    def add(self, para: DocxParagraph) -> None:
+        features = self.features
+        para_num = self.para_num
+        self.para_num += 1
+        text = para.text
+        if features.text:
+            self.texts.append(text)
+            self.word_count += len(text.split())
+
+        lower_text = text.lower()
+        if self.detect_headings:
+            # Структура: heading styles или эвристика (большой шрифт, жирный, центрированный, паттерн)
+            is_heading = para.style_name.startswith("Heading") or para.bold or len(
+                text) < 50 and text.isupper() or re.match(r"^\d+\.?\s", lower_text)
+            if is_heading:
+                cleaned = re.sub(r'^\d+\.?\s*', '', lower_text)  # убрать номера
+                self.required.setdefault(cleaned)
+                if re.match(r'^\d+\.', lower_text):  # глава
+                    self.has_chapters = True
+
+                # Конец введения если следующий заголовок после "введение"
+                if self.intro_started and cleaned not in ["введение"]:
+                    self.intro_started = False
+
+        # Титульный лист: ключевые слова на первой странице (первые 50 параграфов)
+        if features.structure and para_num < 50 and any(keyword in lower_text for keyword in TITLE_PAGE_KEYWORDS):
+            self.required.setdefault("титульный лист")
+
+        # Введение: собираем текст после "введение" до следующего заголовка
+        if features.introduction:
+            if "введение" in lower_text:
+                self.intro_started = True
+            if self.intro_started:
+                self.intro_text.append(text)
+
+        # Форматирование
+        if features.fonts:
+            self.fonts.extend(para.fonts)
+            self.sizes.extend(para.sizes)
+            if para.line_spacing:
+                self.line_spacings.append(para.line_spacing)
+        if features.indent:
+            first_line_indent = para.first_line_indent
+            if first_line_indent and first_line_indent.cm > 0:  # только положительные
+                self.indents.append(first_line_indent.cm)  # в см
+
+    def fill(self, data: Dict[str, Any], section_count: int,
+             margins: Optional[Dict[str, Optional[Length]]]) -> Dict[str, Any]:
+        """Записывает итоговые значения; margins — поля первой секции (None, если секций нет)"""
+        data["page_count"] = section_count  # приблизительно, по секциям
+        data["full_text"] = "".join(text + " " for text in self.texts)
+        data["word_count"] = self.word_count
+        data["introduction_text"] = " ".join(self.intro_text)
+
+        # Аггрегируем (берём самый частый)
+        fonts, sizes, line_spacings, indents = self.fonts, self.sizes, self.line_spacings, self.indents
+        data["font_settings"]["font_family"] = max(Counter(fonts).items(), key=lambda x: x[1])[0] if fonts else None
+        data["font_settings"]["font_size"] = round(
+            max(Counter(sizes).items(), key=lambda x: x[1])[0]) if sizes else None
+        data["font_settings"]["line_spacing"] = round(max(Counter(line_spacings).items(), key=lambda x: x[1])[0],
+                                                      1) if line_spacings else None
+        data["paragraph_indent"] = round(max(Counter(indents).items(), key=lambda x: x[1])[0], 2) if indents else None
+
+        # Поля (из первой секции)
+        if self.features.margins and margins is not None:
+            data["page_margins"] = {
+                side: round(margins[side].mm, 1) if margins[side] else None for side in MARGIN_SIDES
+            }
+
+        data["required_elements"] = list(self.required)
+        # Добавить "основная часть" если есть главы
+        if self.has_chapters:
+            data["required_elements"].append("основная часть")
+
+        return data
+
+
+def parse_docx(file_path: str, data: Dict[str, Any], features: FeatureSet = FeatureSet()) -> Dict[str, Any]:
+    """Разбор DOCX через объектную модель python-docx; извлекаются только нужные признаки"""
+    doc = DocxDocument(file_path)
+    aggregates = DocxAggregates(features)
+    resolver = docx_style_resolver(doc) if features.fonts or features.indent else None
+
+    paragraphs = doc.paragraphs if features.needs_content else []
+    for para in paragraphs:
+        text = para.text.strip()
+        if not text:
+            continue
+        record = DocxParagraph(text=text)
+        if aggregates.detect_headings:
+            record.style_name = para.style.name
+            record.bold = any(run.bold for run in para.runs)
+        if resolver is not None:
+            paragraph = resolver.paragraph(para._p.pPr)
+            if features.fonts:
+                record.fonts, record.sizes = effective_run_formats(resolver, paragraph, (run._r for run in para.runs))
+                record.line_spacing = line_spacing(paragraph)
+            if features.indent:
+                record.first_line_indent = paragraph.get("indent")
+        aggregates.add(record)
+
+    margins = None
+    if doc.sections:
+        s = doc.sections[0]
+        margins = {"left": s.left_margin, "right": s.right_margin, "top": s.top_margin, "bottom": s.bottom_margin}
+    return aggregates.fill(data, len(doc.sections), margins)
+
+
+def docx_style_resolver(doc) -> StyleResolver:
+    """StyleResolver по стилям и теме документа python-docx"""
+    try:
+        theme = etree.fromstring(doc.part.part_related_by(RT.THEME).blob)
+    except KeyError:
+        theme = None
+    return StyleResolver(doc.styles.element, theme)
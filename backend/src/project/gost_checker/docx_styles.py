@@ -0,0 +1,174 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.oxml.simpletypes import ST_HpsMeasure, ST_OnOff, ST_SignedTwipsMeasure, ST_TwipsMeasure
+from docx.shared import Length, Pt
+from docx.styles import BabelFish
+from lxml import etree
+
+# Свойства форматирования: font (гарнитура), size (pt), line + line_rule (интервал), indent (первая строка)
+Properties = Dict[str, Any]
+
+W_VAL = qn("w:val")
+A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+PARAGRAPH = WD_STYLE_TYPE.PARAGRAPH.xml_value
+CHARACTER = WD_STYLE_TYPE.CHARACTER.xml_value
+_THEME_SCRIPTS = {"Ascii": "latin", "HAnsi": "latin", "EastAsia": "ea", "Bidi": "cs"}
+
+
+class StyleResolver:
+    """Эффективное форматирование DOCX с учётом наследования стилей.
+
+    Цепочка basedOn каждого стиля разворачивается один раз и кэшируется по styleId;
+    для абзаца и run остаётся наложить прямое форматирование на готовые свойства стиля.
+    Порядок наложения: docDefaults → стиль абзаца → стиль символов run → прямое форматирование.
+    """
+
+    def __init__(self, styles: etree._Element, theme: Optional[etree._Element] = None):
+        self._theme_fonts = _theme_fonts(theme)
+        self._styles: Dict[str, etree._Element] = {}
+        self._default_paragraph: Optional[etree._Element] = None
+        for style in styles.iterchildren(qn("w:style")):
+            style_id = style.get(qn("w:styleId"))
+            if style_id is not None and style_id not in self._styles:
+                self._styles[style_id] = style
+            default = style.get(qn("w:default"))
+            if style.get(qn("w:type")) == PARAGRAPH and default is not None and ST_OnOff.convert_from_xml(default):
+                self._default_paragraph = style  # по спецификации — последний по порядку
+
+        defaults = styles.find(qn("w:docDefaults"))
+        self._defaults: Properties = {}
+        if defaults is not None:
+            self._defaults.update(self._layer(defaults.find(qn("w:pPrDefault") + "/" + qn("w:pPr"))))
+            self._defaults.update(self._layer(defaults.find(qn("w:rPrDefault") + "/" + qn("w:rPr"))))
+        self._chains: Dict[str, Properties] = {}
+        self._paragraph_styles: Dict[Optional[str], Properties] = {}
+
+    def _style(self, style_id: Optional[str], style_type: str) -> Optional[etree._Element]:
+        style = self._styles.get(style_id) if style_id else None
+        if style is None or style.get(qn("w:type")) != style_type:
+            return self._default_paragraph if style_type == PARAGRAPH else None
+        return style
+
+    def style_name(self, style_id: Optional[str]) -> Optional[str]:
+        """Имя стиля абзаца как в python-docx (para.style.name)"""
+        style = self._style(style_id, PARAGRAPH)
+        name = style.find(qn("w:name")) if style is not None else None
+        if name is None or name.get(W_VAL) is None:
+            return None
+        return BabelFish.internal2ui(name.get(W_VAL))
+
+    def _chain(self, style: etree._Element) -> Properties:
+        """Свойства стиля вместе с унаследованными по basedOn (без docDefaults), с кэшем"""
+        style_id = style.get(qn("w:styleId"))
+        cached = self._chains.get(style_id)
+        if cached is not None:
+            return cached
+        self._chains[style_id] = {}  # защита от циклов basedOn
+        properties: Properties = {}
+        based_on = style.find(qn("w:basedOn"))
+        parent = self._styles.get(based_on.get(W_VAL)) if based_on is not None else None
+        if parent is not None and parent.get(qn("w:type")) == style.get(qn("w:type")):
+            properties.update(self._chain(parent))
+        properties.update(self._layer(style.find(qn("w:pPr"))))
+        properties.update(self._layer(style.find(qn("w:rPr"))))
+        self._chains[style_id] = properties
+        return properties
+
+    def paragraph_style(self, style_id: Optional[str]) -> Properties:
+        """Свойства абзаца без прямого форматирования: docDefaults + цепочка стиля абзаца"""
+        cached = self._paragraph_styles.get(style_id)
+        if cached is None:
+            cached = dict(self._defaults)
+            style = self._style(style_id, PARAGRAPH)
+            if style is not None:
+                cached.update(self._chain(style))
+            self._paragraph_styles[style_id] = cached
+        return cached
+
+    def paragraph(self, p_pr: Optional[etree._Element]) -> Properties:
+        """Эффективные свойства абзаца по его w:pPr"""
+        style = p_pr.find(qn("w:pStyle")) if p_pr is not None else None
+        base = self.paragraph_style(style.get(W_VAL) if style is not None else None)
+        direct = self._layer(p_pr)
+        return {**base, **direct} if direct else base
+
+    def run(self, paragraph: Properties, r_pr: Optional[etree._Element]) -> Properties:
+        """Эффективные свойства run: свойства абзаца + стиль символов + прямое форматирование"""
+        if r_pr is None:
+            return paragraph
+        properties = paragraph
+        style = r_pr.find(qn("w:rStyle"))
+        char_style = self._style(style.get(W_VAL), CHARACTER) if style is not None else None
+        if char_style is not None:
+            properties = {**properties, **self._chain(char_style)}
+        direct = self._layer(r_pr)
+        return {**properties, **direct} if direct else properties
+
+    def _layer(self, props: Optional[etree._Element]) -> Properties:
+        """Свойства, заданные в одном w:pPr или w:rPr (без наследования)"""
+        layer: Properties = {}
+        if props is None:
+            return layer
+        if props.tag == qn("w:rPr"):
+            fonts = props.find(qn("w:rFonts"))
+            if fonts is not None:
+                font = self._theme_fonts.get(fonts.get(qn("w:asciiTheme"))) or fonts.get(qn("w:ascii"))
+                if font:
+                    layer["font"] = font
+            size = props.find(qn("w:sz"))
+            if size is not None and size.get(W_VAL) is not None:
+                layer["size"] = ST_HpsMeasure.convert_from_xml(size.get(W_VAL)).pt
+            return layer
+
+        spacing = props.find(qn("w:spacing"))
+        if spacing is not None and spacing.get(qn("w:line")) is not None:
+            layer["line"] = ST_SignedTwipsMeasure.convert_from_xml(spacing.get(qn("w:line")))
+            layer["line_rule"] = spacing.get(qn("w:lineRule"), "auto")
+        ind = props.find(qn("w:ind"))
+        if ind is not None:
+            if ind.get(qn("w:hanging")) is not None:
+                layer["indent"] = Length(-ST_TwipsMeasure.convert_from_xml(ind.get(qn("w:hanging"))))
+            elif ind.get(qn("w:firstLine")) is not None:
+                layer["indent"] = ST_TwipsMeasure.convert_from_xml(ind.get(qn("w:firstLine")))
+        return layer
+
+
+def line_spacing(properties: Properties):
+    """Межстрочный интервал как в python-docx: множитель строк или Length для «точно»/«не менее»"""
+    line = properties.get("line")
+    if line is None:
+        return None
+    if properties.get("line_rule") == "auto":
+        return line / Pt(12)
+    return line
+
+
+def _theme_fonts(theme: Optional[etree._Element]) -> Dict[str, str]:
+    """Шрифты темы по значениям атрибутов *Theme в w:rFonts (minorHAnsi → гарнитура)"""
+    fonts: Dict[str, str] = {}
+    if theme is None:
+        return fonts
+    for kind in ("major", "minor"):
+        scheme = theme.find(f".//{A_NS}{kind}Font")
+        if scheme is None:
+            continue
+        for suffix, script in _THEME_SCRIPTS.items():
+            font = scheme.find(A_NS + script)
+            if font is not None and font.get("typeface"):
+                fonts[kind + suffix] = font.get("typeface")
+    return fonts
+
+
+def effective_run_formats(resolver: StyleResolver, paragraph: Properties,
+                          runs: Iterable[etree._Element]) -> Tuple[List[str], List[float]]:
+    """Гарнитуры и кегли (pt) runs абзаца с учётом стилей; runs — элементы w:r"""
+    fonts, sizes = [], []
+    for run in runs:
+        properties = resolver.run(paragraph, run.find(qn("w:rPr")))
+        if properties.get("font"):
+            fonts.append(properties["font"])
+        if properties.get("size"):
+            sizes.append(properties["size"])
+    return fonts, sizes
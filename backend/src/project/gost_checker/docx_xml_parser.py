@@ -0,0 +1,183 @@
+import os
+import posixpath
+import zipfile
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import docx
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
+from docx.oxml.simpletypes import ST_OnOff, ST_SignedTwipsMeasure, ST_TwipsMeasure
+from docx.shared import Length
+from lxml import etree
+
+from .docx_parser import MARGIN_SIDES, DocxAggregates, DocxParagraph
+from .docx_styles import StyleResolver, effective_run_formats, line_spacing
+from .features import FeatureSet
+
+# Шаблон стилей, который python-docx подставляет, если в документе нет части стилей
+DEFAULT_STYLES_PATH = os.path.join(os.path.dirname(docx.__file__), "templates", "default-styles.xml")
+
+W_BODY = qn("w:body")
+W_P = qn("w:p")
+W_R = qn("w:r")
+W_HYPERLINK = qn("w:hyperlink")
+W_SECT_PR = qn("w:sectPr")
+W_TBL = qn("w:tbl")
+W_SDT = qn("w:sdt")
+W_VAL = qn("w:val")
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Текстовые эквиваленты содержимого run — как в python-docx (CT_R.text)
+_RUN_TEXT = {
+    qn("w:tab"): "\t",
+    qn("w:ptab"): "\t",
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-",
+}
+# Типы атрибутов w:pgMar (как в CT_PageMar)
+_MARGIN_TYPES = {"left": ST_TwipsMeasure, "right": ST_TwipsMeasure,
+                 "top": ST_SignedTwipsMeasure, "bottom": ST_SignedTwipsMeasure}
+
+
+def parse_docx_xml(file_path: str, data: Dict[str, Any], features: FeatureSet = FeatureSet()) -> Dict[str, Any]:
+    """Разбор DOCX потоковым чтением word/document.xml из архива (без объектной модели python-docx).
+
+    Читаются только document.xml, styles.xml и тема: картинки и прочие части пакета не загружаются,
+    обработанные абзацы сразу удаляются из дерева. Результат совпадает с parse_docx.
+    """
+    aggregates = DocxAggregates(features)
+    section_count = 0
+    margins = None
+
+    with zipfile.ZipFile(file_path) as package:
+        document_path, styles_path, theme_path = _part_paths(package)
+        resolver = _style_resolver(package, styles_path, theme_path)
+
+        with package.open(document_path) as document:
+            for sect_pr, record in _iter_body(document, features, resolver):
+                if record is not None:
+                    aggregates.add(record)
+                if sect_pr is not None:
+                    if section_count == 0:
+                        margins = _section_margins(sect_pr)
+                    section_count += 1
+
+    return aggregates.fill(data, section_count, margins)
+
+
+def _part_paths(package: zipfile.ZipFile) -> Tuple[str, Optional[str], Optional[str]]:
+    """Пути к основной части документа, к стилям и к теме по связям пакета"""
+    rels = etree.fromstring(package.read("_rels/.rels"))
+    document_path = next(
+        _resolve("/", rel.get("Target")) for rel in rels.iter(REL_NS + "Relationship")
+        if rel.get("Type") == RT.OFFICE_DOCUMENT
+    )
+    base_dir, name = posixpath.split(document_path)
+    rels_path = posixpath.join(base_dir, "_rels", name + ".rels")
+    if rels_path not in package.namelist():
+        return document_path, None, None
+    document_rels = etree.fromstring(package.read(rels_path))
+
+    def related(rel_type: str) -> Optional[str]:
+        return next((
+            _resolve(base_dir, rel.get("Target")) for rel in document_rels.iter(REL_NS + "Relationship")
+            if rel.get("Type") == rel_type and rel.get("TargetMode") != "External"
+        ), None)
+
+    return document_path, related(RT.STYLES), related(RT.THEME)
+
+
+def _resolve(base_dir: str, target: str) -> str:
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(base_dir, target)).lstrip("/")
+
+
+def _style_resolver(package: zipfile.ZipFile, styles_path: Optional[str],
+                    theme_path: Optional[str]) -> StyleResolver:
+    names = package.namelist()
+    if styles_path is not None and styles_path in names:
+        styles = etree.fromstring(package.read(styles_path))
+    else:
+        with open(DEFAULT_STYLES_PATH, "rb") as default_styles:
+            styles = etree.fromstring(default_styles.read())
+    theme = etree.fromstring(package.read(theme_path)) if theme_path is not None and theme_path in names else None
+    return StyleResolver(styles, theme)
+
+
+def _iter_body(document, features: FeatureSet, resolver: StyleResolver
+               ) -> Iterator[Tuple[Optional[etree._Element], Optional[DocxParagraph]]]:
+    """Элементы w:body по мере чтения: (sectPr или None, непустой абзац или None).
+
+    Учитываются только абзацы верхнего уровня (как doc.paragraphs): абзацы таблиц
+    и элементов управления содержимым пропускаются.
+    """
+    for _, elem in etree.iterparse(document, events=("end",), tag=(W_P, W_SECT_PR, W_TBL, W_SDT)):
+        body = elem.getparent()
+        if body is None or body.tag != W_BODY:
+            continue
+        if elem.tag == W_P:
+            p_pr = elem.find(qn("w:pPr"))
+            sect_pr = p_pr.find(W_SECT_PR) if p_pr is not None else None
+            record = _paragraph(elem, p_pr, features, resolver) if features.needs_content else None
+            yield sect_pr, record
+        elif elem.tag == W_SECT_PR:
+            yield elem, None
+        # Обработанное поддерево больше не нужно: память не растёт с размером документа
+        elem.clear()
+        while elem.getprevious() is not None:
+            del body[0]
+
+
+def _paragraph(p: etree._Element, p_pr: Optional[etree._Element], features: FeatureSet,
+               resolver: StyleResolver) -> Optional[DocxParagraph]:
+    text = "".join(
+        _run_text(child) if child.tag == W_R else "".join(_run_text(r) for r in child.iterchildren(W_R))
+        for child in p.iterchildren(W_R, W_HYPERLINK)
+    ).strip()
+    if not text:
+        return None
+
+    record = DocxParagraph(text=text)
+    runs = p.findall(W_R)  # как para.runs: без runs внутри гиперссылок
+    if features.structure or features.introduction:
+        style = p_pr.find(qn("w:pStyle")) if p_pr is not None else None
+        record.style_name = resolver.style_name(style.get(W_VAL) if style is not None else None) or ""
+        record.bold = any(_bold(run) for run in runs)
+    if features.fonts or features.indent:
+        paragraph = resolver.paragraph(p_pr)
+        if features.fonts:
+            record.fonts, record.sizes = effective_run_formats(resolver, paragraph, runs)
+            record.line_spacing = line_spacing(paragraph)
+        if features.indent:
+            record.first_line_indent = paragraph.get("indent")
+    return record
+
+
+def _run_text(run: etree._Element) -> str:
+    parts = []
+    for child in run:
+        if child.tag == qn("w:t"):
+            parts.append(child.text or "")
+        elif child.tag == qn("w:br"):
+            parts.append("\n" if child.get(qn("w:type"), "textWrapping") == "textWrapping" else "")
+        else:
+            parts.append(_RUN_TEXT.get(child.tag, ""))
+    return "".join(parts)
+
+
+def _bold(run: etree._Element) -> bool:
+    bold = run.find(qn("w:rPr") + "/" + qn("w:b"))
+    if bold is None:
+        return False
+    value = bold.get(W_VAL)
+    return value is None or ST_OnOff.convert_from_xml(value)
+
+
+def _section_margins(sect_pr: etree._Element) -> Dict[str, Optional[Length]]:
+    page_margins = sect_pr.find(qn("w:pgMar"))
+    margins = {}
+    for side in MARGIN_SIDES:
+        value = page_margins.get(qn("w:" + side)) if page_margins is not None else None
+        margins[side] = _MARGIN_TYPES[side].convert_from_xml(value) if value is not None else None
+    return margins
@@ -0,0 +1,155 @@
+import asyncio
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from project.core.config import settings
+from project.core.exceptions import DocumentParsingTimeout
+from .features import FeatureSet
+from .parser import DEFAULT_DOCX_BACKEND, new_document_data, parse_document
+from .pdf_parser import count_pdf_pages, merge_pdf_shards, parse_pdf_pages, split_pages
+
+
+class _Worker:
+    """Один процесс разбора (пул из одного процесса): его можно остановить, не трогая остальные"""
+
+    def __init__(self) -> None:
+        self.executor = ProcessPoolExecutor(max_workers=1)
+        self.pid: Optional[int] = None
+        self.tasks = 0
+        self.broken = False
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        if self.pid is None:
+            self.pid = await loop.run_in_executor(self.executor, os.getpid)
+        self.tasks += 1
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def kill(self) -> None:
+        """Останавливает процесс вместе с выполняемой задачей"""
+        self.broken = True
+        if self.pid is not None:
+            with suppress(ProcessLookupError):
+                os.kill(self.pid, signal.SIGTERM)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ParsingEngine:
+    """Выполняет разбор документов в пуле процессов, не блокируя event loop.
+
+    Каждый процесс пула — отдельный _Worker: при таймауте останавливается только процесс
+    зависшей задачи, разбор других документов (и соседних частей PDF) продолжается.
+    """
+
+    def __init__(self, pool_size: int, max_tasks_per_child: Optional[int] = None,
+                 timeout: Optional[float] = None, shard_pages: int = 0,
+                 docx_backend: str = DEFAULT_DOCX_BACKEND):
+        # pool_size <= 0 — разбор в потоке текущего процесса (для отладки и тестов)
+        self.pool_size = pool_size
+        self.max_tasks_per_child = max_tasks_per_child or None
+        self.timeout = timeout or None
+        # PDF длиннее shard_pages страниц делится на диапазоны между воркерами (0 — не делить)
+        self.shard_pages = shard_pages
+        self.docx_backend = docx_backend
+        # Свободные места пула: _Worker или None (процесс ещё не запущен)
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: Set[_Worker] = set()
+
+    async def _acquire(self) -> _Worker:
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self.pool_size):
+                self._idle.put_nowait(None)
+        worker = await self._idle.get()
+        if worker is None:
+            worker = _Worker()
+            self._workers.add(worker)
+        return worker
+
+    def _release(self, worker: _Worker) -> None:
+        """Возвращает место в пул; остановленный или отработавший max_tasks_per_child процесс заменяется"""
+        if worker.broken or (self.max_tasks_per_child and worker.tasks >= self.max_tasks_per_child):
+            self._workers.discard(worker)
+            if not worker.broken:
+                worker.executor.shutdown(wait=False)
+            worker = None
+        if self._idle is not None:
+            self._idle.put_nowait(worker)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Выполняет func(*args) в пуле с ограничением по времени"""
+        if self.pool_size <= 0:
+            future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+            try:
+                return await asyncio.wait_for(future, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                raise DocumentParsingTimeout(file_path=str(args[0]) if args else "", timeout=self.timeout)
+
+        worker = await self._acquire()
+        try:
+            return await asyncio.wait_for(worker.run(func, *args), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # Зависший процесс занимает место в пуле: останавливаем его, место получит новый процесс
+            worker.kill()
+            raise DocumentParsingTimeout(file_path=str(args[0]) if args else "", timeout=self.timeout)
+        except BrokenProcessPool:
+            # Процесс упал (например, по памяти) — место получит новый процесс
+            worker.kill()
+            raise
+        finally:
+            self._release(worker)
+
+    async def parse(self, file_path: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Извлекает данные документа в отдельном процессе (только поля fields, None — все)"""
+        fields = frozenset(fields) if fields is not None else None
+        if self.shard_pages > 0 and self.pool_size > 1 and Path(file_path).suffix.lower() == ".pdf":
+            page_count = await self.run(count_pdf_pages, file_path)
+            shards = min(page_count // self.shard_pages, self.pool_size)
+            if shards > 1:
+                return await self._parse_pdf_sharded(file_path, page_count, shards, FeatureSet.for_fields(fields))
+        return await self.run(parse_document, file_path, 1, fields, self.docx_backend)
+
+    async def _parse_pdf_sharded(self, file_path: str, page_count: int, shards: int,
+                                 wanted: FeatureSet) -> Dict[str, Any]:
+        parts = await asyncio.gather(*(
+            self.run(parse_pdf_pages, file_path, start, stop, wanted)
+            for start, stop in split_pages(page_count, shards)
+        ))
+        data = new_document_data()
+        data["page_count"] = page_count
+        return await asyncio.to_thread(merge_pdf_shards, list(parts), data, wanted)
+
+    def shutdown(self, wait: bool = True) -> None:
+        for worker in self._workers:
+            worker.executor.shutdown(wait=wait, cancel_futures=True)
+        self._workers.clear()
+        self._idle = None
+
+
+_engine: Optional[ParsingEngine] = None
+
+
+def get_parsing_engine() -> ParsingEngine:
+    """Возвращает общий для процесса движок разбора, настроенный из Settings"""
+    global _engine
+    if _engine is None:
+        _engine = ParsingEngine(
+            pool_size=settings.PARSER_POOL_SIZE,
+            max_tasks_per_child=settings.PARSER_MAX_TASKS_PER_CHILD,
+            timeout=settings.PARSER_TIMEOUT_SEC,
+            shard_pages=settings.PARSER_PDF_SHARD_PAGES,
+            docx_backend=settings.PARSER_DOCX_BACKEND,
+        )
+    return _engine
+
+
+def shutdown_parsing_engine() -> None:
+    global _engine
+    if _engine is not None:
+        _engine.shutdown()
+        _engine = None
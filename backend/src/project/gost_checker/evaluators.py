@@ -0,0 +1,418 @@
+from dataclasses import dataclass, asdict
+from enum import Enum
+from functools import partial
+from numbers import Real
+from typing import Any, Callable, Dict, List, Optional
+
+class CheckType(Enum):
+    EQUALS = "equals"
+    CONTAINS = "contains"
+    LIST_PRESENCE = "list_presence"
+    MIN_VALUE = "min_value"
+    MAX_VALUE = "max_value"
+    RANGE = "range"
+    OBJECT_CONTAINS = "object_contains"
+    OBJECT_EQUALS = "object_equals"
+
+class Severity(Enum):
+    CRITICAL = "critical"
+    WARNING = "warning"
+    INFO = "info"
+
+@dataclass
+class ValidationResult:
+    rule_id: str
+    rule_title: str
+    is_passed: bool
+    message: str
+    severity: Severity
+    expected: Any
+    actual: Any
+    suggestion: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Конвертирует результат в словарь"""
+        result = asdict(self)
+        result['severity'] = result['severity'].value
+        return result
+
+
+# Проверка правила над document_data, собранная при загрузке правил
+Evaluator = Callable[[Dict[str, Any]], ValidationResult]
+
+def check_equals(rule_id: str, rule_title: str, expected: Any,
+                 actual: Any, severity: Severity) -> ValidationResult:
+    """Проверка на равенство"""
+    is_passed = expected == actual
+
+    if is_passed:
+        message = f"Соответствует требованию: {expected}"
+    else:
+        message = f"Не соответствует: ожидалось {expected}, получено {actual}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=expected,
+        actual=actual
+    )
+
+
+def check_list_presence(rule_id: str, rule_title: str,
+                        expected_list: List[str], actual_list: List[str],
+                        severity: Severity) -> ValidationResult:
+    """Проверка наличия элементов списка"""
+    missing_elements = []
+
+    for expected in expected_list:
+        found = False
+        for actual in actual_list:
+            if expected.lower() in actual.lower():
+                found = True
+                break
+        if not found:
+            missing_elements.append(expected)
+
+    is_passed = len(missing_elements) == 0
+
+    if is_passed:
+        message = "Все обязательные элементы присутствуют"
+    else:
+        message = f"Отсутствуют элементы: {', '.join(missing_elements)}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=expected_list,
+        actual=actual_list,
+        suggestion=f"Добавьте недостающие элементы: {', '.join(missing_elements)}" if missing_elements else None
+    )
+
+
+def check_text_presence(rule_id: str, rule_title: str, expected_items: List[str],
+                        text: str, severity: Severity,
+                        synonyms: Optional[Dict[str, List[str]]] = None) -> ValidationResult:
+    """Проверка, что текст (например, введение) упоминает все элементы списка или их синонимы"""
+    content_lower = text.lower()
+    synonyms = synonyms or {}
+    missing_items = []
+
+    for item in expected_items:
+        if item.lower() not in content_lower:
+            found = any(synonym.lower() in content_lower for synonym in synonyms.get(item, []))
+            if not found:
+                missing_items.append(item)
+
+    is_passed = len(missing_items) == 0
+
+    if is_passed:
+        message = "Введение содержит все обязательные элементы"
+    else:
+        message = f"В введении отсутствуют: {', '.join(missing_items)}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=expected_items,
+        actual=text[:200] + "..." if len(text) > 200 else text,
+        suggestion=f"Добавьте в введение: {', '.join(missing_items)}" if missing_items else None
+    )
+
+
+def check_object_equals(rule_id: str, rule_title: str,
+                        expected: Dict, actual: Dict, severity: Severity) -> ValidationResult:
+    """Проверка объектов на равенство"""
+    mismatches = []
+
+    for key, expected_value in expected.items():
+        if key in actual:
+            if expected_value != actual[key]:
+                mismatches.append(f"{key}: ожидалось {expected_value}, получено {actual[key]}")
+        else:
+            mismatches.append(f"{key}: отсутствует в документе")
+
+    is_passed = len(mismatches) == 0
+
+    if is_passed:
+        message = "Все параметры соответствуют требованиям"
+    else:
+        message = f"Несоответствия: {'; '.join(mismatches)}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=expected,
+        actual=actual
+    )
+
+
+def check_object_contains(rule_id: str, rule_title: str,
+                          expected: Dict, actual: Dict, severity: Severity) -> ValidationResult:
+    """Проверка, что объект содержит ожидаемые свойства"""
+    missing_props = []
+
+    for key, expected_value in expected.items():
+        if key not in actual:
+            missing_props.append(key)
+        elif expected_value != actual[key]:
+            missing_props.append(f"{key} (неверное значение)")
+
+    is_passed = len(missing_props) == 0
+
+    if is_passed:
+        message = "Содержит все требуемые свойства"
+    else:
+        message = f"Отсутствуют или неверны свойства: {', '.join(missing_props)}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=expected,
+        actual=actual
+    )
+
+
+def check_range(rule_id: str, rule_title: str,
+                min_value: float, max_value: float, actual: float, severity: Severity) -> ValidationResult:
+    """Проверка значения в диапазоне"""
+    is_passed = min_value <= actual <= max_value
+
+    if is_passed:
+        message = f"Значение {actual} находится в допустимом диапазоне [{min_value}, {max_value}]"
+    else:
+        if actual < min_value:
+            message = f"Значение {actual} меньше минимально допустимого {min_value}"
+        else:
+            message = f"Значение {actual} больше максимально допустимого {max_value}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=f"Диапазон [{min_value}, {max_value}]",
+        actual=actual
+    )
+
+
+def check_min_value(rule_id: str, rule_title: str,
+                    min_value: float, actual: float, severity: Severity) -> ValidationResult:
+    """Проверка минимального значения"""
+    is_passed = actual >= min_value
+
+    if is_passed:
+        message = f"Значение {actual} не меньше минимально допустимого {min_value}"
+    else:
+        message = f"Значение {actual} меньше минимально допустимого {min_value}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=f"Минимум {min_value}",
+        actual=actual
+    )
+
+
+def check_max_value(rule_id: str, rule_title: str,
+                    max_value: float, actual: float, severity: Severity) -> ValidationResult:
+    """Проверка максимального значения"""
+    is_passed = actual <= max_value
+
+    if is_passed:
+        message = f"Значение {actual} не больше максимально допустимого {max_value}"
+    else:
+        message = f"Значение {actual} больше максимально допустимого {max_value}"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=f"Максимум {max_value}",
+        actual=actual
+    )
+
+
+def check_contains(rule_id: str, rule_title: str,
+                   expected: str, actual: str, severity: Severity) -> ValidationResult:
+    """Проверка наличия подстроки"""
+    is_passed = expected.lower() in actual.lower()
+
+    if is_passed:
+        message = f"Текст содержит требуемое: '{expected}'"
+    else:
+        message = f"Текст не содержит требуемое: '{expected}'"
+
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=is_passed,
+        message=message,
+        severity=severity,
+        expected=expected,
+        actual=actual[:100] + "..." if len(actual) > 100 else actual
+    )
+
+
+def _missing_field(rule_id: str, rule_title: str, field: str, expected: Any,
+                   severity: Severity) -> ValidationResult:
+    """Единый результат для значения, которого нет в document_data (поле отсутствует или None)"""
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=False,
+        message=f"В документе отсутствует '{field}'",
+        severity=severity,
+        expected=expected,
+        actual=None,
+        suggestion=f"Добавьте '{field}' в документ"
+    )
+
+
+def _wrong_type(rule_id: str, rule_title: str, field: str, expected: Any, actual: Any,
+                severity: Severity) -> ValidationResult:
+    return ValidationResult(
+        rule_id=rule_id,
+        rule_title=rule_title,
+        is_passed=False,
+        message=f"Значение '{field}' нельзя проверить: неподходящий тип {type(actual).__name__}",
+        severity=severity,
+        expected=expected,
+        actual=actual
+    )
+
+
+def _number(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+# Построитель получает правило и уровень серьёзности и возвращает проверку значения поля.
+# Форма expected_value проверяется здесь же — один раз при загрузке правил
+Check = Callable[[Any], ValidationResult]
+Builder = Callable[[Dict[str, Any], Severity], Check]
+
+
+def _build_equals(rule: Dict[str, Any], severity: Severity) -> Check:
+    return partial(check_equals, rule['id'], rule['title'], rule['expected_value'], severity=severity)
+
+
+def _build_contains(rule: Dict[str, Any], severity: Severity) -> Check:
+    expected = rule['expected_value']
+    if not isinstance(expected, str):
+        raise ValueError("для contains ожидается строка")
+
+    def check(actual: Any) -> ValidationResult:
+        if isinstance(actual, list):  # список строк (например, заголовки): ищем в любом элементе
+            actual = "\n".join(map(str, actual))
+        return check_contains(rule['id'], rule['title'], expected, actual, severity)
+    return check
+
+
+def _build_list_presence(rule: Dict[str, Any], severity: Severity) -> Check:
+    expected = rule['expected_value']
+    synonyms = rule.get('synonyms', {})
+    if not isinstance(expected, list) or not all(isinstance(item, str) for item in expected):
+        raise ValueError("для list_presence ожидается список строк")
+    if not isinstance(synonyms, dict):
+        raise ValueError("synonyms должен быть объектом {элемент: [синонимы]}")
+
+    def check(actual: Any) -> ValidationResult:
+        if isinstance(actual, str):  # текст: элементы или их синонимы должны упоминаться в нём
+            return check_text_presence(rule['id'], rule['title'], expected, actual, severity, synonyms)
+        return check_list_presence(rule['id'], rule['title'], expected, actual, severity)
+    return check
+
+
+def _build_min_value(rule: Dict[str, Any], severity: Severity) -> Check:
+    if not _number(rule['expected_value']):
+        raise ValueError("для min_value ожидается число")
+    return partial(check_min_value, rule['id'], rule['title'], rule['expected_value'], severity=severity)
+
+
+def _build_max_value(rule: Dict[str, Any], severity: Severity) -> Check:
+    if not _number(rule['expected_value']):
+        raise ValueError("для max_value ожидается число")
+    return partial(check_max_value, rule['id'], rule['title'], rule['expected_value'], severity=severity)
+
+
+def _build_range(rule: Dict[str, Any], severity: Severity) -> Check:
+    expected = rule['expected_value']
+    if isinstance(expected, dict):
+        expected = [expected.get('min'), expected.get('max')]
+    if not isinstance(expected, list) or len(expected) != 2 or not all(map(_number, expected)):
+        raise ValueError("для range ожидается {\"min\": число, \"max\": число} или [min, max]")
+    return partial(check_range, rule['id'], rule['title'], expected[0], expected[1], severity=severity)
+
+
+def _build_object_equals(rule: Dict[str, Any], severity: Severity) -> Check:
+    if not isinstance(rule['expected_value'], dict):
+        raise ValueError("для object_equals ожидается объект")
+    return partial(check_object_equals, rule['id'], rule['title'], rule['expected_value'], severity=severity)
+
+
+def _build_object_contains(rule: Dict[str, Any], severity: Severity) -> Check:
+    if not isinstance(rule['expected_value'], dict):
+        raise ValueError("для object_contains ожидается объект")
+    return partial(check_object_contains, rule['id'], rule['title'], rule['expected_value'], severity=severity)
+
+
+# check_type → построитель проверки и типы значения поля, которые проверка умеет сравнивать
+EVALUATOR_BUILDERS: Dict[CheckType, Builder] = {
+    CheckType.EQUALS: _build_equals,
+    CheckType.CONTAINS: _build_contains,
+    CheckType.LIST_PRESENCE: _build_list_presence,
+    CheckType.MIN_VALUE: _build_min_value,
+    CheckType.MAX_VALUE: _build_max_value,
+    CheckType.RANGE: _build_range,
+    CheckType.OBJECT_CONTAINS: _build_object_contains,
+    CheckType.OBJECT_EQUALS: _build_object_equals,
+}
+ACCEPTED_TYPES: Dict[CheckType, Callable[[Any], bool]] = {
+    CheckType.EQUALS: lambda value: True,
+    CheckType.CONTAINS: lambda value: isinstance(value, (str, list)),
+    CheckType.LIST_PRESENCE: lambda value: isinstance(value, (str, list)),
+    CheckType.MIN_VALUE: _number,
+    CheckType.MAX_VALUE: _number,
+    CheckType.RANGE: _number,
+    CheckType.OBJECT_CONTAINS: lambda value: isinstance(value, dict),
+    CheckType.OBJECT_EQUALS: lambda value: isinstance(value, dict),
+}
+
+
+def compile_evaluator(rule: Dict[str, Any], check_type: CheckType, severity: Severity) -> Evaluator:
+    """Собирает проверку правила один раз: параметры правила замыкаются в функцию.
+
+    ValueError — если expected_value не подходит для check_type.
+    """
+    rule_id, title, field, expected = rule['id'], rule['title'], rule['field'], rule['expected_value']
+    check = EVALUATOR_BUILDERS[check_type](rule, severity)
+    accepts = ACCEPTED_TYPES[check_type]
+
+    def evaluate(document_data: Dict[str, Any]) -> ValidationResult:
+        actual = document_data.get(field)
+        if actual is None:
+            return _missing_field(rule_id, title, field, expected, severity)
+        if not accepts(actual):
+            return _wrong_type(rule_id, title, field, expected, actual, severity)
+        return check(actual)
+    return evaluate
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# Поля document_data, которые может запросить правило (поле `field` в manual_rules.json)
+DOCUMENT_FIELDS = frozenset({
+    "required_elements",
+    "font_settings",
+    "page_margins",
+    "paragraph_indent",
+    "introduction_text",
+    "full_text",
+    "page_count",
+    "word_count",
+})
+
+
+@dataclass(frozen=True)
+class FeatureSet:
+    """Группы признаков, которые нужно извлечь из документа"""
+    structure: bool = True  # required_elements: заголовки, титульный лист, главы
+    introduction: bool = True  # introduction_text
+    text: bool = True  # full_text и word_count
+    fonts: bool = True  # font_settings: шрифт, кегль, межстрочный интервал
+    margins: bool = True  # page_margins
+    indent: bool = True  # paragraph_indent
+
+    @classmethod
+    def for_fields(cls, fields: Optional[Iterable[str]]) -> "FeatureSet":
+        """Набор признаков для полей правил; None или неизвестное поле — извлекаем всё"""
+        if fields is None:
+            return cls()
+        fields = set(fields)
+        if not fields <= DOCUMENT_FIELDS:
+            return cls()
+        return cls(
+            structure="required_elements" in fields,
+            introduction="introduction_text" in fields,
+            text=bool(fields & {"full_text", "word_count"}),
+            fonts="font_settings" in fields,
+            margins="page_margins" in fields,
+            indent="paragraph_indent" in fields,
+        )
+
+    @property
+    def needs_content(self) -> bool:
+        """Нужно ли читать содержимое страниц/абзацев (page_count известен и без этого)"""
+        return self.structure or self.introduction or self.text or self.fonts or self.margins or self.indent
@@ -0,0 +1,92 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Доля (в процентах) крайних символов с каждой стороны, которая не учитывается при оценке полей:
+# номера страниц, колонтитулы и сноски из одного-двух символов не сдвигают границу текста
+MARGIN_PERCENTILE = 0.5
+# Сдвиг первой строки абзаца относительно левой границы текста, pt (~0.2–3 см);
+# меньшие — шум выравнивания, большие — центрированные строки и подписи
+MIN_INDENT_PT = 5.0
+MAX_INDENT_PT = 85.0
+
+Bounds = Tuple[float, float, float, float]  # (x0 слева, x1 справа, y0 снизу, y1 сверху)
+
+
+@dataclass
+class CharGeometry:
+    """Координаты и кегли символов страницы в массивах NumPy (по элементу на символ)"""
+    x0: np.ndarray
+    x1: np.ndarray
+    y0: np.ndarray
+    y1: np.ndarray
+    size: np.ndarray
+    visible: np.ndarray  # символ не пробельный
+
+    @classmethod
+    def from_chars(cls, chars: Sequence[Dict[str, Any]]) -> "CharGeometry":
+        # Один проход по словарям pdfplumber, дальше вся статистика — векторные операции
+        table = np.array(
+            [(char.get('x0', 0), char.get('x1', 0), char.get('y0', 0), char.get('y1', 0), char.get('size', 0))
+             for char in chars],
+            dtype=float,
+        ).reshape(-1, 5)
+        visible = np.fromiter((bool(char.get('text', '').strip()) for char in chars), dtype=bool, count=len(chars))
+        return cls(x0=table[:, 0], x1=table[:, 1], y0=table[:, 2], y1=table[:, 3], size=table[:, 4],
+                   visible=visible)
+
+    def __len__(self) -> int:
+        return len(self.size)
+
+
+def value_counts(values: np.ndarray) -> Counter:
+    """Гистограмма значений массива (для моды и объединения по страницам)"""
+    keys, counts = np.unique(values, return_counts=True)
+    return Counter(dict(zip(keys.tolist(), counts.tolist())))
+
+
+def line_gaps(y0: np.ndarray, avg_size: float) -> Counter:
+    """Гистограмма расстояний между нижними границами соседних строк (строки сверху вниз).
+
+    Учитываются только расстояния от 0.5 до 3 кеглей: пустые строки и разрывы между блоками отбрасываются.
+    """
+    gaps = y0[:-1] - y0[1:]
+    return value_counts(gaps[(gaps > avg_size * 0.5) & (gaps < avg_size * 3)])
+
+
+def histogram_mean(histogram: Counter) -> Optional[float]:
+    """Среднее по гистограмме; значения суммируются в порядке возрастания — результат детерминирован"""
+    if not histogram:
+        return None
+    values, weights = zip(*sorted(histogram.items()))
+    return float(np.average(values, weights=weights))
+
+
+def robust_bounds(geometry: CharGeometry, percentile: float = MARGIN_PERCENTILE) -> Optional[Bounds]:
+    """Границы текста страницы по перцентилям координат видимых символов"""
+    mask = geometry.visible
+    if not mask.any():
+        return None
+    return (
+        float(np.percentile(geometry.x0[mask], percentile)),
+        float(np.percentile(geometry.x1[mask], 100 - percentile)),
+        float(np.percentile(geometry.y0[mask], percentile)),
+        float(np.percentile(geometry.y1[mask], 100 - percentile)),
+    )
+
+
+def median_bounds(samples: Iterable[Bounds]) -> Optional[Bounds]:
+    """Медиана границ по страницам: титульный лист и страницы с рисунками не искажают поля"""
+    table = np.array(list(samples), dtype=float)
+    if not len(table):
+        return None
+    return tuple(np.median(table, axis=0).tolist())
+
+
+def first_line_indent(line_x0: np.ndarray, left: float) -> Optional[float]:
+    """Абзацный отступ страницы, pt: медиана сдвигов строк с отступом относительно левой границы текста"""
+    offsets = line_x0 - left
+    offsets = offsets[(offsets > MIN_INDENT_PT) & (offsets < MAX_INDENT_PT)]
+    return float(np.median(offsets)) if len(offsets) else None
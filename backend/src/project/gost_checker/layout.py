@@ -0,0 +1,124 @@
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from .geometry import CharGeometry, value_counts
+
+
+def normalize_font_name(fontname: str) -> str:
+    """Убирает префикс подмножества (ABCDEF+) и суффикс начертания"""
+    font_name = re.sub(r'^[A-Z]{6}\+', '', fontname)
+    return re.sub(r'-(Regular|Bold|Italic|BoldItalic)$', '', font_name)
+
+
+@dataclass
+class LayoutLine:
+    """Строка страницы PDF"""
+    text: str
+    size: float  # максимальный размер шрифта в строке
+    x0: float
+    x1: float
+    y0: float  # нижняя граница (координаты PDF, от низа страницы)
+    y1: float  # верхняя граница
+
+
+@dataclass
+class PageLayout:
+    """Разметка страницы PDF: строки, массивы координат символов и статистика шрифтов"""
+    width: float
+    height: float
+    lines: List[LayoutLine] = field(default_factory=list)
+    font_counts: Counter = field(default_factory=Counter)
+    size_counts: Counter = field(default_factory=Counter)
+    avg_size: float = 12
+    geometry: Optional[CharGeometry] = None
+
+    @classmethod
+    def from_page(cls, page, tolerance: float = 3.0, collect_fonts: bool = True,
+                  collect_text: bool = True) -> "PageLayout":
+        return cls.from_chars(page.chars, page.width, page.height, tolerance, collect_fonts, collect_text)
+
+    @classmethod
+    def from_chars(cls, chars: Iterable[Dict[str, Any]], width: float, height: float,
+                   tolerance: float = 3.0, collect_fonts: bool = True,
+                   collect_text: bool = True) -> "PageLayout":
+        """collect_fonts=False пропускает подсчёт гарнитур и кеглей по символам,
+        collect_text=False — сборку текста строк (остаётся только геометрия)"""
+        chars = chars if isinstance(chars, list) else list(chars)
+        layout = cls(width=width, height=height, geometry=CharGeometry.from_chars(chars))
+        sizes = layout.geometry.size
+        if len(sizes):
+            layout.avg_size = float(sizes.mean())
+        if collect_fonts:
+            layout.size_counts = value_counts(sizes)
+            # Нормализуем имя один раз на гарнитуру, а не на каждый символ
+            for fontname, count in Counter(char['fontname'] for char in chars if 'fontname' in char).items():
+                layout.font_counts[normalize_font_name(fontname)] += count
+
+        # Строки группируются по y0 в корзины шириной tolerance: поиск строки для символа — O(1)
+        buckets: Dict[int, _LineBuilder] = {}
+        builders: List[_LineBuilder] = []
+        for char in chars:
+            if 'y0' not in char:
+                continue
+
+            key = int(char['y0'] // tolerance)
+            builder = _find_line(buckets, key, char['y0'], tolerance)
+            if builder is None:
+                builder = _LineBuilder(char['y0'])
+                buckets[key] = builder
+                builders.append(builder)
+            builder.chars.append(char)
+
+        lines = [builder.build(collect_text) for builder in builders]
+        layout.lines = sorted((line for line in lines if line is not None), key=lambda line: -line.y1)
+        return layout
+
+    @property
+    def text(self) -> str:
+        return "\n".join(line.text for line in self.lines)
+
+
+def _find_line(buckets: Dict[int, "_LineBuilder"], key: int, y0: float,
+               tolerance: float) -> Optional["_LineBuilder"]:
+    for candidate_key in (key, key - 1, key + 1):
+        builder = buckets.get(candidate_key)
+        if builder is not None and abs(builder.anchor - y0) <= tolerance:
+            return builder
+    return None
+
+
+class _LineBuilder:
+    __slots__ = ("anchor", "chars")
+
+    def __init__(self, anchor: float):
+        self.anchor = anchor
+        self.chars: List[Dict[str, Any]] = []
+
+    def build(self, collect_text: bool = True) -> Optional[LayoutLine]:
+        visible = [char for char in self.chars if char.get('text', '').strip()]
+        if not visible:
+            return None
+
+        return LayoutLine(
+            text=self._text() if collect_text else "",
+            size=max(char.get('size', 0) for char in self.chars),
+            x0=min(char['x0'] for char in visible),
+            x1=max(char['x1'] for char in visible),
+            y0=min(char['y0'] for char in self.chars),
+            y1=max(char['y1'] for char in self.chars),
+        )
+
+    def _text(self) -> str:
+        # Пробелы между словами: явные символы пробела или разрыв больше 0.2 кегля
+        parts = []
+        prev = None
+        for char in sorted(self.chars, key=lambda c: c.get('x0', 0)):
+            text = char.get('text', '')
+            if prev is not None and not text.isspace() and not prev.get('text', '').isspace():
+                if char.get('x0', 0) - prev.get('x1', 0) > 0.2 * char.get('size', 0):
+                    parts.append(" ")
+            parts.append(text)
+            prev = char
+        return re.sub(r'\s+', ' ', "".join(parts)).strip()
@@ -62,6 +62,7 @@ class DocumentCheckReport:
     results: List[CheckResult]
     timestamp: str
     filename: Optional[str] = None
+    ruleset_version: Optional[str] = None  # версия правил, по которым выполнена проверка
     
     def to_dict(self) -> Dict:
         result = asdict(self)
@@ -0,0 +1,272 @@
+import re
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pdfplumber
+
+from .features import FeatureSet
+from .geometry import (
+    Bounds,
+    first_line_indent,
+    histogram_mean,
+    line_gaps,
+    median_bounds,
+    robust_bounds,
+)
+from .layout import PageLayout
+
+# Расширенный паттерн для типичных разделов курсовой
+PDF_HEADING_PATTERN = r"^(содержание|оглавление|определения|обозначения и сокращения|введение|заключение|список (использованных|литературы|источников)|приложения|\d+\.?\s?[\w]+|глава \d+)"
+TITLE_PAGE_KEYWORDS = ["курсовая работа", "дипломная работа", "студент", "преподаватель", "университет", "факультет"]
+PT_TO_MM = 0.3528
+PT_TO_CM = 28.346  # 72 pt/inch, 2.54 cm/inch → 28.346 pt/cm
+
+
+@dataclass
+class PageFeatures:
+    """Признаки одной страницы PDF; символы страницы после их расчёта не хранятся"""
+    page_num: int
+    width: float
+    height: float
+    text: str
+    word_count: int
+    # Заголовки в порядке появления: (очищенный текст, является ли главой)
+    headings: List[Tuple[str, bool]] = field(default_factory=list)
+    font_counts: Counter = field(default_factory=Counter)
+    size_counts: Counter = field(default_factory=Counter)
+    line_diffs: Counter = field(default_factory=Counter)
+    indent_cm: Optional[float] = None
+    bounds: Optional[Bounds] = None  # границы текста без выбросов (номеров страниц и т.п.)
+
+
+def extract_page_features(layout: PageLayout, page_num: int,
+                          wanted: FeatureSet = FeatureSet()) -> PageFeatures:
+    """Считает признаки страницы по её разметке (только те, что входят в wanted)"""
+    text = layout.text if wanted.text or wanted.introduction else ""
+    features = PageFeatures(
+        page_num=page_num,
+        width=layout.width,
+        height=layout.height,
+        text=text,
+        word_count=len(re.findall(r'\w+', text)) if wanted.text else 0,
+        font_counts=layout.font_counts,
+        size_counts=layout.size_counts,
+    )
+    avg_size = layout.avg_size
+
+    if wanted.structure:
+        for line in layout.lines:
+            lower_line = line.text.lower()
+            # Заголовки по паттерну или большому шрифту
+            if re.match(PDF_HEADING_PATTERN, lower_line) or line.size > avg_size + 1:
+                cleaned = re.sub(r'^\d+\.?\s*', '', lower_line)  # убрать номера
+                features.headings.append((cleaned, bool(re.match(r'^\d+\.', line.text))))
+
+            # Для титульного листа (первая страница): ключевые слова
+            if page_num == 1 and any(keyword in lower_line for keyword in TITLE_PAGE_KEYWORDS):
+                features.headings.append(("титульный лист", False))
+
+    bounds = None
+    if layout.geometry is not None and (wanted.margins or wanted.indent):
+        bounds = robust_bounds(layout.geometry)
+    if wanted.margins:
+        features.bounds = bounds
+
+    # Indent: сдвиг первых строк абзацев относительно левой границы текста (заголовки по кеглю не учитываются)
+    if wanted.indent and bounds is not None and layout.lines:
+        lines = np.array([(line.x0, line.size) for line in layout.lines], dtype=float)
+        indent_pt = first_line_indent(lines[lines[:, 1] <= avg_size + 1, 0], bounds[0])
+        if indent_pt is not None:
+            features.indent_cm = indent_pt / PT_TO_CM
+
+    # Line spacing: гистограмма разниц y0 соседних строк
+    if wanted.fonts and layout.lines:
+        features.line_diffs = line_gaps(np.array([line.y0 for line in layout.lines], dtype=float), avg_size)
+
+    return features
+
+
+def iter_page_features(pdf, start: int = 0, stop: Optional[int] = None,
+                       wanted: FeatureSet = FeatureSet()) -> Iterator[PageFeatures]:
+    """Генератор признаков страниц; кэши pdfplumber освобождаются сразу после страницы"""
+    if not wanted.needs_content:
+        return
+    pages = pdf.pages[start:stop]
+    for page_num, page in enumerate(pages, start + 1):
+        try:
+            layout = PageLayout.from_page(
+                page,
+                collect_fonts=wanted.fonts,
+                collect_text=wanted.structure or wanted.text or wanted.introduction,
+            )
+        finally:
+            page.close()  # flush_cache(): символы и разметка страницы больше не нужны
+        yield extract_page_features(layout, page_num, wanted)
+
+
+class PdfAggregates:
+    """Накопительные агрегаты по страницам: память не зависит от числа страниц (кроме текста).
+
+    Агрегаты диапазонов страниц объединяются через merge() в порядке страниц,
+    результат совпадает с последовательным разбором.
+    """
+
+    def __init__(self) -> None:
+        self.page_size: Optional[Tuple[float, float]] = None
+        self.texts: List[str] = []
+        self.word_count = 0
+        # Заголовок → является ли главой при первом появлении (порядок появления сохраняется)
+        self.headings: Dict[str, bool] = {}
+        self.fonts: Counter = Counter()
+        self.sizes: Counter = Counter()
+        self.line_diffs: Counter = Counter()
+        # Выборки по страницам (по одной на страницу): итог — медиана, устойчивая к нетипичным страницам
+        self.indent_samples: List[float] = []
+        self.bounds_samples: List[Bounds] = []
+
+    def add(self, page: PageFeatures) -> None:
+        if self.page_size is None:
+            self.page_size = (page.width, page.height)
+        self.texts.append(page.text)
+        self.word_count += page.word_count
+
+        self._add_headings(page.headings)
+        self.fonts.update(page.font_counts)
+        self.sizes.update(page.size_counts)
+        self.line_diffs.update(page.line_diffs)
+        if page.indent_cm is not None:
+            self.indent_samples.append(page.indent_cm)
+        if page.bounds is not None:
+            self.bounds_samples.append(page.bounds)
+
+    def merge(self, other: "PdfAggregates") -> None:
+        """Присоединяет агрегаты следующего по порядку диапазона страниц"""
+        if self.page_size is None:
+            self.page_size = other.page_size
+        self.texts.extend(other.texts)
+        self.word_count += other.word_count
+        self._add_headings(other.headings.items())
+        # Counter.update сохраняет порядок первого появления ключей — как при последовательном проходе
+        self.fonts.update(other.fonts)
+        self.sizes.update(other.sizes)
+        self.line_diffs.update(other.line_diffs)
+        self.indent_samples.extend(other.indent_samples)
+        self.bounds_samples.extend(other.bounds_samples)
+
+    def _add_headings(self, headings) -> None:
+        for cleaned, is_chapter in headings:
+            if cleaned not in self.headings:
+                self.headings[cleaned] = is_chapter
+
+    def fill(self, data: Dict[str, Any], wanted: FeatureSet = FeatureSet()) -> None:
+        """Записывает итоговые значения в document_data"""
+        full_text = " ".join(self.texts) + " " if self.texts else ""
+        if wanted.text:
+            data["full_text"] = full_text
+            data["word_count"] = self.word_count
+        if wanted.introduction:
+            data["introduction_text"] = extract_introduction_from_text(full_text)
+        data["required_elements"] = list(self.headings)
+
+        fonts, sizes = self.fonts, self.sizes
+        data["font_settings"]["font_family"] = max(fonts.items(), key=lambda x: x[1])[0] if fonts else None
+        most_common_size = max(sizes.items(), key=lambda x: x[1])[0] if sizes else None
+        data["font_settings"]["font_size"] = round(most_common_size) if most_common_size else None
+
+        # Line spacing: средняя разница y по гистограмме
+        avg_diff = histogram_mean(self.line_diffs)
+        avg_size = data["font_settings"]["font_size"] or 14
+        data["font_settings"]["line_spacing"] = round(avg_diff / avg_size, 1) if avg_diff else None
+
+        # Indent: медиана по страницам
+        indents = self.indent_samples
+        data["paragraph_indent"] = round(float(np.median(indents)), 2) if indents else None
+
+        # Margins: по содержимому (mm), медиана границ по страницам
+        bounds = median_bounds(self.bounds_samples)
+        if bounds is not None:
+            min_x, max_x, min_y, max_y = bounds
+            width, height = self.page_size or (595, 842)  # A4 default pt
+            data["page_margins"] = {
+                "left": round(min_x * PT_TO_MM, 1) if min_x > 0 else 0,
+                "right": round((width - max_x) * PT_TO_MM, 1) if max_x < width else 0,
+                "top": round((height - max_y) * PT_TO_MM, 1) if max_y < height else 0,
+                "bottom": round(min_y * PT_TO_MM, 1) if min_y > 0 else 0
+            }
+
+        # Добавить "основная часть" если есть главы
+        if any(self.headings.values()):
+            data["required_elements"].append("основная часть")
+
+
+def extract_introduction_from_text(full_text: str) -> str:
+    # Улучшенный регекс: захватывает после "введение" до любого следующего заголовка (число, "глава", "заключение" и т.д.)
+    match = re.search(r"(введение|introduction)\s*([\s\S]*?)\s*(\d+\.?\s|глава|основная часть|заключение|conclusion|references|приложения|appendix|список|section)", full_text.lower(), re.DOTALL | re.IGNORECASE)
+    return match.group(2).strip() if match else full_text[:1000]  # fallback больше текста
+
+
+def count_pdf_pages(file_path: str) -> int:
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def parse_pdf_pages(file_path: str, start: int = 0, stop: Optional[int] = None,
+                    wanted: FeatureSet = FeatureSet()) -> PdfAggregates:
+    """Агрегаты диапазона страниц [start, stop) — единица работы для воркера"""
+    aggregates = PdfAggregates()
+    with pdfplumber.open(file_path) as pdf:
+        for features in iter_page_features(pdf, start, stop, wanted):
+            aggregates.add(features)
+    return aggregates
+
+
+def split_pages(page_count: int, shards: int) -> List[Tuple[int, int]]:
+    """Делит страницы на не более чем shards смежных диапазонов примерно равной длины"""
+    shards = max(1, min(shards, page_count))
+    size, extra = divmod(page_count, shards)
+    ranges = []
+    start = 0
+    for index in range(shards):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def merge_pdf_shards(shards: List[PdfAggregates], data: Dict[str, Any],
+                     wanted: FeatureSet = FeatureSet()) -> Dict[str, Any]:
+    """Объединяет агрегаты диапазонов (в порядке страниц) и заполняет document_data"""
+    aggregates = PdfAggregates()
+    for shard in shards:
+        aggregates.merge(shard)
+    aggregates.fill(data, wanted)
+    return data
+
+
+def parse_pdf(file_path: str, data: Dict[str, Any], workers: int = 1,
+              executor: Optional[Executor] = None, features: FeatureSet = FeatureSet()) -> Dict[str, Any]:
+    """Разбор PDF: потоково страница за страницей или, при workers > 1, диапазонами в разных процессах"""
+    if workers <= 1 or not features.needs_content:
+        aggregates = PdfAggregates()
+        with pdfplumber.open(file_path) as pdf:
+            data["page_count"] = len(pdf.pages)
+            for page_features in iter_page_features(pdf, wanted=features):
+                aggregates.add(page_features)
+        aggregates.fill(data, features)
+        return data
+
+    data["page_count"] = count_pdf_pages(file_path)
+    ranges = split_pages(data["page_count"], workers)
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=len(ranges))
+    try:
+        futures = [executor.submit(parse_pdf_pages, file_path, start, stop, features) for start, stop in ranges]
+        shards = [future.result() for future in futures]
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return merge_pdf_shards(shards, data, features)
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from project.core.config import settings
+from project.core.exceptions import RulesValidationError
+from .evaluators import CheckType, Evaluator, Severity, compile_evaluator
+from .features import DOCUMENT_FIELDS
+
+DEFAULT_RULES_FILE = Path(__file__).parent / "manual_rules.json"
+RULE_GROUPS = ("structure", "formatting")
+REQUIRED_RULE_KEYS = ("id", "section", "title", "rule_type", "field", "expected_value", "check_type", "severity")
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    rule_id: str
+    rule: Dict[str, Any]
+    evaluate: Evaluator
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Неизменяемый снимок загруженных правил: правила, готовые проверки и версия"""
+    version: str  # версия из файла + префикс sha256 содержимого
+    rules: Dict[str, Dict[str, Any]]
+    compiled: Tuple[CompiledRule, ...]
+    by_id: Dict[str, CompiledRule]
+    required_fields: FrozenSet[str]
+
+
+def compile_ruleset(content: bytes, rules_file: str = "<rules>") -> RuleSet:
+    """Разбирает и проверяет файл правил, собирая проверку для каждого включённого правила"""
+    try:
+        rules_data = json.loads(content)
+    except ValueError as e:
+        raise RulesValidationError(rules_file, f"не JSON ({e})")
+    if not isinstance(rules_data, dict) or not isinstance(rules_data.get("rules", {}), dict):
+        raise RulesValidationError(rules_file, "ожидался объект с ключом 'rules'")
+
+    rules: Dict[str, Dict[str, Any]] = {}
+    compiled: List[CompiledRule] = []
+    for group in RULE_GROUPS:
+        for rule_id, rule in rules_data.get("rules", {}).get(group, {}).items():
+            if not rule.get("enabled", True):
+                continue
+            rules[rule_id] = rule
+            compiled.append(compile_rule(rule_id, rule, rules_file))
+
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return RuleSet(
+        version=f"{rules_data.get('version', '0')}+{digest}",
+        rules=rules,
+        compiled=tuple(compiled),
+        by_id={rule.rule_id: rule for rule in compiled},
+        required_fields=frozenset(rule["field"] for rule in rules.values()),
+    )
+
+
+def compile_rule(rule_id: str, rule: Dict[str, Any], rules_file: str = "<rules>") -> CompiledRule:
+    """Проверяет правило и собирает для него проверку по check_type"""
+    check_type, severity = _validate_rule(rule_id, rule, rules_file)
+    try:
+        evaluate = compile_evaluator(rule, check_type, severity)
+    except ValueError as e:
+        raise RulesValidationError(rules_file, f"правило '{rule_id}': {e}")
+    return CompiledRule(rule_id, rule, evaluate)
+
+
+def _validate_rule(rule_id: str, rule: Dict[str, Any], rules_file: str) -> Tuple[CheckType, Severity]:
+    missing = [key for key in REQUIRED_RULE_KEYS if key not in rule]
+    if missing:
+        raise RulesValidationError(rules_file, f"в правиле '{rule_id}' нет ключей {', '.join(missing)}")
+    if rule["field"] not in DOCUMENT_FIELDS:
+        raise RulesValidationError(rules_file, f"правило '{rule_id}': неизвестное поле '{rule['field']}'")
+    try:
+        check_type = CheckType(rule["check_type"])
+        severity = Severity(rule["severity"])
+    except ValueError as e:
+        raise RulesValidationError(rules_file, f"правило '{rule_id}': {e}")
+    return check_type, severity
+
+
+class RuleRegistry:
+    """Правила из одного файла, общие для процесса.
+
+    Файл читается и компилируется один раз; get() не чаще check_interval секунд сверяет mtime
+    и размер файла и при изменении (и другом sha256) атомарно подменяет снимок. Некорректный
+    файл при перезагрузке не применяется — остаются прежние правила.
+    """
+
+    def __init__(self, rules_file: str, check_interval: float = 5):
+        self.rules_file = str(rules_file)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._stat: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+        self._ruleset = self._load()
+
+    def get(self) -> RuleSet:
+        """Текущий снимок правил; при необходимости перечитывает файл"""
+        if time.monotonic() >= self._next_check:
+            self._maybe_reload()
+        return self._ruleset
+
+    @property
+    def version(self) -> str:
+        return self.get().version
+
+    def _maybe_reload(self) -> None:
+        with self._lock:
+            if time.monotonic() < self._next_check:
+                return
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                stat = os.stat(self.rules_file)
+                if (stat.st_mtime_ns, stat.st_size) != self._stat:
+                    self._ruleset = self._load()
+            except (OSError, RulesValidationError) as e:
+                print(f"Правила {self.rules_file} не перезагружены, остаётся версия {self._ruleset.version}: {e}")
+
+    def _load(self) -> RuleSet:
+        path = Path(self.rules_file)
+        if not path.exists():
+            raise FileNotFoundError(f"Файл правил не найден. Ожидался путь: {self.rules_file}")
+        stat = path.stat()
+        content = path.read_bytes()
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.sha256(content).hexdigest()
+        if digest == self._digest:
+            return self._ruleset  # файл «тронули», но содержимое то же
+        ruleset = compile_ruleset(content, self.rules_file)
+        self._digest = digest
+        print(f"Загружены правила {self.rules_file}: {len(ruleset.rules)} шт., версия {ruleset.version}")
+        return ruleset
+
+
+_registries: Dict[str, RuleRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def default_rules_file() -> str:
+    return settings.GOST_RULES_FILE or str(DEFAULT_RULES_FILE)
+
+
+def get_rule_registry(rules_file: Optional[str] = None) -> RuleRegistry:
+    """Возвращает общий для процесса реестр правил файла (по умолчанию — из Settings)"""
+    path = os.path.abspath(str(rules_file or default_rules_file()))
+    registry = _registries.get(path)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(path)
+            if registry is None:
+                registry = RuleRegistry(path, settings.GOST_RULES_RELOAD_INTERVAL_SEC)
+                _registries[path] = registry
+    return registry
@@ -0,0 +1,56 @@
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Cm, Twips
+
+from project.gost_checker.docx_styles import StyleResolver, line_spacing
+
+STYLES = f"""<w:styles {nsdecls("w")}>
+  <w:docDefaults>
+    <w:rPrDefault><w:rPr><w:rFonts w:asciiTheme="minorHAnsi"/><w:sz w:val="22"/></w:rPr></w:rPrDefault>
+    <w:pPrDefault><w:pPr><w:spacing w:line="240" w:lineRule="auto"/></w:pPr></w:pPrDefault>
+  </w:docDefaults>
+  <w:style w:type="paragraph" w:default="1" w:styleId="Normal">
+    <w:name w:val="Normal"/>
+    <w:pPr><w:spacing w:line="360" w:lineRule="auto"/><w:ind w:firstLine="709"/></w:pPr>
+    <w:rPr><w:rFonts w:ascii="Times New Roman"/><w:sz w:val="28"/></w:rPr>
+  </w:style>
+  <w:style w:type="paragraph" w:styleId="Heading1">
+    <w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>
+    <w:pPr><w:ind w:firstLine="0"/></w:pPr><w:rPr><w:sz w:val="32"/></w:rPr>
+  </w:style>
+  <w:style w:type="paragraph" w:styleId="Loop"><w:name w:val="Loop"/><w:basedOn w:val="Loop"/></w:style>
+  <w:style w:type="character" w:styleId="Code">
+    <w:name w:val="Code"/><w:rPr><w:rFonts w:ascii="Courier New"/></w:rPr>
+  </w:style>
+</w:styles>"""
+THEME = """<a:theme xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"><a:themeElements><a:fontScheme>
+  <a:majorFont><a:latin typeface="Cambria"/></a:majorFont><a:minorFont><a:latin typeface="Calibri"/></a:minorFont>
+</a:fontScheme></a:themeElements></a:theme>"""
+
+
+
+def test_style_chain_inherits_and_is_cached():
+    resolver = StyleResolver(parse_xml(STYLES), parse_xml(THEME))
+    heading = resolver.paragraph_style("Heading1")
+    assert heading["font"] == "Times New Roman" and heading["size"] == 16
+    assert heading["indent"] == 0 and line_spacing(heading) == 1.5
+    assert resolver.paragraph_style("Heading1") is heading
+    assert resolver.style_name("Heading1") == "Heading 1"
+    # Неизвестный стиль и цикл basedOn — стиль по умолчанию / без зацикливания
+    assert resolver.paragraph_style("Missing")["size"] == 14
+    assert resolver.paragraph_style("Loop")["font"] == "Calibri"
+
+
+def test_paragraph_and_run_overlays():
+    resolver = StyleResolver(parse_xml(STYLES), parse_xml(THEME))
+    paragraph = resolver.paragraph(parse_xml(
+        f'<w:pPr {nsdecls("w")}><w:spacing w:line="360" w:lineRule="exact"/><w:ind w:hanging="567"/></w:pPr>'))
+    assert paragraph["font"] == "Times New Roman"
+    assert line_spacing(paragraph) == Twips(360)
+    assert paragraph["indent"] == -Twips(567)
+    assert round(resolver.paragraph(None)["indent"].cm, 2) == round(Cm(1.25).cm, 2)
+
+    run = resolver.run(paragraph, parse_xml(
+        f'<w:rPr {nsdecls("w")}><w:rStyle w:val="Code"/><w:sz w:val="24"/></w:rPr>'))
+    assert (run["font"], run["size"]) == ("Courier New", 12)
+    assert resolver.run(paragraph, None) is paragraph
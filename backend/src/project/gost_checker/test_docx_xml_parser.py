@@ -0,0 +1,101 @@
+import pytest
+from docx import Document
+from docx.enum.section import WD_SECTION
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Cm, Mm, Pt
+
+from project.gost_checker.parser import parse_document
+
+FIELD_SETS = [
+    None,
+    {"required_elements"},
+    {"introduction_text"},
+    {"font_settings"},
+    {"page_margins", "paragraph_indent"},
+    {"full_text", "word_count"},
+    {"page_count"},
+]
+
+
+def _thesis(path):
+    doc = Document()
+    section = doc.sections[0]
+    section.left_margin, section.right_margin = Mm(30), Mm(15)
+    section.top_margin, section.bottom_margin = Mm(20), Mm(20)
+    normal = doc.styles["Normal"]
+    normal.font.name, normal.font.size = "Times New Roman", Pt(14)
+    normal.paragraph_format.line_spacing = 1.5
+
+    doc.add_paragraph("Курсовая работа студента").runs[0].font.name = "Arial"
+    doc.add_paragraph("МОСКВА 2024")
+    doc.add_heading("Содержание", 1)
+    doc.add_heading("Введение", 1)
+    for index in range(6):
+        para = doc.add_paragraph(f"Абзац введения {index}. ")
+        para.paragraph_format.first_line_indent = Cm(1.25)
+        para.paragraph_format.line_spacing = 1.5
+        run = para.add_run("Продолжение\tс табуляцией")
+        run.font.name, run.font.size = "Times New Roman", Pt(14)
+        run.add_break()
+        para.add_run("после переноса").add_break(WD_BREAK.PAGE)
+    para = doc.add_paragraph("Жирная строка в тексте")
+    para.runs[0].bold = True
+    para.paragraph_format.first_line_indent = Cm(-0.5)
+
+    doc.add_section(WD_SECTION.NEW_PAGE).left_margin = Mm(10)
+    doc.add_paragraph("1. Теоретическая часть").style = doc.styles["Heading 2"]
+    para = doc.add_paragraph("Текст с точным интервалом и ")
+    para.paragraph_format.line_spacing = Pt(18)
+    para._p.append(parse_xml(
+        f'<w:hyperlink {nsdecls("w")}><w:r><w:rPr><w:sz w:val="40"/></w:rPr><w:t>ссылкой</w:t></w:r></w:hyperlink>'
+    ))
+    para = doc.add_paragraph("Висячий отступ")
+    para.paragraph_format.left_indent, para.paragraph_format.first_line_indent = Cm(1), Cm(-1)
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "2. Таблица не является абзацем документа"
+    doc.add_paragraph("")
+    doc.add_paragraph("ЗАКЛЮЧЕНИЕ")
+    doc.add_paragraph("Итоги работы").runs[0].font.size = Pt(12)
+    doc.save(path)
+
+
+@pytest.mark.parametrize("fields", FIELD_SETS)
+def test_xml_backend_matches_python_docx(tmp_path, fields):
+    path = str(tmp_path / "thesis.docx")
+    _thesis(path)
+    expected = parse_document(path, fields=fields, docx_backend="python-docx")
+    assert parse_document(path, fields=fields, docx_backend="xml") == expected
+
+
+def test_xml_backend_extracts_thesis_features(tmp_path):
+    path = str(tmp_path / "thesis.docx")
+    _thesis(path)
+    data = parse_document(path, docx_backend="xml")
+
+    assert data["page_count"] == 2
+    assert data["page_margins"] == {"left": 30.0, "right": 15.0, "top": 20.0, "bottom": 20.0}
+    assert data["font_settings"] == {"font_family": "Times New Roman", "font_size": 14, "line_spacing": 1.5}
+    assert data["paragraph_indent"] == 1.25
+    assert data["required_elements"][0] == "титульный лист"
+    assert {"содержание", "введение", "теоретическая часть", "заключение"} <= set(data["required_elements"])
+    assert "основная часть" in data["required_elements"]
+    assert "ссылкой" in data["full_text"] and "таблица" not in data["full_text"].lower()
+
+
+def test_xml_backend_without_styles_part(tmp_path):
+    # Документ без styles.xml: python-docx подставляет стили по умолчанию
+    path = str(tmp_path / "plain.docx")
+    doc = Document()
+    doc.add_heading("Введение", 1)
+    doc.add_paragraph("Текст")
+    doc.part.drop_rel(next(rId for rId, rel in doc.part.rels.items() if rel.reltype.endswith("/styles")))
+    doc.save(path)
+    assert parse_document(path, docx_backend="xml") == parse_document(path, docx_backend="python-docx")
+
+
+def test_unknown_docx_backend(tmp_path):
+    path = str(tmp_path / "doc.docx")
+    Document().save(path)
+    with pytest.raises(ValueError):
+        parse_document(path, docx_backend="lxml")
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+from docx import Document
+
+from project.core.exceptions import DocumentParsingTimeout
+from project.gost_checker.engine import ParsingEngine
+
+
+def _slow_job(file_path, seconds=1):
+    time.sleep(seconds)
+    return file_path
+
+
+@pytest.fixture
+def docx_file(tmp_path):
+    path = tmp_path / "doc.docx"
+    doc = Document()
+    doc.add_paragraph("Введение")
+    doc.add_paragraph("Цель работы и задачи работы")
+    doc.save(path)
+    return str(path)
+
+
+def test_engine_parses_in_pool(docx_file):
+    engine = ParsingEngine(pool_size=1, max_tasks_per_child=1, timeout=60)
+    try:
+        data = asyncio.run(engine.parse(docx_file))
+    finally:
+        engine.shutdown()
+    assert data["word_count"] == 6
+    assert "введение" in data["full_text"].lower()
+
+
+def test_engine_timeout(docx_file):
+    engine = ParsingEngine(pool_size=0, timeout=0.1)
+    with pytest.raises(DocumentParsingTimeout):
+        asyncio.run(engine.run(_slow_job, docx_file))
+
+
+def test_engine_timeout_replaces_stuck_pool():
+    engine = ParsingEngine(pool_size=1, timeout=0.5)
+
+    async def run_after_timeout():
+        with pytest.raises(DocumentParsingTimeout):
+            await engine.run(time.sleep, 5)
+        return await engine.run(abs, -1)
+
+    started = time.monotonic()
+    try:
+        assert asyncio.run(run_after_timeout()) == 1
+    finally:
+        engine.shutdown()
+    assert time.monotonic() - started < 4
+
+
+def test_engine_timeout_stops_only_the_stuck_task():
+    engine = ParsingEngine(pool_size=2, timeout=1.5)
+
+    async def stuck_and_healthy():
+        async def healthy():
+            await asyncio.sleep(1)
+            # Заканчивается после остановки зависшей задачи
+            return await engine.run(_slow_job, "ok.docx", 1)
+
+        return await asyncio.gather(engine.run(time.sleep, 10), healthy(), return_exceptions=True)
+
+    try:
+        stuck, healthy = asyncio.run(stuck_and_healthy())
+    finally:
+        engine.shutdown()
+    assert isinstance(stuck, DocumentParsingTimeout)
+    assert healthy == "ok.docx"
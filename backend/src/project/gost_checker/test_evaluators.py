@@ -0,0 +1,63 @@
+import pytest
+
+from project.core.exceptions import RulesValidationError
+from project.gost_checker.checker import GOSTDocumentChecker
+from project.gost_checker.registry import compile_rule
+
+
+def _rule(check_type, expected, field="word_count", **extra):
+    return {"id": f"r_{check_type}", "section": "9.9", "title": "Тестовое правило", "rule_type": "content",
+            "field": field, "expected_value": expected, "check_type": check_type, "severity": "warning", **extra}
+
+
+@pytest.mark.parametrize("rule, value, passed", [
+    (_rule("equals", 1.25, "paragraph_indent"), 1.25, True),
+    (_rule("equals", 1.25, "paragraph_indent"), 1.5, False),
+    (_rule("contains", "заключение", "full_text"), "Текст. ЗАКЛЮЧЕНИЕ", True),
+    (_rule("contains", "заключение", "required_elements"), ["введение", "заключение"], True),
+    (_rule("contains", "заключение", "full_text"), "Текст", False),
+    (_rule("min_value", 1000), 1500, True),
+    (_rule("min_value", 1000), 999, False),
+    (_rule("max_value", 100, "page_count"), 120, False),
+    (_rule("range", {"min": 20, "max": 100}, "page_count"), 60, True),
+    (_rule("range", [20, 100], "page_count"), 10, False),
+    (_rule("object_equals", {"left": 25}, "page_margins"), {"left": 25, "right": 10}, True),
+    (_rule("object_contains", {"left": 25, "top": 20}, "page_margins"), {"left": 25}, False),
+    (_rule("list_presence", ["введение"], "required_elements"), ["1. введение"], True),
+    (_rule("list_presence", ["цель работы"], "introduction_text",
+           synonyms={"цель работы": ["цель исследования"]}), "Цель исследования — ...", True),
+])
+def test_every_check_type_is_dispatched(rule, value, passed):
+    result = compile_rule(rule["id"], rule).evaluate({rule["field"]: value})
+    assert result.rule_id == rule["id"]
+    assert result.is_passed is passed
+
+
+def test_missing_and_mistyped_values_fail_uniformly():
+    evaluate = compile_rule("r", _rule("min_value", 10)).evaluate
+    for document_data in ({}, {"word_count": None}):
+        result = evaluate(document_data)
+        assert not result.is_passed and result.actual is None and "word_count" in result.message
+    assert not evaluate({"word_count": "много"}).is_passed
+
+
+@pytest.mark.parametrize("rule", [
+    _rule("range", {"min": 1}),
+    _rule("min_value", "10"),
+    _rule("object_equals", [1, 2], "page_margins"),
+    _rule("list_presence", "введение", "required_elements"),
+    _rule("unknown", 1),
+    _rule("equals", 1, field="pages"),
+])
+def test_invalid_rules_are_rejected_at_load(rule):
+    with pytest.raises(RulesValidationError):
+        compile_rule(rule["id"], rule)
+
+
+def test_single_rule_and_section_use_evaluators():
+    checker = GOSTDocumentChecker()
+    result = checker._apply_single_rule(_rule("max_value", 100, "page_count"), {"page_count": 80})
+    assert result.is_passed and result.rule_id == "r_max_value"
+
+    results = checker.check_specific_section({"paragraph_indent": 1.25}, "6.1.2")
+    assert [(r.rule_id, r.is_passed) for r in results] == [("6.1.2_paragraph", True)]
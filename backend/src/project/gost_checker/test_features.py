@@ -0,0 +1,39 @@
+from docx import Document
+from docx.shared import Pt
+
+from project.gost_checker.features import FeatureSet
+from project.gost_checker.parser import parse_document
+from project.gost_checker.rule_checker import GOSTRuleChecker
+
+
+def test_feature_set_for_fields():
+    formatting = FeatureSet.for_fields({"font_settings", "page_margins"})
+    assert formatting.fonts and formatting.margins
+    assert not (formatting.structure or formatting.introduction or formatting.text or formatting.indent)
+    assert not FeatureSet.for_fields({"page_count"}).needs_content
+    # Неизвестное поле — извлекаем всё
+    assert FeatureSet.for_fields({"bibliography"}) == FeatureSet()
+
+
+def test_rule_checker_required_fields():
+    checker = GOSTRuleChecker()
+    assert checker.get_required_fields() == {
+        "required_elements", "introduction_text", "font_settings", "page_margins", "paragraph_indent",
+    }
+
+
+def test_parse_only_requested_fields(tmp_path):
+    path = tmp_path / "doc.docx"
+    doc = Document()
+    doc.add_heading("Введение", 1)
+    doc.add_paragraph("Цель работы").runs[0].font.size = Pt(14)
+    doc.save(path)
+
+    data = parse_document(str(path), fields={"font_settings"})
+    assert data["font_settings"]["font_size"] == 14
+    assert data["required_elements"] == []
+    assert data["full_text"] == ""
+
+    data = parse_document(str(path), fields={"required_elements"})
+    assert data["required_elements"] == ["введение"]
+    assert data["font_settings"]["font_size"] is None
@@ -0,0 +1,24 @@
+from project.gost_checker.layout import PageLayout
+
+
+def test_page_layout_groups_chars_into_lines(make_chars):
+    # Символы строк перемешаны, как бывает в потоке содержимого PDF
+    heading = make_chars("1 Введение", 70, 760, size=18)
+    body = make_chars("Текст работы", 105, 730.5)
+    body_second = make_chars("второй абзац", 71, 709)
+    chars = body[:5] + heading + body_second + body[5:]
+
+    layout = PageLayout.from_chars(chars, width=595, height=842)
+
+    assert [line.text for line in layout.lines] == ["1 Введение", "Текст работы", "второй абзац"]
+    assert layout.lines[0].size == 18
+    assert layout.lines[1].x0 == 105
+    assert layout.lines[2].y0 == 709
+    assert layout.font_counts == {"TimesNewRoman": len(chars)}
+    assert layout.text == "1 Введение\nТекст работы\nвторой абзац"
+
+
+def test_page_layout_inserts_spaces_on_gaps(make_chars):
+    chars = make_chars("Список", 70, 500) + make_chars("литературы", 120, 500.4)
+    layout = PageLayout.from_chars(chars, width=595, height=842)
+    assert [line.text for line in layout.lines] == ["Список литературы"]
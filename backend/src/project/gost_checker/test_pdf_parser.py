@@ -0,0 +1,70 @@
+from project.gost_checker.layout import PageLayout
+from project.gost_checker.parser import new_document_data
+from project.gost_checker.pdf_parser import (
+    PT_TO_CM,
+    PdfAggregates,
+    extract_page_features,
+    merge_pdf_shards,
+    split_pages,
+)
+
+
+def _page(make_chars, page_num):
+    chars = []
+    y = 780.0
+    if page_num % 3 == 1:
+        chars += make_chars(f"{page_num}. Глава {page_num}", 71, y, size=18)
+        y -= 30
+    chars += make_chars("Введение" if page_num == 2 else "Текст страницы", 106, y)
+    for index in range(5):
+        y -= 21 + (page_num % 2) * 0.3
+        chars += make_chars(f"строка {index}", 71, y, fontname="Arial" if index == 4 else "TimesNewRoman")
+    chars += make_chars(str(page_num), 297, 20, size=12)
+    return PageLayout.from_chars(chars, width=595, height=842)
+
+
+def test_sharded_merge_matches_sequential(make_chars):
+    pages = [extract_page_features(_page(make_chars, num), num) for num in range(1, 11)]
+
+    sequential = PdfAggregates()
+    for features in pages:
+        sequential.add(features)
+    expected = new_document_data()
+    sequential.fill(expected)
+
+    for shards in (2, 3, 4, 10):
+        parts = []
+        for start, stop in split_pages(len(pages), shards):
+            part = PdfAggregates()
+            for features in pages[start:stop]:
+                part.add(features)
+            parts.append(part)
+        assert merge_pdf_shards(parts, new_document_data()) == expected
+
+    assert "основная часть" in expected["required_elements"]
+    assert expected["font_settings"]["font_family"] == "TimesNewRoman"
+
+
+def test_split_pages():
+    assert split_pages(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert split_pages(2, 8) == [(0, 1), (1, 2)]
+
+
+def test_margins_ignore_page_number_and_indent_is_offset(make_chars):
+    chars = []
+    y = 770.0
+    for index in range(35):
+        x0 = 71 + 35.4 if index % 5 == 0 else 71  # первая строка абзаца с отступом 1.25 см
+        chars += make_chars("строка текста работы " * 3, x0, y)
+        y -= 21
+    chars += make_chars("7", 297, 20, size=12)  # номер страницы у нижнего края
+
+    aggregates = PdfAggregates()
+    aggregates.add(extract_page_features(PageLayout.from_chars(chars, width=595, height=842), 2))
+    data = new_document_data()
+    aggregates.fill(data)
+
+    assert data["page_margins"]["bottom"] == round((y + 21) * 0.3528, 1)
+    assert data["page_margins"]["left"] == round(71 * 0.3528, 1)
+    assert data["paragraph_indent"] == round(35.4 / PT_TO_CM, 2)
+    assert data["font_settings"]["line_spacing"] == round(21 / 14, 1)
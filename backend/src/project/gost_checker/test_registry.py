@@ -0,0 +1,66 @@
+import json
+import os
+
+import pytest
+
+from project.core.exceptions import RulesValidationError
+from project.gost_checker.registry import DEFAULT_RULES_FILE, RuleRegistry, get_rule_registry
+from project.gost_checker.rule_checker import GOSTRuleChecker
+
+
+def _write_rules(path, indent=1.25, version="1.0", mtime=None):
+    rules = json.loads(DEFAULT_RULES_FILE.read_text(encoding="utf-8"))
+    rules["version"] = version
+    rules["rules"]["formatting"]["6.1.2_paragraph"]["expected_value"] = indent
+    path.write_text(json.dumps(rules, ensure_ascii=False), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_registry_compiles_rules_once(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(path)
+    registry = RuleRegistry(str(path), check_interval=0)
+    ruleset = registry.get()
+
+    assert ruleset.version.startswith("1.0+")
+    assert [rule.rule_id for rule in ruleset.compiled] == list(ruleset.rules)
+    assert "paragraph_indent" in ruleset.required_fields
+    assert registry.get() is ruleset  # файл не менялся — тот же снимок
+
+    results = GOSTRuleChecker(registry=registry).check_all_rules({"paragraph_indent": 1.25})
+    indent = next(r for r in results if r.rule_id == "6.1.2_paragraph")
+    assert indent.is_passed
+    assert all(not r.is_passed for r in results if r.rule_id != "6.1.2_paragraph")
+
+
+def test_registry_reloads_changed_file_and_keeps_old_on_error(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(path, mtime=1_000_000)
+    registry = RuleRegistry(str(path), check_interval=0)
+    old = registry.get()
+
+    _write_rules(path, indent=1.5, version="1.1", mtime=1_000_100)
+    new = registry.get()
+    assert new is not old and new.version.startswith("1.1+")
+    assert new.rules["6.1.2_paragraph"]["expected_value"] == 1.5
+    assert old.rules["6.1.2_paragraph"]["expected_value"] == 1.25  # старый снимок не изменился
+
+    path.write_text('{"rules": {"formatting": {"bad": {"id": "bad"}}}}', encoding="utf-8")
+    os.utime(path, (1_000_200, 1_000_200))
+    assert registry.get() is new
+
+
+def test_invalid_rules_file_is_rejected(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(path)
+    rules = json.loads(path.read_text(encoding="utf-8"))
+    rules["rules"]["formatting"]["6.1.2_paragraph"]["check_type"] = "regex"
+    path.write_text(json.dumps(rules), encoding="utf-8")
+    with pytest.raises(RulesValidationError):
+        RuleRegistry(str(path))
+
+
+def test_registry_is_shared_per_file():
+    assert get_rule_registry() is get_rule_registry(str(DEFAULT_RULES_FILE))
+    assert GOSTRuleChecker().registry is get_rule_registry()
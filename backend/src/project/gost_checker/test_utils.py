@@ -0,0 +1,15 @@
+import asyncio
+import io
+
+from fastapi import UploadFile
+
+from project.gost_checker.utils import save_uploaded_file
+
+
+def test_uploaded_file_is_saved_under_its_base_name(tmp_path):
+    content = b"%PDF" * 100_000
+    upload = UploadFile(io.BytesIO(content), filename="../../work.pdf")
+    path = asyncio.run(save_uploaded_file(upload, str(tmp_path)))
+
+    assert path == str(tmp_path / "work.pdf")
+    assert (tmp_path / "work.pdf").read_bytes() == content
@@ -1,19 +1,18 @@
 import os
 import tempfile
+from pathlib import Path
 from typing import Dict, Any
 
-def save_uploaded_file(upload_file, destination_dir: str = None) -> str:
-    """Сохранение загруженного файла во временную директорию"""
+from project.core.uploads import save_upload
+
+async def save_uploaded_file(upload_file, destination_dir: str = None) -> str:
+    """Сохранение загруженного файла во временную директорию (блоками, с атомарным переименованием)"""
     if destination_dir is None:
         destination_dir = tempfile.gettempdir()
-    
-    file_path = os.path.join(destination_dir, upload_file.filename)
-    
-    with open(file_path, 'wb') as buffer:
-        content = upload_file.file.read()
-        buffer.write(content)
-    
-    return file_path
+
+    file_path = Path(destination_dir) / Path(upload_file.filename).name
+    stored = await save_upload(upload_file, file_path)
+    return str(stored.path)
 
 def cleanup_temp_file(file_path: str):
     """Удаление временного файла"""
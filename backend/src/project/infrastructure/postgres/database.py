@@ -1,18 +1,95 @@
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Dict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional
 
+from fastapi import HTTPException
 from sqlalchemy import JSON, MetaData, String
-from sqlalchemy.exc import PendingRollbackError
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import PendingRollbackError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from project.core.config import settings
 from project.core.exceptions import DatabaseError
 
 
-class PostgresDatabase:
+class PoolMetrics:
+    """Ожидание соединения из пула: от запроса до выдачи (включая установку нового соединения)"""
+
     def __init__(self) -> None:
-        self._engine = create_async_engine(settings.postgres_url)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_sec = 0.0
+        self.wait_max_sec = 0.0
+
+    def record(self, wait_sec: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_total_sec += wait_sec
+        self.wait_max_sec = max(self.wait_max_sec, wait_sec)
+
+    def as_dict(self) -> Dict[str, Any]:
+        waits = self.checkouts + self.timeouts
+        return {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.timeouts,
+            "checkout_wait_avg_ms": round(self.wait_total_sec / waits * 1000, 3) if waits else 0.0,
+            "checkout_wait_max_ms": round(self.wait_max_sec * 1000, 3),
+        }
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, считающий время ожидания выдачи соединения"""
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "MeteredQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started)
+        return connection
+
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """Единый движок (и пул соединений) процесса: его используют все сессии и репозитории"""
+    url = make_url(settings.postgres_url).update_query_dict(
+        {"prepared_statement_cache_size": str(settings.POSTGRES_STATEMENT_CACHE_SIZE)}
+    )
+    return create_async_engine(
+        url,
+        poolclass=MeteredQueuePool,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT_SEC,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE_SEC,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.POSTGRES_COMMAND_TIMEOUT_SEC,
+        },
+    )
+
+
+class PostgresDatabase:
+    def __init__(self, engine: Optional[AsyncEngine] = None) -> None:
+        self._engine = engine or get_engine()
         self._session_factory = async_sessionmaker(
             bind=self._engine,
             autocommit=False,
@@ -27,10 +104,29 @@ class PostgresDatabase:
             try:
                 yield session
                 await session.commit()
+            except HTTPException:
+                # Ответ обработчика (404, 409...) — не ошибка БД: откатываем и отдаём как есть
+                await session.rollback()
+                raise
             except (Exception, PendingRollbackError) as error:
                 await session.rollback()
                 raise DatabaseError(message=repr(error))
 
+    def pool_status(self) -> Dict[str, Any]:
+        """Состояние пула соединений для мониторинга"""
+        pool = self._engine.sync_engine.pool
+        status = {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "open_connections": pool.size() + pool.overflow(),
+            "overflow": max(pool.overflow(), 0),  # соединений сверх pool_size
+            "max_overflow": settings.POSTGRES_MAX_OVERFLOW,
+        }
+        if isinstance(pool, MeteredQueuePool):
+            status.update(pool.metrics.as_dict())
+        return status
+
 
 database = PostgresDatabase()
 metadata = MetaData(schema=settings.POSTGRES_SCHEMA)
@@ -38,4 +134,4 @@ metadata = MetaData(schema=settings.POSTGRES_SCHEMA)
 
 class Base(DeclarativeBase):
     metadata = metadata
-    type_annotation_map = {str: String().with_variant(String(255), "postgresql"), Dict[str, Any]: JSON}
\ No newline at end of file
+    type_annotation_map = {str: String().with_variant(String(255), "postgresql"), Dict[str, Any]: JSON}
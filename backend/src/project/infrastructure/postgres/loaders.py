@@ -0,0 +1,18 @@
+"""Профили загрузки связей для запросов репозиториев.
+
+Связи моделей по умолчанию не загружаются (lazy="raise"), поэтому запрос к справочнику
+(статус, тип замечания) читает одну строку, а не всю связанную таблицу. Запрос, которому
+связи нужны, подключает профиль: select(Documents).options(*DOCUMENT_WITH_MISTAKES).
+"""
+from sqlalchemy.orm import contains_eager, raiseload, selectinload
+
+from project.infrastructure.postgres.models import Check, Documents, Mistake
+
+# Только столбцы строки; связи недоступны даже при изменении lazy в моделях (справочники)
+ROW_ONLY = (raiseload("*"),)
+
+# Документ с его замечаниями и их типами
+DOCUMENT_WITH_MISTAKES = (selectinload(Documents.mistakes).joinedload(Mistake.mistake_type),)
+
+# Проверка с документом из JOIN, уже присутствующего в запросе
+CHECK_WITH_JOINED_DOCUMENT = (contains_eager(Check.document),)
\ No newline at end of file
@@ -1,12 +1,16 @@
 from decimal import Decimal
 from datetime import datetime, date
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import String, ForeignKey, Integer, DateTime, Boolean, Text, Date, Numeric, BigInteger
+from sqlalchemy import String, ForeignKey, Integer, DateTime, Boolean, Text, Date, Numeric, BigInteger, Index, desc, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from project.infrastructure.postgres.database import Base
 
+# Все связи объявлены lazy="raise": обращение к незагруженной связи — ошибка, а не скрытый запрос.
+# Что подгрузить, задаёт сам запрос профилем из loaders.py
+
 
 class Users(Base):
     __tablename__ = "users"
@@ -36,16 +40,25 @@ class Users(Base):
 
     # ИСПРАВЛЕНО: Documents (с s), и "Users" (с s)
     documents: Mapped[list["Documents"]] = relationship(
-        "Documents", back_populates="user", cascade="all, delete-orphan"
+        "Documents", back_populates="user", cascade="all, delete-orphan", lazy="raise"
     )
     reviews: Mapped[list["Review"]] = relationship(
-        "Review", back_populates="user", cascade="all, delete-orphan"
+        "Review", back_populates="user", cascade="all, delete-orphan", lazy="raise"
     )
 
 
 class Documents(Base):
     __tablename__ = "documents"
-    __table_args__ = {"comment": "Документы"}
+    __table_args__ = (
+        # Страницы списков документов (новые сначала, ключ upload_datetime, document_id — pagination.py);
+        # индексы по user_id и status_id покрывают и поиск по одному внешнему ключу
+        Index("ix_documents_upload_datetime_document_id", desc("upload_datetime"), desc("document_id")),
+        Index("ix_documents_user_id_upload_datetime_document_id",
+              "user_id", desc("upload_datetime"), desc("document_id")),
+        Index("ix_documents_status_id_upload_datetime_document_id",
+              "status_id", desc("upload_datetime"), desc("document_id")),
+        {"comment": "Документы"},
+    )
 
     document_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
@@ -60,14 +73,16 @@ class Documents(Base):
     report_pdf_path: Mapped[str] = mapped_column(String(500), nullable=False)
     score: Mapped[int] = mapped_column(Integer, nullable=False, comment="Соответствие стандарту (0-100)")
     analysis_time: Mapped[Decimal] = mapped_column(Numeric(7, 2), nullable=False)
+    content_sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True,
+                                                          comment="SHA-256 содержимого файла")
 
     # ИСПРАВЛЕНО: user → Users (с s), и только один mistakes
     mistakes: Mapped[list["Mistake"]] = relationship(
-        "Mistake", back_populates="document", cascade="all, delete-orphan", lazy="selectin"
+        "Mistake", back_populates="document", cascade="all, delete-orphan", lazy="raise"
     )
-    status: Mapped["Status"] = relationship("Status", back_populates="documents")
-    user: Mapped["Users"] = relationship("Users", back_populates="documents")   # ← Users с s
-    checks: Mapped[list["Check"]] = relationship("Check", back_populates="document", cascade="all, delete-orphan")
+    status: Mapped["Status"] = relationship("Status", back_populates="documents", lazy="raise")
+    user: Mapped["Users"] = relationship("Users", back_populates="documents", lazy="raise")   # ← Users с s
+    checks: Mapped[list["Check"]] = relationship("Check", back_populates="document", cascade="all, delete-orphan", lazy="raise")
 
 
 class Standart(Base):
@@ -78,31 +93,115 @@ class Standart(Base):
     description: Mapped[str] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     is_custom: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    checks: Mapped[list["Check"]] = relationship("Check", back_populates="standard", cascade="all, delete-orphan")
+    checks: Mapped[list["Check"]] = relationship("Check", back_populates="standard", cascade="all, delete-orphan", lazy="raise")
 
 
 class Check(Base):
     __tablename__ = "check"
+    __table_args__ = (
+        # Поиск проверок по содержимому отчёта: result @> '{"report": {"results": [{"rule_id": ...}]}}'
+        Index("ix_check_result", "result", postgresql_using="gin", postgresql_ops={"result": "jsonb_path_ops"}),
+    )
     check_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    document_id: Mapped[int] = mapped_column(ForeignKey("documents.document_id"), nullable=False)
-    standart_id: Mapped[int] = mapped_column(ForeignKey("standart.standart_id"), nullable=False)
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.document_id"), nullable=False, index=True)
+    standart_id: Mapped[int] = mapped_column(ForeignKey("standart.standart_id"), nullable=False, index=True)
     checked_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    result: Mapped[str] = mapped_column(String, nullable=True)
+    result: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     report_path: Mapped[str] = mapped_column(String, nullable=True)
     score: Mapped[int] = mapped_column(Integer, nullable=True, default=0)
 
-    document: Mapped["Documents"] = relationship("Documents", back_populates="checks")
-    standard: Mapped["Standart"] = relationship("Standart", back_populates="checks")
-    reports: Mapped[list["Reports"]] = relationship("Reports", back_populates="check", cascade="all, delete-orphan")
+    document: Mapped["Documents"] = relationship("Documents", back_populates="checks", lazy="raise")
+    standard: Mapped["Standart"] = relationship("Standart", back_populates="checks", lazy="raise")
+    reports: Mapped[list["Reports"]] = relationship("Reports", back_populates="check", cascade="all, delete-orphan", lazy="raise")
+
+
+class CheckJob(Base):
+    __tablename__ = "check_jobs"
+    __table_args__ = (
+        Index("ix_check_jobs_state_run_after", "state", "run_after"),
+        # Не больше одного незавершённого задания на документ и версию правил
+        Index("uq_check_jobs_pending_document", "document_id", "ruleset_version", unique=True,
+              postgresql_where=text("state IN ('queued', 'running')")),
+        {"comment": "Очередь проверок ГОСТ"},
+    )
+    job_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment="Идентификатор")
+    check_id: Mapped[int] = mapped_column(ForeignKey("check.check_id", ondelete="CASCADE"), unique=True, nullable=False)
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.document_id", ondelete="CASCADE"), nullable=False)
+    state: Mapped[str] = mapped_column(String(20), nullable=False, comment="queued, running, done, failed")
+    kind: Mapped[str] = mapped_column(String(20), nullable=False, default="check", server_default="check",
+                                      comment="check — разбор файла, rescore — переоценка по сохранённым признакам")
+    ruleset_version: Mapped[Optional[str]] = mapped_column(String(64), nullable=True,
+                                                           comment="Версия правил на момент постановки")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Сколько раз задание брали в работу")
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="Воркер, взявший задание")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False,
+                                                comment="Не брать в работу раньше (отложенный повтор)")
+    locked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, comment="Когда взято в работу")
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class CheckRuleResult(Base):
+    __tablename__ = "check_rule_results"
+    __table_args__ = (
+        # Документы, не прошедшие правило (страницы новые сначала)
+        Index("ix_check_rule_results_rule_id_is_passed_check_id", "rule_id", "is_passed", "check_id"),
+        Index("ix_check_rule_results_checked_at", "checked_at"),
+        {"comment": "Результаты правил проверок (копия report.results для аналитики)"},
+    )
+    check_id: Mapped[int] = mapped_column(ForeignKey("check.check_id", ondelete="CASCADE"), primary_key=True)
+    rule_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    document_id: Mapped[int] = mapped_column(ForeignKey("documents.document_id", ondelete="CASCADE"), nullable=False)
+    section: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="Пункт ГОСТ")
+    severity: Mapped[str] = mapped_column(String(20), nullable=False)
+    is_passed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    expected_value: Mapped[Optional[Any]] = mapped_column(JSONB, nullable=True)
+    actual_value: Mapped[Optional[Any]] = mapped_column(JSONB, nullable=True)
+    checked_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False,
+                                                 comment="Время проверки (копия check.checked_at)")
+
+
+class DocumentFeatures(Base):
+    __tablename__ = "document_features"
+    __table_args__ = {"comment": "Извлечённые признаки документов"}
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.document_id", ondelete="CASCADE"), primary_key=True
+    )
+    parser_version: Mapped[str] = mapped_column(String(20), nullable=False, comment="PARSER_VERSION при извлечении")
+    fields: Mapped[list] = mapped_column(JSONB, nullable=False, comment="Извлечённые поля document_data")
+    features: Mapped[dict] = mapped_column(JSONB, nullable=False, comment="document_data (только поля fields)")
+    extracted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+
+
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+    __table_args__ = {"comment": "Незавершённые загрузки файлов по частям"}
+    upload_id: Mapped[str] = mapped_column(String(32), primary_key=True, comment="Идентификатор")
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
+    filename: Mapped[str] = mapped_column(String, nullable=False, comment="Исходное имя файла")
+    doc_type: Mapped[str] = mapped_column(String, nullable=False)
+    is_example: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    total_size: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="Объявленный размер файла, байт")
+    chunk_size: Mapped[int] = mapped_column(Integer, nullable=False, comment="Размер части, байт")
+    received_size: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0,
+                                               comment="Сколько байт от начала файла уже записано")
+    temp_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    writing_until: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, comment="До какого времени часть передаётся (NULL — никто не пишет)"
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
 
 
 class Reports(Base):
     __tablename__ = "reports"
     report_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    check_id: Mapped[int] = mapped_column(ForeignKey("check.check_id"), nullable=False)
+    check_id: Mapped[int] = mapped_column(ForeignKey("check.check_id"), nullable=False, index=True)
     report_json: Mapped[str] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    check: Mapped["Check"] = relationship("Check", back_populates="reports")
+    check: Mapped["Check"] = relationship("Check", back_populates="reports", lazy="raise")
 
 
 class Review(Base):
@@ -113,15 +212,15 @@ class Review(Base):
     rating: Mapped[int] = mapped_column(Integer, nullable=False, comment="Оценка от 1 до 5 звезд")
     review_text: Mapped[str] = mapped_column(Text, nullable=True, comment="Текст отзыва")
     created_at: Mapped[date] = mapped_column(Date, nullable=False, comment="Время отправки отзыва")
-    user: Mapped["Users"] = relationship("Users", back_populates="reviews")  # ← Users с s
+    user: Mapped["Users"] = relationship("Users", back_populates="reviews", lazy="raise")  # ← Users с s
 
 
 class Status(Base):
     __tablename__ = "statuses"
     __table_args__ = {"comment": "Статусы"}
     status_id: Mapped[int] = mapped_column(primary_key=True, comment="Индентификатор")
-    status_name: Mapped[str] = mapped_column(String(60), nullable=False)
-    documents: Mapped[list["Documents"]] = relationship("Documents", back_populates="status", lazy="selectin")
+    status_name: Mapped[str] = mapped_column(String(60), nullable=False, index=True)
+    documents: Mapped[list["Documents"]] = relationship("Documents", back_populates="status", lazy="raise")
 
 
 class MistakeType(Base):
@@ -129,17 +228,22 @@ class MistakeType(Base):
     __table_args__ = {"comment": "Типы ошибок"}
     mistake_type_id: Mapped[int] = mapped_column(primary_key=True, comment="Индентификатор")
     mistake_type_name: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
-    mistakes: Mapped[list["Mistake"]] = relationship("Mistake", back_populates="mistake_type", cascade="all, delete-orphan", lazy="selectin")
+    mistakes: Mapped[list["Mistake"]] = relationship("Mistake", back_populates="mistake_type", cascade="all, delete-orphan", lazy="raise")
 
 
 class Mistake(Base):
     __tablename__ = "mistakes"
-    __table_args__ = {"comment": "Ошибки"}
+    __table_args__ = (
+        # Страницы ошибок документа и типа в порядке mistake_id
+        Index("ix_mistakes_document_id_mistake_id", "document_id", "mistake_id"),
+        Index("ix_mistakes_mistake_type_id_mistake_id", "mistake_type_id", "mistake_id"),
+        {"comment": "Ошибки"},
+    )
     mistake_id: Mapped[int] = mapped_column(primary_key=True, comment="Индентификатор")
     mistake_type_id: Mapped[int] = mapped_column(ForeignKey("mistake_types.mistake_type_id"), nullable=True)
     description: Mapped[str] = mapped_column(Text, nullable=False, comment="Описание ошибки")
     critical_status: Mapped[str] = mapped_column(String(20), nullable=False)
     document_id: Mapped[int] = mapped_column(ForeignKey("documents.document_id"), nullable=False)
 
-    document: Mapped["Documents"] = relationship("Documents", back_populates="mistakes", lazy="selectin")
-    mistake_type: Mapped["MistakeType"] = relationship("MistakeType", back_populates="mistakes")
\ No newline at end of file
+    document: Mapped["Documents"] = relationship("Documents", back_populates="mistakes", lazy="raise")
+    mistake_type: Mapped["MistakeType"] = relationship("MistakeType", back_populates="mistakes", lazy="raise")
\ No newline at end of file
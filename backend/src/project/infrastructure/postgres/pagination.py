@@ -0,0 +1,70 @@
+"""Постраничная выборка по ключу сортировки (keyset).
+
+Страница продолжается условием (столбцы ключа) < (значения последней строки) вместо OFFSET,
+поэтому при индексе по тем же столбцам в том же порядке стоимость страницы не зависит
+от её номера и размера таблицы. Последний столбец ключа — уникальный id, он делает порядок
+однозначным при равных датах.
+
+Курсор — base64url от JSON со значениями ключа последней строки; клиент передаёт его как есть.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.core.exceptions import InvalidCursor
+
+
+class Keyset:
+    """Ключ сортировки страниц: столбцы модели, все в одном направлении"""
+
+    def __init__(self, *columns, descending: bool = True):
+        self.columns = columns
+        self.descending = descending
+
+    @property
+    def order_by(self) -> list:
+        return [column.desc() if self.descending else column.asc() for column in self.columns]
+
+    def encode(self, row: Any) -> str:
+        values = [getattr(row, column.key) for column in self.columns]
+        payload = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError(cursor)
+            return [self._load(column, value) for column, value in zip(self.columns, values)]
+        except (ValueError, TypeError, binascii.Error):
+            raise InvalidCursor(cursor=cursor)
+
+    def after(self, cursor: str):
+        """Условие «строки после курсора» в порядке ключа"""
+        key, values = tuple_(*self.columns), tuple_(*self.decode(cursor))
+        return key < values if self.descending else key > values
+
+    @staticmethod
+    def _load(column, value):
+        python_type = column.type.python_type
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is int and (isinstance(value, bool) or not isinstance(value, int)):
+            raise TypeError(value)
+        return value
+
+
+async def fetch_page(session: AsyncSession, query: Select, keyset: Keyset, limit: int,
+                     cursor: Optional[str] = None) -> tuple[list, Optional[str]]:
+    """Строки страницы и курсор следующей (None — страница последняя)"""
+    if cursor:
+        query = query.where(keyset.after(cursor))
+    rows = (await session.scalars(query.order_by(*keyset.order_by).limit(limit + 1))).all()
+    if len(rows) <= limit:
+        return list(rows), None
+    return list(rows[:limit]), keyset.encode(rows[limit - 1])
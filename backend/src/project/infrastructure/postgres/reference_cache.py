@@ -0,0 +1,74 @@
+"""ID справочных строк (статусы, типы замечаний, стандарт ГОСТ по умолчанию) в памяти процесса.
+
+Проверка документа обращается к справочникам по имени несколько раз; после первого запроса
+ID берётся из кэша. Админские маршруты справочников сбрасывают кэш после commit. Другие
+процессы (воркер проверок) узнают об изменении через REFERENCE_CACHE_TTL_SEC.
+Созданная здесь строка кэшируется только при следующем чтении: транзакция вызывающего
+может откатиться.
+"""
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.core.config import settings
+from project.infrastructure.postgres.models import MistakeType, Standart, Status
+
+GOST_STANDARD_NAME = "ГОСТ для курсовых работ"
+
+
+class ReferenceCache:
+    def __init__(self):
+        self._ids: Dict[Tuple[str, str], Tuple[int, float]] = {}
+
+    async def status_id(self, session: AsyncSession, status_name: str) -> int:
+        return await self._get_id(
+            session, Status, Status.status_id, Status.status_name, status_name,
+            lambda: Status(status_name=status_name),
+        )
+
+    async def mistake_type_id(self, session: AsyncSession, mistake_type_name: str) -> int:
+        return await self._get_id(
+            session, MistakeType, MistakeType.mistake_type_id, MistakeType.mistake_type_name, mistake_type_name,
+            lambda: MistakeType(mistake_type_name=mistake_type_name),
+        )
+
+    async def standard_id(self, session: AsyncSession) -> int:
+        """Стандарт, по которому идут автоматические проверки"""
+        return await self._get_id(
+            session, Standart, Standart.standart_id, Standart.name, GOST_STANDARD_NAME,
+            lambda: Standart(
+                name=GOST_STANDARD_NAME,
+                version="1.0",
+                description="Автоматическая проверка курсовых работ на соответствие ГОСТ",
+                is_custom=False,
+            ),
+        )
+
+    def invalidate(self, model: Optional[type] = None) -> None:
+        """Сбросить ID справочника model (None — всех)"""
+        if model is None:
+            self._ids.clear()
+            return
+        for key in [key for key in self._ids if key[0] == model.__tablename__]:
+            del self._ids[key]
+
+    async def _get_id(self, session: AsyncSession, model: type, id_column, name_column, name: str,
+                      create: Callable[[], object]) -> int:
+        key = (model.__tablename__, name)
+        cached = self._ids.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        row_id = await session.scalar(select(id_column).where(name_column == name).order_by(id_column).limit(1))
+        if row_id is None:
+            row = create()
+            session.add(row)
+            await session.flush()
+            return getattr(row, id_column.key)
+        self._ids[key] = (row_id, time.monotonic() + settings.REFERENCE_CACHE_TTL_SEC)
+        return row_id
+
+
+reference_cache = ReferenceCache()
@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Set, Tuple, Type
+
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.infrastructure.postgres.models import CheckJob, Documents
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+PENDING_STATES = (JOB_QUEUED, JOB_RUNNING)
+
+KIND_CHECK = "check"
+KIND_RESCORE = "rescore"  # по сохранённым признакам, файл разбирается, только если их нет
+
+# Пространство ключей pg_advisory_xact_lock(classid, objid) для постановки проверок документа
+CHECK_START_LOCK_CLASS = 7032
+
+
+class CheckJobRepository:
+    """Очередь проверок ГОСТ в таблице check_jobs.
+
+    Задания забираются через SELECT ... FOR UPDATE SKIP LOCKED, поэтому несколько воркеров
+    (в одном или разных процессах) не получат одно задание дважды. Задание в состоянии running,
+    чей воркер не отчитался за lock_timeout, считается брошенным и снова выдаётся.
+    """
+    _collection: Type[CheckJob] = CheckJob
+
+    async def lock_document(self, session: AsyncSession, document_id: int) -> None:
+        """Сериализует постановку проверок документа между процессами до конца транзакции"""
+        await session.execute(select(func.pg_advisory_xact_lock(CHECK_START_LOCK_CLASS, document_id)))
+
+    async def lock_next_documents(self, session: AsyncSession, after_document_id: int, limit: int) -> List[int]:
+        """Следующие limit документов после after_document_id (по возрастанию) с той же блокировкой,
+        что у lock_document: постановка их проверок из API ждёт конца транзакции
+        """
+        batch = (
+            select(Documents.document_id)
+            .where(Documents.document_id > after_document_id)
+            .order_by(Documents.document_id)
+            .limit(limit)
+            .subquery()
+        )
+        rows = await session.execute(
+            select(batch.c.document_id, func.pg_advisory_xact_lock(CHECK_START_LOCK_CLASS, batch.c.document_id))
+        )
+        return [row.document_id for row in rows]
+
+    async def find_pending_documents(self, session: AsyncSession, document_ids: Iterable[int],
+                                     ruleset_version: Optional[str]) -> Set[int]:
+        """Документы из document_ids, у которых есть незавершённое задание для той же версии правил"""
+        query = select(self._collection.document_id).where(
+            self._collection.document_id.in_(list(document_ids)),
+            self._collection.ruleset_version == ruleset_version,
+            self._collection.state.in_(PENDING_STATES),
+        )
+        return set((await session.scalars(query)).all())
+
+    async def find_pending(self, session: AsyncSession, document_id: int,
+                           ruleset_version: Optional[str]) -> Optional[CheckJob]:
+        """Незавершённое задание документа для той же версии правил"""
+        query = select(self._collection).where(
+            self._collection.document_id == document_id,
+            self._collection.ruleset_version == ruleset_version,
+            self._collection.state.in_(PENDING_STATES),
+        )
+        return await session.scalar(query)
+
+    async def enqueue(self, session: AsyncSession, check_id: int, document_id: int,
+                      max_attempts: int = 3, ruleset_version: Optional[str] = None) -> CheckJob:
+        job = self._collection(
+            check_id=check_id,
+            document_id=document_id,
+            state=JOB_QUEUED,
+            ruleset_version=ruleset_version,
+            attempts=0,
+            max_attempts=max_attempts,
+        )
+        session.add(job)
+        await session.flush()
+        return job
+
+    async def enqueue_many(self, session: AsyncSession, checks: Iterable[Tuple[int, int]], kind: str,
+                           max_attempts: int = 3, ruleset_version: Optional[str] = None) -> int:
+        """Ставит задания для пар (check_id, document_id) одним INSERT; возвращает их число"""
+        now = datetime.now()
+        rows = [
+            {"check_id": check_id, "document_id": document_id, "state": JOB_QUEUED, "kind": kind,
+             "ruleset_version": ruleset_version, "attempts": 0, "max_attempts": max_attempts,
+             "created_at": now, "run_after": now}
+            for check_id, document_id in checks
+        ]
+        if rows:
+            await session.execute(insert(self._collection).values(rows))
+        return len(rows)
+
+    async def add_completed(self, session: AsyncSession, check_id: int, document_id: int,
+                            ruleset_version: Optional[str]) -> CheckJob:
+        """Задание для проверки, завершённой без разбора (готовый отчёт взят из другой проверки)"""
+        now = datetime.now()
+        job = self._collection(
+            check_id=check_id,
+            document_id=document_id,
+            state=JOB_DONE,
+            ruleset_version=ruleset_version,
+            attempts=0,
+            max_attempts=0,
+            finished_at=now,
+        )
+        session.add(job)
+        await session.flush()
+        return job
+
+    async def claim(self, session: AsyncSession, worker_id: str, lock_timeout: float) -> Optional[CheckJob]:
+        """Берёт в работу одно готовое задание; фиксируется вместе с транзакцией сессии"""
+        now = datetime.now()
+        query = (
+            select(self._collection)
+            .where(or_(
+                and_(self._collection.state == JOB_QUEUED, self._collection.run_after <= now),
+                and_(self._collection.state == JOB_RUNNING,
+                     self._collection.locked_at < now - timedelta(seconds=lock_timeout)),
+            ))
+            .order_by(self._collection.run_after, self._collection.job_id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = await session.scalar(query)
+        if job is None:
+            return None
+        job.state = JOB_RUNNING
+        job.attempts += 1
+        job.worker_id = worker_id
+        job.locked_at = now
+        await session.flush()
+        return job
+
+    def _owned(self, job_id: int, worker_id: str, attempt: int):
+        """Условие «задание всё ещё у этого воркера»: после перевыдачи по lock_timeout
+        у задания другой worker_id или attempts, и опоздавший воркер ничего не меняет
+        """
+        return and_(
+            self._collection.job_id == job_id,
+            self._collection.state == JOB_RUNNING,
+            self._collection.worker_id == worker_id,
+            self._collection.attempts == attempt,
+        )
+
+    async def complete(self, session: AsyncSession, job_id: int, worker_id: str, attempt: int) -> bool:
+        """Отмечает задание выполненным; False — задание уже перевыдано другому воркеру"""
+        result = await session.execute(
+            update(self._collection)
+            .where(self._owned(job_id, worker_id, attempt))
+            .values(state=JOB_DONE, last_error=None, finished_at=datetime.now())
+        )
+        return result.rowcount > 0
+
+    async def fail(self, session: AsyncSession, job_id: int, worker_id: str, attempt: int, error: str,
+                   retry_delay: float) -> Optional[str]:
+        """Отмечает неудачную попытку. Возвращает новое состояние: JOB_QUEUED — задание вернётся
+        в очередь, JOB_FAILED — попытки исчерпаны, None — задание уже перевыдано другому воркеру
+        """
+        now = datetime.now()
+        retry = self._collection.attempts < self._collection.max_attempts
+        return await session.scalar(
+            update(self._collection)
+            .where(self._owned(job_id, worker_id, attempt))
+            .values(
+                last_error=error,
+                locked_at=None,
+                state=case((retry, JOB_QUEUED), else_=JOB_FAILED),
+                run_after=case((retry, now + timedelta(seconds=retry_delay * attempt)),
+                               else_=self._collection.run_after),
+                finished_at=case((retry, None), else_=now),
+            )
+            .returning(self._collection.state)
+        )
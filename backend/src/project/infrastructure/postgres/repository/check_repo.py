@@ -3,12 +3,16 @@ from collections.abc import Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.exc import IntegrityError, InterfaceError
-from sqlalchemy.orm import joinedload
 
-from project.schemas.check import CheckCreate, CheckSchema
-from project.infrastructure.postgres.models import Check
+from project.schemas.check import CheckCreate, CheckFilters, CheckSchema
+from project.schemas.pagination import Page, PageQuery
+from project.infrastructure.postgres.loaders import CHECK_WITH_JOINED_DOCUMENT
+from project.infrastructure.postgres.models import Check, Documents
+from project.infrastructure.postgres.pagination import Keyset, fetch_page
 from project.core.exceptions import CheckNotFound, CheckAlreadyExists
 
+CHECKS_KEYSET = Keyset(Check.check_id)
+
 
 class CheckRepository:
     _collection: Type[Check] = Check
@@ -20,10 +24,8 @@ class CheckRepository:
         except (Exception, InterfaceError):
             return False
 
-    async def get_all_checks(self, session: AsyncSession) -> list[CheckSchema]:
-        query = select(self._collection)
-        checks = await session.scalars(query)
-        return [CheckSchema.model_validate(obj=check) for check in checks.all()]
+    async def get_all_checks(self, session: AsyncSession, page: PageQuery, filters: CheckFilters) -> Page[CheckSchema]:
+        return await self._checks_page(session, select(self._collection), page, filters)
 
     async def get_check_by_id(self, session: AsyncSession, check_id: int) -> CheckSchema:
         query = select(self._collection).where(self._collection.check_id == check_id)
@@ -42,6 +44,23 @@ class CheckRepository:
         checks = await session.scalars(query)
         return checks.all()
 
+    async def get_checks_by_rule(self, session: AsyncSession, rule_id: str, page: PageQuery,
+                                 severity: str | None = None, failed: bool = True) -> Page[CheckSchema]:
+        """Проверки, в отчёте которых есть результат правила rule_id (индекс ix_check_result)"""
+        entry = {"rule_id": rule_id}
+        if severity is not None:
+            entry["severity"] = severity
+        if failed:
+            entry["is_passed"] = False
+        query = select(self._collection).where(
+            self._collection.result.contains({"report": {"results": [entry]}})
+        )
+        rows, next_cursor = await fetch_page(session, query, CHECKS_KEYSET, page.limit, page.cursor)
+        return Page[CheckSchema](
+            items=[CheckSchema.model_validate(obj=check) for check in rows],
+            next_cursor=next_cursor,
+        )
+
     async def create_check(self, session: AsyncSession, check: CheckCreate) -> CheckSchema:
         # Проверяем уникальность комбинации document_id и standart_id
         existing_checks = await self.get_checks_by_document_id(session, document_id=check.document_id)
@@ -85,12 +104,30 @@ class CheckRepository:
         if not result.rowcount:
             raise CheckNotFound(_id=check_id)
 
-    async def get_checks_by_user_id(self, session: AsyncSession, user_id: int) -> list[CheckSchema]:
+    async def get_checks_by_user_id(self, session: AsyncSession, user_id: int, page: PageQuery,
+                                    filters: CheckFilters) -> Page[CheckSchema]:
         query = (
             select(self._collection)
             .join(self._collection.document)
-            .where(self._collection.document.has(user_id=user_id))
-            .options(joinedload(self._collection.document))
+            .where(Documents.user_id == user_id)
+            .options(*CHECK_WITH_JOINED_DOCUMENT)
+        )
+        return await self._checks_page(session, query, page, filters)
+
+    async def _checks_page(self, session: AsyncSession, query, page: PageQuery,
+                           filters: CheckFilters) -> Page[CheckSchema]:
+        """Новые проверки сначала (по первичному ключу)"""
+        checks = self._collection
+        if filters.checked_from is not None:
+            query = query.where(checks.checked_at >= filters.checked_from)
+        if filters.checked_to is not None:
+            query = query.where(checks.checked_at < filters.checked_to)
+        if filters.score_min is not None:
+            query = query.where(checks.score >= filters.score_min)
+        if filters.score_max is not None:
+            query = query.where(checks.score <= filters.score_max)
+        rows, next_cursor = await fetch_page(session, query, CHECKS_KEYSET, page.limit, page.cursor)
+        return Page[CheckSchema](
+            items=[CheckSchema.model_validate(obj=check) for check in rows],
+            next_cursor=next_cursor,
         )
-        checks = await session.scalars(query)
-        return [CheckSchema.model_validate(obj=check) for check in checks.all()]
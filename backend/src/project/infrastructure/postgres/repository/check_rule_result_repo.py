@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Type
+
+from sqlalchemy import false, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.infrastructure.postgres.models import Check, CheckRuleResult
+from project.infrastructure.postgres.pagination import Keyset, fetch_page
+from project.schemas.pagination import Page, PageQuery
+from project.schemas.rule_results import RuleFailureSchema, RuleStatsSchema
+
+RULE_FAILURES_KEYSET = Keyset(CheckRuleResult.check_id)
+
+
+class CheckRuleResultRepository:
+    """Результаты правил проверок построчно: агрегаты по правилам считаются в SQL, без разбора отчётов"""
+    _collection: Type[CheckRuleResult] = CheckRuleResult
+
+    async def save(self, session: AsyncSession, check_id: int, document_id: int,
+                   results: Iterable[Dict[str, Any]]) -> None:
+        """Записывает результаты отчёта одним INSERT (без commit — фиксирует вызывающий).
+
+        Повтор для той же проверки (новая попытка задания) перезаписывает строки.
+        """
+        now = datetime.now()
+        rows = {
+            r["rule_id"]: {
+                "check_id": check_id,
+                "rule_id": r["rule_id"],
+                "document_id": document_id,
+                "section": r.get("section"),
+                "severity": r.get("severity") or "info",
+                "is_passed": bool(r.get("is_passed")),
+                "expected_value": r.get("expected_value"),
+                "actual_value": r.get("actual_value"),
+                "checked_at": now,
+            }
+            for r in results if r.get("rule_id")
+        }
+        if not rows:
+            return
+        query = insert(self._collection).values(list(rows.values()))
+        query = query.on_conflict_do_update(
+            index_elements=[self._collection.check_id, self._collection.rule_id],
+            set_={key: query.excluded[key] for key in ("document_id", "section", "severity", "is_passed",
+                                                       "expected_value", "actual_value", "checked_at")},
+        )
+        await session.execute(query)
+
+    async def get_rule_stats(self, session: AsyncSession, date_from: Optional[datetime] = None,
+                             date_to: Optional[datetime] = None, severity: Optional[str] = None,
+                             limit: int = 20) -> list[RuleStatsSchema]:
+        """Правила, чаще всего не пройденные за период"""
+        results = self._collection
+        failed = results.is_passed == false()
+        query = (
+            select(
+                results.rule_id,
+                func.max(results.section).label("section"),
+                func.count().label("total"),
+                func.count().filter(failed).label("failed"),
+                func.count(results.document_id.distinct()).filter(failed).label("failed_documents"),
+            )
+            .group_by(results.rule_id)
+            .order_by(func.count().filter(failed).desc(), results.rule_id)
+            .limit(limit)
+        )
+        if date_from is not None:
+            query = query.where(results.checked_at >= date_from)
+        if date_to is not None:
+            query = query.where(results.checked_at < date_to)
+        if severity is not None:
+            query = query.where(results.severity == severity)
+        rows = (await session.execute(query)).mappings().all()
+        return [RuleStatsSchema(**row, fail_rate=row["failed"] / row["total"]) for row in rows]
+
+    async def get_rule_failures(self, session: AsyncSession, rule_id: str, page: PageQuery,
+                                latest_only: bool = True) -> Page[RuleFailureSchema]:
+        """Документы, не прошедшие правило; latest_only — только по последней проверке документа"""
+        results = self._collection
+        query = select(results).where(results.rule_id == rule_id, results.is_passed == false())
+        if latest_only:
+            latest_check = (
+                select(func.max(Check.check_id))
+                .where(Check.document_id == results.document_id)
+                .scalar_subquery()
+            )
+            query = query.where(results.check_id == latest_check)
+        rows, next_cursor = await fetch_page(session, query, RULE_FAILURES_KEYSET, page.limit, page.cursor)
+        return Page[RuleFailureSchema](
+            items=[RuleFailureSchema.model_validate(obj=row) for row in rows],
+            next_cursor=next_cursor,
+        )
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Type
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.infrastructure.postgres.models import DocumentFeatures
+
+
+class DocumentFeaturesRepository:
+    """Сохранённые document_data: по ним проверка повторяется без разбора файла"""
+    _collection: Type[DocumentFeatures] = DocumentFeatures
+
+    async def save(self, session: AsyncSession, document_id: int, parser_version: str,
+                   features: Dict[str, Any], fields: Iterable[str]) -> None:
+        """Сохраняет извлечённые поля документа, заменяя прежние"""
+        fields = sorted(fields)
+        values = {
+            "document_id": document_id,
+            "parser_version": parser_version,
+            "fields": fields,
+            "features": {field: features.get(field) for field in fields},
+            "extracted_at": datetime.now(),
+        }
+        query = insert(self._collection).values(values)
+        query = query.on_conflict_do_update(
+            index_elements=[self._collection.document_id],
+            set_={key: query.excluded[key] for key in values if key != "document_id"},
+        )
+        await session.execute(query)
+
+    async def get(self, session: AsyncSession, document_id: int) -> Optional[DocumentFeatures]:
+        return await session.get(self._collection, document_id)
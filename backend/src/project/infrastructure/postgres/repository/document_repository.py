@@ -1,13 +1,19 @@
-from typing import Type
+from typing import Optional, Type
 
 from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import InterfaceError
 
-from project.schemas.documents import DocumentCreate, DocumentSchema, DocumentUpdate
+from project.schemas.documents import DocumentCreate, DocumentFilters, DocumentSchema, DocumentUpdate
+from project.schemas.mistake import MistakeSchema
+from project.schemas.pagination import Page, PageQuery
+from project.infrastructure.postgres.loaders import DOCUMENT_WITH_MISTAKES
 from project.infrastructure.postgres.models import Documents
+from project.infrastructure.postgres.pagination import Keyset, fetch_page
 from project.core.exceptions import DocumentNotFound
 
+DOCUMENTS_KEYSET = Keyset(Documents.upload_datetime, Documents.document_id)
+
 
 class DocumentRepository:
     _collection: Type[Documents] = Documents
@@ -26,25 +32,62 @@ class DocumentRepository:
             raise DocumentNotFound(_id=document_id)
         return DocumentSchema.model_validate(obj=document)
 
-    async def get_all_documents(self, session: AsyncSession) -> list[DocumentSchema]:
-        query = select(self._collection)
-        result = await session.scalars(query)
-        return [DocumentSchema.model_validate(obj=doc) for doc in result.all()]
-
-    async def get_documents_by_user(self, session: AsyncSession, user_id: int) -> list[DocumentSchema]:
-        query = select(self._collection).where(self._collection.user_id == user_id)
-        result = await session.scalars(query)
-        return [DocumentSchema.model_validate(obj=doc) for doc in result.all()]
-
-    async def get_documents_by_status(self, session: AsyncSession, status_id: int) -> list[DocumentSchema]:
-        query = select(self._collection).where(self._collection.status_id == status_id)
-        result = await session.scalars(query)
-        return [DocumentSchema.model_validate(obj=doc) for doc in result.all()]
+    async def get_all_documents(self, session: AsyncSession, page: PageQuery, filters: DocumentFilters,
+                                status_id: Optional[int] = None) -> Page[DocumentSchema]:
+        conditions = [] if status_id is None else [self._collection.status_id == status_id]
+        return await self._documents_page(session, page, filters, *conditions)
+
+    async def get_documents_by_user(self, session: AsyncSession, user_id: int, page: PageQuery,
+                                    filters: DocumentFilters, status_id: Optional[int] = None) -> Page[DocumentSchema]:
+        conditions = [self._collection.user_id == user_id]
+        if status_id is not None:
+            conditions.append(self._collection.status_id == status_id)
+        return await self._documents_page(session, page, filters, *conditions)
+
+    async def get_documents_by_status(self, session: AsyncSession, status_id: int, page: PageQuery,
+                                      filters: DocumentFilters) -> Page[DocumentSchema]:
+        return await self._documents_page(session, page, filters, self._collection.status_id == status_id)
+
+    async def _documents_page(self, session: AsyncSession, page: PageQuery, filters: DocumentFilters,
+                              *conditions) -> Page[DocumentSchema]:
+        """Новые документы сначала; индексы ix_documents_*_upload_datetime_document_id"""
+        documents = self._collection
+        conditions = list(conditions)
+        if filters.doc_type is not None:
+            conditions.append(documents.doc_type == filters.doc_type)
+        if filters.uploaded_from is not None:
+            conditions.append(documents.upload_datetime >= filters.uploaded_from)
+        if filters.uploaded_to is not None:
+            conditions.append(documents.upload_datetime < filters.uploaded_to)
+        if filters.score_min is not None:
+            conditions.append(documents.score >= filters.score_min)
+        if filters.score_max is not None:
+            conditions.append(documents.score <= filters.score_max)
+
+        rows, next_cursor = await fetch_page(
+            session, select(documents).where(*conditions), DOCUMENTS_KEYSET, page.limit, page.cursor,
+        )
+        return Page[DocumentSchema](
+            items=[DocumentSchema.model_validate(obj=doc) for doc in rows],
+            next_cursor=next_cursor,
+        )
 
     async def get_document_mistakes(self, session: AsyncSession, document_id: int) -> list[dict]:
-        document = await self.get_document_by_id(session, document_id)
-        # Предположим, что есть поле mistakes — список словарей
-        return getattr(document, "mistakes", [])
+        query = (
+            select(self._collection)
+            .where(self._collection.document_id == document_id)
+            .options(*DOCUMENT_WITH_MISTAKES)
+        )
+        document = await session.scalar(query)
+        if not document:
+            raise DocumentNotFound(_id=document_id)
+        return [
+            {
+                **MistakeSchema.model_validate(obj=mistake).model_dump(),
+                "mistake_type_name": mistake.mistake_type.mistake_type_name if mistake.mistake_type else None,
+            }
+            for mistake in document.mistakes
+        ]
 
     async def get_document_full_info(self, session: AsyncSession, document_id: int) -> DocumentSchema:
         document = await self.get_document_by_id(session, document_id)
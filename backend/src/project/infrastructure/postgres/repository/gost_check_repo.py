@@ -1,57 +1,65 @@
-import json
-
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional, Dict, Any, Type
+from sqlalchemy import RowMapping, cast, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import JSONB, JSONPATH
+from typing import List, Optional, Dict, Any, Tuple, Type
 from datetime import datetime
 
-from project.infrastructure.postgres.models import Check, Documents, Status, Standart, Mistake, MistakeType
+from project.infrastructure.postgres.models import Check, CheckJob, Documents, Mistake
+from project.infrastructure.postgres.reference_cache import reference_cache
+from project.infrastructure.postgres.repository.check_job_repo import JOB_DONE
+
+GOST_ERROR_TYPE = "Ошибка ГОСТ"
+GOST_WARNING_TYPE = "Предупреждение ГОСТ"
+
+# Сообщения замечаний отчёта по важности (jsonpath по Check.result)
+ERROR_MESSAGES_PATH = '$.report.results[*] ? (@.severity == "critical").message'
+WARNING_MESSAGES_PATH = '$.report.results[*] ? (@.severity == "warning").message'
 
 class AsyncGostCheckRepository:
     def __init__(self, db: AsyncSession):
         self.db: AsyncSession = db
 
-    async def create_gost_check(self, document_id: int) -> Check:
-        """Создать проверку ГОСТ для документа"""
-        gost_standard = await self.get_or_create_gost_standard()
-
+    async def create_gost_check(self, document_id: int, standart_id: Optional[int] = None) -> Check:
+        """Создать проверку ГОСТ для документа (без commit — фиксирует вызывающий)"""
         check = Check(
             document_id=document_id,
-            standart_id=gost_standard.standart_id,
+            standart_id=standart_id or await self.get_gost_standard_id(),
             checked_at=datetime.now(),
-            result=json.dumps({"status": "analyzing"}, ensure_ascii=False)
+            result={"status": "analyzing"}
         )
 
         self.db.add(check)
-        await self.db.commit()
-        await self.db.refresh(check)
+        await self.db.flush()
         return check
 
-    async def get_or_create_gost_standard(self) -> Standart:
-        result = await self.db.execute(
-            select(Standart).where(Standart.name == "ГОСТ для курсовых работ")
+    async def create_gost_checks(self, document_ids: List[int], standart_id: int) -> List[Tuple[int, int]]:
+        """Проверки для нескольких документов одним INSERT (без commit); возвращает пары (check_id, document_id)"""
+        if not document_ids:
+            return []
+        now = datetime.now()
+        res = await self.db.execute(
+            insert(Check)
+            .values([
+                {"document_id": document_id, "standart_id": standart_id, "checked_at": now,
+                 "result": {"status": "analyzing"}}
+                for document_id in document_ids
+            ])
+            .returning(Check.check_id, Check.document_id)
         )
-        standard = result.scalars().first()
-        if not standard:
-            standard = Standart(
-                name="ГОСТ для курсовых работ",
-                version="1.0",
-                description="Автоматическая проверка курсовых работ на соответствие ГОСТ",
-                is_custom=False
-            )
-            self.db.add(standard)
-            await self.db.commit()
-            await self.db.refresh(standard)
-        return standard
+        return [(row.check_id, row.document_id) for row in res]
+
+    async def get_gost_standard_id(self) -> int:
+        return await reference_cache.standard_id(self.db)
 
     async def update_check_result(self, check_id: int, result: Dict[str, Any]) -> Check:
+        """Записывает результат проверки и score документа (без commit — фиксирует вызывающий)"""
         res = await self.db.execute(select(Check).where(Check.check_id == check_id))
         check = res.scalars().first()
         if not check:
             raise ValueError(f"Check {check_id} не найден")
 
-        # Сохраняем полный JSON
-        check.result = json.dumps(result) if result else json.dumps({})
+        # Сохраняем полный отчёт (JSONB)
+        check.result = result or {}
         check.checked_at = datetime.now()
 
         # Обновляем документ score
@@ -64,56 +72,78 @@ class AsyncGostCheckRepository:
             except (ValueError, TypeError):
                 document.score = 0
 
-        await self.db.commit()
-        await self.db.refresh(check)
+        await self.db.flush()
         return check
 
+    async def find_reusable_check(self, content_sha256: str, ruleset_version: str) -> Optional[Check]:
+        """Последняя завершённая проверка файла с тем же содержимым по той же версии правил (только с отчётом)"""
+        res = await self.db.execute(
+            select(Check)
+            .join(CheckJob, CheckJob.check_id == Check.check_id)
+            .join(Documents, Documents.document_id == Check.document_id)
+            .where(
+                Documents.content_sha256 == content_sha256,
+                CheckJob.ruleset_version == ruleset_version,
+                CheckJob.state == JOB_DONE,
+                Check.result.has_key("report"),
+            )
+            .order_by(Check.checked_at.desc())
+            .limit(1)
+        )
+        return res.scalars().first()
+
+    async def get_check_summary(self, check_id: int) -> Optional[RowMapping]:
+        """Поля результата для опроса статуса; отчёт разбирается в Postgres, клиенту — только нужные ключи"""
+        result = Check.result
+        res = await self.db.execute(
+            select(
+                Check.check_id,
+                Check.document_id,
+                Check.checked_at,
+                Documents.user_id,
+                Documents.filename,
+                Documents.score.label("document_score"),
+                result["score"].label("score"),
+                result["is_compliant"].label("is_compliant"),
+                result[("report", "total_checks")].label("total_checks"),
+                result[("report", "passed_checks")].label("passed_checks"),
+                func.jsonb_path_query_array(result, cast(ERROR_MESSAGES_PATH, JSONPATH), type_=JSONB).label("errors"),
+                func.jsonb_path_query_array(result, cast(WARNING_MESSAGES_PATH, JSONPATH), type_=JSONB).label("warnings"),
+            )
+            .outerjoin(Documents, Documents.document_id == Check.document_id)
+            .where(Check.check_id == check_id)
+        )
+        return res.mappings().first()
+
     async def save_check_details(self, check_id: int, result: Dict[str, Any]):
         # Пока просто пропустим
         pass
 
-    async def create_mistakes(self, document_id: int, errors: List[str], warnings: List[str]):
-        # Ошибки
-        error_type_res = await self.db.execute(
-            select(MistakeType).where(MistakeType.mistake_type_name == "Ошибка ГОСТ")
-        )
-        error_type = error_type_res.scalars().first()
-        if not error_type:
-            error_type = MistakeType(mistake_type_name="Ошибка ГОСТ")
-            self.db.add(error_type)
-            await self.db.commit()
-            await self.db.refresh(error_type)
-
-        # Предупреждения
-        warning_type_res = await self.db.execute(
-            select(MistakeType).where(MistakeType.mistake_type_name == "Предупреждение ГОСТ")
-        )
-        warning_type = warning_type_res.scalars().first()
-        if not warning_type:
-            warning_type = MistakeType(mistake_type_name="Предупреждение ГОСТ")
-            self.db.add(warning_type)
-            await self.db.commit()
-            await self.db.refresh(warning_type)
-
-        for error in errors:
-            mistake = Mistake(
-                document_id=document_id,
-                mistake_type_id=error_type.mistake_type_id,
-                description=error,
-                critical_status="high"
-            )
-            self.db.add(mistake)
-
-        for warning in warnings:
-            mistake = Mistake(
-                document_id=document_id,
-                mistake_type_id=warning_type.mistake_type_id,
-                description=warning,
-                critical_status="low"
+    async def create_mistakes(self, document_id: int, errors: List[str], warnings: List[str],
+                              replace: bool = False):
+        """Сохраняет замечания проверки одним INSERT (без commit); replace — удалить прежние замечания ГОСТ документа"""
+        error_type_id = await reference_cache.mistake_type_id(self.db, GOST_ERROR_TYPE)
+        warning_type_id = await reference_cache.mistake_type_id(self.db, GOST_WARNING_TYPE)
+
+        if replace:
+            await self.db.execute(
+                delete(Mistake).where(
+                    Mistake.document_id == document_id,
+                    Mistake.mistake_type_id.in_([error_type_id, warning_type_id]),
+                )
             )
-            self.db.add(mistake)
 
-        await self.db.commit()
+        rows = [
+            {"document_id": document_id, "mistake_type_id": error_type_id,
+             "description": error, "critical_status": "high"}
+            for error in errors
+        ] + [
+            {"document_id": document_id, "mistake_type_id": warning_type_id,
+             "description": warning, "critical_status": "low"}
+            for warning in warnings
+        ]
+        if rows:
+            await self.db.execute(insert(Mistake).values(rows))
 
     async def get_check_by_id(self, check_id: int) -> Optional[Check]:
         res = await self.db.execute(select(Check).where(Check.check_id == check_id))
@@ -1,12 +1,15 @@
-from typing import Type, List
-from collections.abc import Sequence
+from typing import Optional, Type
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.exc import IntegrityError, InterfaceError
 from project.schemas.mistake import MistakeCreate, MistakeSchema
-from project.infrastructure.postgres.models import Mistake
+from project.schemas.pagination import Page, PageQuery
+from project.infrastructure.postgres.models import Documents, Mistake
+from project.infrastructure.postgres.pagination import Keyset, fetch_page
 from project.core.exceptions import MistakeNotFound, MistakeAlreadyExists
 
+MISTAKES_KEYSET = Keyset(Mistake.mistake_id, descending=False)
+
 
 class MistakeRepository:
     _collection: Type[Mistake] = Mistake
@@ -18,10 +21,8 @@ class MistakeRepository:
         except (Exception, InterfaceError):
             return False
 
-    async def get_all_mistakes(self, session: AsyncSession) -> List[MistakeSchema]:
-        query = select(self._collection)
-        mistakes = await session.scalars(query)
-        return [MistakeSchema.model_validate(obj=mistake) for mistake in mistakes.all()]
+    async def get_all_mistakes(self, session: AsyncSession, page: PageQuery) -> Page[MistakeSchema]:
+        return await self._mistakes_page(session, select(self._collection), page)
 
     async def get_mistake_by_id(self, session: AsyncSession, mistake_id: int) -> MistakeSchema:
         query = select(self._collection).where(self._collection.mistake_id == mistake_id)
@@ -30,23 +31,40 @@ class MistakeRepository:
             raise MistakeNotFound(_id=mistake_id)
         return MistakeSchema.model_validate(obj=mistake)
 
-    async def get_mistakes_by_document_id(self, session: AsyncSession, document_id: int) -> Sequence[Mistake]:
-        # Проверка существования ошибок по document_id
+    async def get_mistakes_by_document_id(self, session: AsyncSession, document_id: int,
+                                          page: PageQuery) -> Page[MistakeSchema]:
         query = select(self._collection).where(self._collection.document_id == document_id)
-        mistakes = await session.scalars(query)
-        return mistakes.all()
+        return await self._mistakes_page(session, query, page)
 
-    async def get_mistakes_by_mistake_type_id(self, session: AsyncSession, mistake_type_id: int) -> Sequence[Mistake]:
-        # Проверка существования ошибок по mistake_type_id
+    async def get_mistakes_by_mistake_type_id(self, session: AsyncSession, mistake_type_id: int, page: PageQuery,
+                                              user_id: Optional[int] = None) -> Page[MistakeSchema]:
+        """Ошибки типа; с user_id — только в документах этого пользователя"""
         query = select(self._collection).where(self._collection.mistake_type_id == mistake_type_id)
-        mistakes = await session.scalars(query)
-        return mistakes.all()
+        if user_id is not None:
+            query = (
+                query.join(Documents, Documents.document_id == self._collection.document_id)
+                .where(Documents.user_id == user_id)
+            )
+        return await self._mistakes_page(session, query, page)
+
+    async def _mistakes_page(self, session: AsyncSession, query, page: PageQuery) -> Page[MistakeSchema]:
+        rows, next_cursor = await fetch_page(session, query, MISTAKES_KEYSET, page.limit, page.cursor)
+        return Page[MistakeSchema](
+            items=[MistakeSchema.model_validate(obj=mistake) for mistake in rows],
+            next_cursor=next_cursor,
+        )
+
+    async def _has_mistake_of_type(self, session: AsyncSession, document_id: int, mistake_type_id: int) -> bool:
+        query = select(self._collection.mistake_id).where(
+            self._collection.document_id == document_id,
+            self._collection.mistake_type_id == mistake_type_id,
+        ).limit(1)
+        return await session.scalar(query) is not None
 
     async def create_mistake(self, session: AsyncSession, mistake: MistakeCreate) -> MistakeSchema:
         # Проверяем уникальность комбинации document_id и mistake_type_id (если указан)
         if mistake.mistake_type_id is not None:
-            existing_mistakes = await self.get_mistakes_by_document_id(session, document_id=mistake.document_id)
-            if any(m.mistake_type_id == mistake.mistake_type_id for m in existing_mistakes):
+            if await self._has_mistake_of_type(session, mistake.document_id, mistake.mistake_type_id):
                 raise MistakeAlreadyExists(document_id=mistake.document_id, mistake_type_id=mistake.mistake_type_id)
         query = (
             insert(self._collection)
@@ -69,8 +87,7 @@ class MistakeRepository:
         # Проверяем уникальность комбинации document_id и mistake_type_id при обновлении (если указан)
         if (mistake.document_id != existing_mistake.document_id or
             mistake.mistake_type_id != existing_mistake.mistake_type_id) and mistake.mistake_type_id is not None:
-            existing_mistakes = await self.get_mistakes_by_document_id(session, document_id=mistake.document_id)
-            if any(m.mistake_type_id == mistake.mistake_type_id for m in existing_mistakes):
+            if await self._has_mistake_of_type(session, mistake.document_id, mistake.mistake_type_id):
                 raise MistakeAlreadyExists(document_id=mistake.document_id, mistake_type_id=mistake.mistake_type_id)
         query = (
             update(self._collection)
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.exc import IntegrityError, InterfaceError
 from project.schemas.mistake_type import MistakeTypeCreate, MistakeTypeSchema
+from project.infrastructure.postgres.loaders import ROW_ONLY
 from project.infrastructure.postgres.models import MistakeType
 from project.core.exceptions import MistakeTypeNotFound, MistakeTypeAlreadyExists
 
@@ -18,19 +19,19 @@ class MistakeTypeRepository:
             return False
 
     async def get_all_mistake_types(self, session: AsyncSession) -> list[MistakeTypeSchema]:
-        query = select(self._collection)
+        query = select(self._collection).options(*ROW_ONLY)
         mistake_types = await session.scalars(query)
         return [MistakeTypeSchema.model_validate(obj=mt) for mt in mistake_types.all()]
 
     async def get_mistake_type_by_id(self, session: AsyncSession, mistake_type_id: int) -> MistakeTypeSchema:
-        query = select(self._collection).where(self._collection.mistake_type_id == mistake_type_id)
+        query = select(self._collection).options(*ROW_ONLY).where(self._collection.mistake_type_id == mistake_type_id)
         mistake_type = await session.scalar(query)
         if not mistake_type:
             raise MistakeTypeNotFound(_id=mistake_type_id)
         return MistakeTypeSchema.model_validate(obj=mistake_type)
 
     async def get_mistake_type_by_name(self, session: AsyncSession, mistake_type_name: str) -> MistakeType | None:
-        query = select(self._collection).where(self._collection.mistake_type_name == mistake_type_name)
+        query = select(self._collection).options(*ROW_ONLY).where(self._collection.mistake_type_name == mistake_type_name)
         return await session.scalar(query)
 
     async def create_mistake_type(self, session: AsyncSession, mistake_type: MistakeTypeCreate) -> MistakeTypeSchema:
@@ -53,7 +54,7 @@ class MistakeTypeRepository:
                                   mistake_type: MistakeTypeCreate) -> MistakeTypeSchema:
         # Проверяем существование типа ошибки
         existing_mistake_type = await session.scalar(
-            select(self._collection).where(self._collection.mistake_type_id == mistake_type_id)
+            select(self._collection).options(*ROW_ONLY).where(self._collection.mistake_type_id == mistake_type_id)
         )
         if not existing_mistake_type:
             raise MistakeTypeNotFound(_id=mistake_type_id)
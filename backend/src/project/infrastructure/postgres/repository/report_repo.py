@@ -1,12 +1,16 @@
-from typing import Type, List
+from typing import Type
 from collections.abc import Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.exc import IntegrityError, InterfaceError
-from project.schemas.reports import ReportCreate, ReportSchema
+from project.schemas.reports import ReportCreate, ReportFilters, ReportSchema
+from project.schemas.pagination import Page, PageQuery
 from project.infrastructure.postgres.models import Reports
 from project.core.exceptions import ReportNotFound, ReportAlreadyExists
 from project.infrastructure.postgres.models import Reports, Check, Documents
+from project.infrastructure.postgres.pagination import Keyset, fetch_page
+
+REPORTS_KEYSET = Keyset(Reports.report_id)
 
 
 class ReportRepository:
@@ -19,10 +23,9 @@ class ReportRepository:
         except (Exception, InterfaceError):
             return False
 
-    async def get_all_reports(self, session: AsyncSession) -> List[ReportSchema]:
-        query = select(self._collection)
-        reports = await session.scalars(query)
-        return [ReportSchema.model_validate(obj=report) for report in reports.all()]
+    async def get_all_reports(self, session: AsyncSession, page: PageQuery,
+                              filters: ReportFilters) -> Page[ReportSchema]:
+        return await self._reports_page(session, select(self._collection), page, filters)
 
     async def get_report_by_id(self, session: AsyncSession, report_id: int) -> ReportSchema:
         query = select(self._collection).where(self._collection.report_id == report_id)
@@ -71,7 +74,8 @@ class ReportRepository:
         if not result.rowcount:
             raise ReportNotFound(_id=report_id)
 
-    async def get_reports_by_user(self, session: AsyncSession, user_id: int) -> List[ReportSchema]:
+    async def get_reports_by_user(self, session: AsyncSession, user_id: int, page: PageQuery,
+                                  filters: ReportFilters) -> Page[ReportSchema]:
         """
         Возвращает все отчёты, относящиеся к документам конкретного пользователя.
         JOIN: reports → checks → documents
@@ -82,6 +86,17 @@ class ReportRepository:
             .join(Documents, Documents.document_id == Check.document_id)
             .where(Documents.user_id == user_id)
         )
+        return await self._reports_page(session, query, page, filters)
 
-        reports = await session.scalars(query)
-        return [ReportSchema.model_validate(obj=report) for report in reports.all()]
+    async def _reports_page(self, session: AsyncSession, query, page: PageQuery,
+                            filters: ReportFilters) -> Page[ReportSchema]:
+        """Новые отчёты сначала (по первичному ключу)"""
+        if filters.created_from is not None:
+            query = query.where(self._collection.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(self._collection.created_at < filters.created_to)
+        rows, next_cursor = await fetch_page(session, query, REPORTS_KEYSET, page.limit, page.cursor)
+        return Page[ReportSchema](
+            items=[ReportSchema.model_validate(obj=report) for report in rows],
+            next_cursor=next_cursor,
+        )
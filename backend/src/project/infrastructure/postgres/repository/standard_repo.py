@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.exc import IntegrityError, InterfaceError
 
+from project.infrastructure.postgres.loaders import ROW_ONLY
 from project.infrastructure.postgres.models import Standart
 from project.schemas.standart import StandardCreate, StandardSchema
 from project.core.exceptions import StandardNotFound, StandardAlreadyExists
@@ -20,14 +21,14 @@ class StandardRepository:
             return False
 
     async def get_standard_by_id(self, session: AsyncSession, standart_id: int) -> StandardSchema:
-        query = select(self._collection).where(self._collection.standart_id == standart_id)
+        query = select(self._collection).options(*ROW_ONLY).where(self._collection.standart_id == standart_id)
         standard = await session.scalar(query)
         if not standard:
             raise StandardNotFound(_id=standart_id)
         return StandardSchema.model_validate(obj=standard)
 
     async def get_all_standards(self, session: AsyncSession) -> list[StandardSchema]:
-        query = select(self._collection)
+        query = select(self._collection).options(*ROW_ONLY)
         standards = await session.scalars(query)
         return [StandardSchema.model_validate(obj=std) for std in standards.all()]
 
@@ -38,7 +39,7 @@ class StandardRepository:
         version: str | None
     ) -> Standart | None:
         """Проверка уникальности стандарта name+version"""
-        query = select(self._collection).where(
+        query = select(self._collection).options(*ROW_ONLY).where(
             self._collection.name == name,
             self._collection.version == version
         )
@@ -75,7 +76,7 @@ class StandardRepository:
     ) -> StandardSchema:
 
         existing = await session.scalar(
-            select(self._collection).where(self._collection.standart_id == standart_id)
+            select(self._collection).options(*ROW_ONLY).where(self._collection.standart_id == standart_id)
         )
         if not existing:
             raise StandardNotFound(_id=standart_id)
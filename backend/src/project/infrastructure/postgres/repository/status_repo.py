@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.exc import IntegrityError, InterfaceError
 from project.schemas.status import StatusCreate, StatusSchema
+from project.infrastructure.postgres.loaders import ROW_ONLY
 from project.infrastructure.postgres.models import Status
 from project.core.exceptions import StatusNotFound, StatusAlreadyExists
 
@@ -18,19 +19,19 @@ class StatusRepository:
             return False
 
     async def get_all_statuses(self, session: AsyncSession) -> list[StatusSchema]:
-        query = select(self._collection)
+        query = select(self._collection).options(*ROW_ONLY)
         statuses = await session.scalars(query)
         return [StatusSchema.model_validate(obj=status) for status in statuses.all()]
 
     async def get_status_by_id(self, session: AsyncSession, status_id: int) -> StatusSchema:
-        query = select(self._collection).where(self._collection.status_id == status_id)
+        query = select(self._collection).options(*ROW_ONLY).where(self._collection.status_id == status_id)
         status = await session.scalar(query)
         if not status:
             raise StatusNotFound(_id=status_id)
         return StatusSchema.model_validate(obj=status)
 
     async def get_status_by_name(self, session: AsyncSession, status_name: str) -> Status | None:
-        query = select(self._collection).where(self._collection.status_name == status_name)
+        query = select(self._collection).options(*ROW_ONLY).where(self._collection.status_name == status_name)
         return await session.scalar(query)
 
     async def create_status(self, session: AsyncSession, status: StatusCreate) -> StatusSchema:
@@ -52,7 +53,7 @@ class StatusRepository:
     async def update_status(self, session: AsyncSession, status_id: int, status: StatusCreate) -> StatusSchema:
         # Проверяем существование статуса
         existing_status = await session.scalar(
-            select(self._collection).where(self._collection.status_id == status_id)
+            select(self._collection).options(*ROW_ONLY).where(self._collection.status_id == status_id)
         )
         if not existing_status:
             raise StatusNotFound(_id=status_id)
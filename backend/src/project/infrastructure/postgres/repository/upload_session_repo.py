@@ -0,0 +1,94 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Type
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.infrastructure.postgres.models import UploadSession
+
+
+class UploadSessionRepository:
+    """Сессии возобновляемых загрузок: сколько байт файла уже принято и где лежит недокачанный файл"""
+    _collection: Type[UploadSession] = UploadSession
+
+    async def create(self, session: AsyncSession, user_id: int, filename: str, doc_type: str, is_example: bool,
+                     total_size: int, chunk_size: int, temp_dir: str) -> UploadSession:
+        upload_id = uuid.uuid4().hex
+        upload = self._collection(
+            upload_id=upload_id,
+            user_id=user_id,
+            filename=filename,
+            doc_type=doc_type,
+            is_example=is_example,
+            total_size=total_size,
+            chunk_size=chunk_size,
+            received_size=0,
+            temp_path=f"{temp_dir}/{upload_id}.part",
+        )
+        session.add(upload)
+        await session.flush()
+        return upload
+
+    async def get(self, session: AsyncSession, upload_id: str, user_id: int,
+                  for_update: bool = False) -> Optional[UploadSession]:
+        """Сессия загрузки пользователя; for_update — заблокировать до конца транзакции (одна часть за раз)"""
+        query = select(self._collection).where(
+            self._collection.upload_id == upload_id,
+            self._collection.user_id == user_id,
+        )
+        if for_update:
+            query = query.with_for_update()
+        return await session.scalar(query)
+
+    async def start_writing(self, session: AsyncSession, upload: UploadSession, lease_sec: float) -> datetime:
+        """Занимает загрузку на время передачи части (upload взят for_update).
+
+        Возвращает writing_until: по нему finish_writing и release узнают, что аренда всё ещё своя.
+        """
+        upload.writing_until = datetime.now() + timedelta(seconds=lease_sec)
+        await session.flush()
+        return upload.writing_until
+
+    async def finish_writing(self, session: AsyncSession, upload_id: str, writing_until: datetime,
+                             received_size: int) -> Optional[UploadSession]:
+        """Фиксирует принятые байты и снимает аренду; None — загрузку удалили или аренду перехватили"""
+        query = (
+            update(self._collection)
+            .where(self._collection.upload_id == upload_id, self._collection.writing_until == writing_until)
+            .values(received_size=received_size, writing_until=None, updated_at=datetime.now())
+            .returning(self._collection)
+        )
+        return await session.scalar(query)
+
+    async def release(self, session: AsyncSession, upload_id: str, writing_until: datetime,
+                      received_size: Optional[int] = None) -> None:
+        """Снимает аренду (передача части или завершение оборвались); received_size — сбросить принятое"""
+        values = {"writing_until": None}
+        if received_size is not None:
+            values["received_size"] = received_size
+        await session.execute(
+            update(self._collection)
+            .where(self._collection.upload_id == upload_id, self._collection.writing_until == writing_until)
+            .values(**values)
+        )
+
+    async def delete_expired(self, session: AsyncSession, updated_before: datetime) -> List[str]:
+        """Удаляет загрузки без новых частей с updated_before (кроме передаваемых сейчас); возвращает temp_path"""
+        now = datetime.now()
+        query = (
+            delete(self._collection)
+            .where(
+                self._collection.updated_at < updated_before,
+                or_(self._collection.writing_until.is_(None), self._collection.writing_until < now),
+            )
+            .returning(self._collection.temp_path)
+        )
+        return list((await session.scalars(query)).all())
+
+    async def delete(self, session: AsyncSession, upload_id: str, writing_until: Optional[datetime] = None) -> bool:
+        """Удаляет загрузку; writing_until — только если аренда всё ещё своя. False — удалять нечего"""
+        query = delete(self._collection).where(self._collection.upload_id == upload_id)
+        if writing_until is not None:
+            query = query.where(self._collection.writing_until == writing_until)
+        return (await session.execute(query)).rowcount > 0
@@ -5,9 +5,13 @@ from sqlalchemy import select, insert, update, delete, true
 from sqlalchemy.exc import IntegrityError, InterfaceError
 
 from project.schemas.user import UserCreate, UserSchema
+from project.schemas.pagination import Page, PageQuery
 from project.infrastructure.postgres.models import Users
+from project.infrastructure.postgres.pagination import Keyset, fetch_page
 from project.core.exceptions import UserNotFound, UserAlreadyExists, UserNameAlreadyExists, UserTelegramAlreadyExists
 
+USERS_KEYSET = Keyset(Users.user_id, descending=False)
+
 
 class UserRepository:
     _collection: Type[Users] = Users
@@ -26,10 +30,14 @@ class UserRepository:
             raise UserNotFound(_id=email)
         return UserSchema.model_validate(obj=user)
 
-    async def get_all_users(self,session: AsyncSession) -> list[UserSchema]:
-        query = select(self._collection)
-        users = await session.scalars(query)
-        return [UserSchema.model_validate(obj=user) for user in users.all()]
+    async def get_all_users(self, session: AsyncSession, page: PageQuery) -> Page[UserSchema]:
+        rows, next_cursor = await fetch_page(
+            session, select(self._collection), USERS_KEYSET, page.limit, page.cursor,
+        )
+        return Page[UserSchema](
+            items=[UserSchema.model_validate(obj=user) for user in rows],
+            next_cursor=next_cursor,
+        )
 
     async def get_user_by_id(self, session: AsyncSession, user_id: int) -> UserSchema:
         query = (select(self._collection).where(self._collection.user_id == user_id))
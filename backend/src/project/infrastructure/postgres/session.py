@@ -1,13 +1,12 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from project.core.config import settings
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from project.infrastructure.postgres.database import get_engine
 from typing import AsyncGenerator
 
-# Создаём движок
-engine = create_async_engine(settings.postgres_url, echo=False)
+# Общий движок процесса (см. database.get_engine), отдельный пул не создаётся
+engine = get_engine()
 
 # Фабрика сессий
-async_session = sessionmaker(
+async_session = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
@@ -16,4 +15,4 @@ async_session = sessionmaker(
 # Зависимость для FastAPI
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
-        yield session
\ No newline at end of file
+        yield session
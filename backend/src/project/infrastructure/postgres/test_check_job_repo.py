@@ -0,0 +1,36 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from project.infrastructure.postgres.repository.check_job_repo import JOB_RUNNING, CheckJobRepository
+
+
+class _Session:
+    """Запоминает UPDATE и отвечает так, будто строка задания с этим условием не найдена"""
+
+    def __init__(self):
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(query)
+        return type("Result", (), {"rowcount": 0})()
+
+    async def scalar(self, query):
+        self.queries.append(query)
+        return None
+
+
+def _params(query):
+    return query.compile(dialect=postgresql.asyncpg.dialect()).params
+
+
+def test_stale_worker_cannot_finish_reclaimed_job():
+    jobs, session = CheckJobRepository(), _Session()
+    # Задание перевыдано по lock_timeout: у строки уже другой worker_id и attempts = 2
+    assert asyncio.run(jobs.complete(session, 7, "host:1/0", 1)) is False
+    assert asyncio.run(jobs.fail(session, 7, "host:1/0", 1, "ошибка", 30)) is None
+
+    for query in session.queries:
+        params = _params(query)
+        assert {"job_id_1": 7, "state_1": JOB_RUNNING, "worker_id_1": "host:1/0", "attempts_1": 1}.items() \
+            <= params.items()
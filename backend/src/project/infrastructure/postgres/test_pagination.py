@@ -0,0 +1,46 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from project.core.exceptions import InvalidCursor
+from project.infrastructure.postgres.models import Documents
+from project.infrastructure.postgres.pagination import fetch_page
+from project.infrastructure.postgres.repository.document_repository import DOCUMENTS_KEYSET
+
+
+class _Session:
+    """Отдаёт заранее заданные строки и запоминает запрос"""
+
+    def __init__(self, rows):
+        self.rows, self.query = rows, None
+
+    async def scalars(self, query):
+        self.query = query
+        limit = query._limit_clause.value
+        return SimpleNamespace(all=lambda: self.rows[:limit])
+
+
+def _documents(count):
+    start = datetime(2026, 10, 1, 12, 0, 0, 500)
+    return [SimpleNamespace(upload_datetime=start - timedelta(minutes=i), document_id=100 - i) for i in range(count)]
+
+
+def test_cursor_points_after_last_row_of_page():
+    rows = _documents(5)
+    page, cursor = asyncio.run(fetch_page(_Session(rows), select(Documents), DOCUMENTS_KEYSET, limit=2))
+    assert page == rows[:2]
+    assert DOCUMENTS_KEYSET.decode(cursor) == [rows[1].upload_datetime, rows[1].document_id]
+
+    session = _Session(rows[2:4])
+    page, cursor = asyncio.run(fetch_page(session, select(Documents), DOCUMENTS_KEYSET, 2, cursor))
+    assert page == rows[2:4] and cursor is None
+    assert "(my_app_schema.documents.upload_datetime, my_app_schema.documents.document_id) <" in str(session.query)
+
+
+@pytest.mark.parametrize("cursor", ["не base64", "W10", "WyJ4IiwgMV0", "WyIyMDI2LTEwLTAxIiwgdHJ1ZV0"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        DOCUMENTS_KEYSET.after(cursor)
@@ -0,0 +1,46 @@
+import asyncio
+
+from project.infrastructure.postgres.models import MistakeType, Status
+from project.infrastructure.postgres.reference_cache import ReferenceCache
+
+
+class _Session:
+    """Справочник в памяти: считает запросы, новые строки получают следующий id"""
+
+    def __init__(self, ids):
+        self.ids, self.queries, self.added = ids, 0, []
+
+    async def scalar(self, query):
+        self.queries += 1
+        return self.ids.get(query.compile().params["status_name_1"]) if "statuses" in str(query) else None
+
+    def add(self, row):
+        self.added.append(row)
+
+    async def flush(self):
+        for row in self.added:
+            row.mistake_type_id = 100
+
+
+def test_ids_are_cached_until_invalidated():
+    cache, session = ReferenceCache(), _Session({"Проверен": 3})
+
+    async def lookups():
+        return [await cache.status_id(session, "Проверен") for _ in range(3)]
+
+    assert asyncio.run(lookups()) == [3, 3, 3] and session.queries == 1
+
+    cache.invalidate(MistakeType)
+    asyncio.run(cache.status_id(session, "Проверен"))
+    assert session.queries == 1
+
+    cache.invalidate(Status)
+    asyncio.run(cache.status_id(session, "Проверен"))
+    assert session.queries == 2
+
+
+def test_created_row_is_not_cached():
+    cache, session = ReferenceCache(), _Session({})
+    assert asyncio.run(cache.mistake_type_id(session, "Ошибка ГОСТ")) == 100
+    asyncio.run(cache.mistake_type_id(session, "Ошибка ГОСТ"))
+    assert session.queries == 2 and len(session.added) == 2
@@ -0,0 +1,46 @@
+"""Хранилища файлов документов: локальный каталог или S3-совместимое (MinIO).
+
+Запись идёт в хранилище из STORAGE_BACKEND; чтение и удаление — в то, к которому относится
+Documents.filepath, поэтому документы, загруженные до смены бэкенда, остаются доступны.
+"""
+from functools import lru_cache
+from typing import List
+
+from project.core.config import settings
+from project.infrastructure.storage.base import DocumentStorage
+from project.infrastructure.storage.local import LocalStorage
+from project.infrastructure.storage.s3 import S3Storage
+
+
+@lru_cache
+def _storages() -> List[DocumentStorage]:
+    local = LocalStorage(settings.UPLOAD_DIR)
+    if settings.STORAGE_BACKEND == "s3":
+        s3 = S3Storage(
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            bucket=settings.S3_BUCKET,
+            access_key=settings.S3_ACCESS_KEY.get_secret_value(),
+            secret_key=settings.S3_SECRET_KEY.get_secret_value(),
+            region=settings.S3_REGION,
+            prefix=settings.S3_PREFIX,
+        )
+        return [s3, local]
+    if settings.STORAGE_BACKEND != "local":
+        raise ValueError(f"Неизвестный STORAGE_BACKEND: {settings.STORAGE_BACKEND!r} (ожидается 'local' или 's3')")
+    return [local]
+
+
+def get_storage() -> DocumentStorage:
+    """Хранилище для новых файлов"""
+    return _storages()[0]
+
+
+def storage_for(location: str) -> DocumentStorage:
+    """Хранилище, в котором лежит файл location (Documents.filepath)"""
+    for storage in _storages():
+        if storage.owns(location):
+            return storage
+    raise ValueError(f"Нет хранилища для '{location}'")
+
+
+__all__ = ["DocumentStorage", "LocalStorage", "S3Storage", "get_storage", "storage_for"]
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+
+class DocumentStorage(ABC):
+    """Хранилище файлов документов.
+
+    location — значение Documents.filepath, которое возвращает storage.location(name).
+    Разбор ведётся по локальному файлу: local_copy отдаёт путь к нему (для удалённых хранилищ —
+    к временной копии, удаляемой после выхода из контекста).
+    """
+
+    @abstractmethod
+    def location(self, name: str) -> str:
+        """Куда save(..., name) положит файл"""
+
+    @abstractmethod
+    def owns(self, location: str) -> bool:
+        """Относится ли location к этому хранилищу"""
+
+    @abstractmethod
+    async def save(self, source: Path, name: str, content_sha256: Optional[str] = None) -> str:
+        """Переносит готовый локальный файл source в хранилище; source после этого не существует"""
+
+    @abstractmethod
+    def read(self, location: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Содержимое файла блоками"""
+
+    @abstractmethod
+    async def delete(self, location: str) -> None:
+        """Удаляет файл; отсутствующий файл — не ошибка"""
+
+    @abstractmethod
+    @asynccontextmanager
+    async def local_copy(self, location: str) -> AsyncIterator[Path]:
+        """Путь к локальному файлу с содержимым location на время контекста"""
+        yield Path(location)
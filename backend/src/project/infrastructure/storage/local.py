@@ -0,0 +1,40 @@
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+import anyio
+
+from project.core.config import settings
+from project.core.uploads import move_into_place
+from project.infrastructure.storage.base import DocumentStorage
+
+
+class LocalStorage(DocumentStorage):
+    """Файлы в каталоге root (UPLOAD_DIR); location — путь к файлу"""
+
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+
+    def location(self, name: str) -> str:
+        return str(self.root / name)
+
+    def owns(self, location: str) -> bool:
+        return "://" not in location
+
+    async def save(self, source: Path, name: str, content_sha256: Optional[str] = None) -> str:
+        destination = self.root / name
+        await move_into_place(source, destination)
+        return str(destination)
+
+    async def read(self, location: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE_KB * 1024
+        async with await anyio.open_file(location, "rb") as buffer:
+            while chunk := await buffer.read(chunk_size):
+                yield chunk
+
+    async def delete(self, location: str) -> None:
+        await anyio.Path(location).unlink(missing_ok=True)
+
+    @asynccontextmanager
+    async def local_copy(self, location: str) -> AsyncIterator[Path]:
+        yield Path(location)
@@ -0,0 +1,140 @@
+import hashlib
+import hmac
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import quote, urlsplit
+
+import aiohttp
+import anyio
+from yarl import URL
+
+from project.core.config import settings
+from project.core.exceptions import StorageError
+from project.infrastructure.storage.base import DocumentStorage
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+EMPTY_PAYLOAD_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+def sign_v4(method: str, host: str, path: str, headers: Dict[str, str], payload_sha256: str,
+            access_key: str, secret_key: str, region: str, now: datetime) -> Dict[str, str]:
+    """Заголовки запроса к S3 с подписью AWS Signature V4 (path уже URL-кодирован, без query)"""
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    scope = f"{now:%Y%m%d}/{region}/s3/aws4_request"
+    headers = {**headers, "x-amz-content-sha256": payload_sha256, "x-amz-date": amz_date}
+
+    signed = {name.lower(): str(value).strip() for name, value in {**headers, "host": host}.items()}
+    signed_headers = ";".join(sorted(signed))
+    canonical_request = "\n".join([
+        method, path, "",
+        "".join(f"{name}:{signed[name]}\n" for name in sorted(signed)),
+        signed_headers, payload_sha256,
+    ])
+    string_to_sign = "\n".join([
+        "AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest(),
+    ])
+
+    signing_key = f"AWS4{secret_key}".encode()
+    for part in (f"{now:%Y%m%d}", region, "s3", "aws4_request"):
+        signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+    signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    headers["Authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={access_key}/{scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+    return headers
+
+
+class S3Storage(DocumentStorage):
+    """S3-совместимое хранилище (AWS S3, MinIO); location — s3://bucket/key.
+
+    Запросы подписываются AWS Signature V4, адресация path-style ({endpoint}/{bucket}/{key}),
+    поэтому работает и с MinIO без настройки DNS. Тела запросов и ответов идут потоком.
+    """
+
+    def __init__(self, endpoint_url: str, bucket: str, access_key: str, secret_key: str,
+                 region: str = "us-east-1", prefix: str = "", timeout: float = 300) -> None:
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.prefix = prefix
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+    def location(self, name: str) -> str:
+        return f"s3://{self.bucket}/{self.prefix}{name}"
+
+    def owns(self, location: str) -> bool:
+        return location.startswith(f"s3://{self.bucket}/")
+
+    def _key(self, location: str) -> str:
+        if not self.owns(location):
+            raise StorageError(location, f"файл не из бакета {self.bucket}")
+        return location[len(f"s3://{self.bucket}/"):]
+
+    def _signed(self, method: str, key: str, payload_sha256: str,
+                headers: Optional[Dict[str, str]] = None) -> tuple[URL, Dict[str, str]]:
+        """URL объекта и заголовки запроса с подписью"""
+        endpoint = urlsplit(self.endpoint_url)
+        path = f"{endpoint.path}/{quote(self.bucket)}/{quote(key, safe='/~')}"
+        headers = sign_v4(method, endpoint.netloc, path, headers or {}, payload_sha256,
+                          self.access_key, self.secret_key, self.region, datetime.now(timezone.utc))
+        return URL(f"{endpoint.scheme}://{endpoint.netloc}{path}", encoded=True), headers
+
+    @staticmethod
+    async def _raise_for_status(response: aiohttp.ClientResponse, location: str) -> None:
+        if response.status >= 300:
+            raise StorageError(location, f"HTTP {response.status}: {(await response.text())[:200]}")
+
+    async def save(self, source: Path, name: str, content_sha256: Optional[str] = None) -> str:
+        location = self.location(name)
+        size = (await anyio.Path(source).stat()).st_size
+        url, headers = self._signed("PUT", self._key(location), content_sha256 or UNSIGNED_PAYLOAD,
+                                    {"Content-Length": str(size)})
+
+        async def body() -> AsyncIterator[bytes]:
+            async with await anyio.open_file(source, "rb") as buffer:
+                while chunk := await buffer.read(settings.UPLOAD_CHUNK_SIZE_KB * 1024):
+                    yield chunk
+
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with session.put(url, data=body(), headers=headers) as response:
+                await self._raise_for_status(response, location)
+        await anyio.Path(source).unlink()
+        return location
+
+    async def read(self, location: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE_KB * 1024
+        url, headers = self._signed("GET", self._key(location), EMPTY_PAYLOAD_SHA256)
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with session.get(url, headers=headers) as response:
+                await self._raise_for_status(response, location)
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+
+    async def delete(self, location: str) -> None:
+        url, headers = self._signed("DELETE", self._key(location), EMPTY_PAYLOAD_SHA256)
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with session.delete(url, headers=headers) as response:
+                # S3 отвечает 204 и на удаление отсутствующего объекта
+                await self._raise_for_status(response, location)
+
+    @asynccontextmanager
+    async def local_copy(self, location: str) -> AsyncIterator[Path]:
+        # Расширение сохраняется: по нему парсер выбирает формат
+        fd, name = tempfile.mkstemp(suffix=Path(self._key(location)).suffix, dir=settings.STORAGE_SPOOL_DIR or None)
+        os.close(fd)
+        path = Path(name)
+        try:
+            async with await anyio.open_file(path, "wb") as buffer:
+                async for chunk in self.read(location):
+                    await buffer.write(chunk)
+            yield path
+        finally:
+            await anyio.Path(path).unlink(missing_ok=True)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
@@ -7,7 +8,7 @@ class CheckBase(BaseModel):
     document_id: int
     standart_id: int
     checked_at: datetime | None = None
-    result: str | None = None    # success / warnings / failed
+    result: dict[str, Any] | None = None  # отчёт проверки (JSONB)
     report_path: str | None = None
     score: int | None = None
 
@@ -20,3 +21,10 @@ class CheckSchema(CheckBase):
     check_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class CheckFilters(BaseModel):
+    checked_from: datetime | None = None
+    checked_to: datetime | None = None
+    score_min: int | None = None
+    score_max: int | None = None
@@ -15,6 +15,7 @@ class DocumentBase(BaseModel):
     report_pdf_path: str
     score: Decimal
     analysis_time: Decimal
+    content_sha256: Optional[str] = None
 
 class DocumentUpdate(BaseModel):
     filename: Optional[str] = None
@@ -28,6 +29,13 @@ class DocumentUpdate(BaseModel):
     analysis_time: Optional[Decimal] = None
     upload_datetime: Optional[datetime] = None
 
+class DocumentFilters(BaseModel):
+    doc_type: Optional[str] = None
+    uploaded_from: Optional[datetime] = None
+    uploaded_to: Optional[datetime] = None
+    score_min: Optional[Decimal] = None
+    score_max: Optional[Decimal] = None
+
 class DocumentCreate(DocumentBase):
     pass
 
@@ -51,4 +59,19 @@ class FileInfo(BaseModel):
     upload_time: float
     document_id: int
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# Возобновляемая загрузка по частям
+class UploadSessionCreate(BaseModel):
+    filename: str
+    size: int
+    doc_type: str = "document"
+    is_example: bool = False
+
+class UploadSessionSchema(BaseModel):
+    upload_id: str
+    filename: str
+    total_size: int
+    chunk_size: int
+    received_size: int
+    next_chunk: int
@@ -5,6 +5,7 @@ from decimal import Decimal
 
 class GostCheckRequest(BaseModel):
     document_id: int
+    force: bool = False  # только для администратора: не брать готовый отчёт по тому же содержимому
 
 class GostCheckResponse(BaseModel):
     check_id: int
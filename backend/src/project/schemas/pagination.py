@@ -0,0 +1,17 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from project.core.config import settings
+
+T = TypeVar("T")
+
+
+class PageQuery(BaseModel):
+    limit: int = Field(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX)
+    cursor: Optional[str] = None  # next_cursor предыдущей страницы
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None  # None — страница последняя
@@ -17,3 +17,8 @@ class ReportSchema(ReportBase):
     report_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ReportFilters(BaseModel):
+    created_from: datetime | None = None
+    created_to: datetime | None = None
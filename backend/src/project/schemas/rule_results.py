@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RuleStatsSchema(BaseModel):
+    rule_id: str
+    section: str | None = None
+    total: int          # результатов правила за период
+    failed: int
+    failed_documents: int
+    fail_rate: float
+
+
+class RuleFailureSchema(BaseModel):
+    check_id: int
+    document_id: int
+    rule_id: str
+    section: str | None = None
+    severity: str
+    expected_value: Any = None
+    actual_value: Any = None
+    checked_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,30 @@
+"""Отдельный процесс обработки очереди проверок ГОСТ: python -m project.worker
+
+API и воркеры масштабируются независимо; в API в этом случае стоит выключить
+CHECK_WORKER_IN_API, чтобы разбор документов не делил процесс с HTTP-запросами.
+"""
+import asyncio
+import signal
+
+from project.core.check_worker import CheckWorker
+from project.core.config import settings
+from project.gost_checker.engine import get_parsing_engine, shutdown_parsing_engine
+from project.infrastructure.postgres.database import get_engine
+
+
+async def run() -> None:
+    worker = CheckWorker(slots=settings.CHECK_WORKER_SLOTS)
+    loop = asyncio.get_running_loop()
+    # SIGTERM/SIGINT: новые задания не берём, начатые проверки доводим до конца
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+    get_parsing_engine()
+    try:
+        await worker.run()
+    finally:
+        shutdown_parsing_engine()
+        await get_engine().dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())